@@ -0,0 +1,78 @@
+"""Benchmark keyword categorization against the legacy per-row apply
+
+Usage:
+    python benchmarks/bench_categorize.py [--sizes 10000 1000000 10000000]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finance_engine import CATEGORY_MAPPING, KeywordCategorizer
+
+
+def legacy_categorize(descriptions: pd.Series) -> pd.Series:
+    """Original per-row implementation kept for comparison"""
+    def auto_categorize(description):
+        if pd.isna(description):
+            return 'other'
+        description_lower = str(description).lower()
+        for category, keywords in CATEGORY_MAPPING.items():
+            if any(keyword in description_lower for keyword in keywords):
+                return category
+        return 'other'
+    
+    return descriptions.apply(auto_categorize)
+
+
+def make_descriptions(n_rows: int, seed: int = 42) -> pd.Series:
+    """Random descriptions mixing known merchants with unmatched text"""
+    rng = np.random.default_rng(seed)
+    keywords = [keyword for keywords in CATEGORY_MAPPING.values() for keyword in keywords]
+    pool = [f"{keyword.title()} #{i % 97}" for i, keyword in enumerate(keywords * 4)]
+    pool += [f"Transfer Ref {i:05d}" for i in range(len(pool) // 4)]
+    return pd.Series(np.array(pool, dtype=object)[rng.integers(0, len(pool), n_rows)], name='Description')
+
+
+def time_call(func, *args) -> Tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--max-legacy-rows', type=int, default=1_000_000,
+                        help='Time the legacy apply on at most this many rows and extrapolate')
+    args = parser.parse_args()
+    
+    categorizer = KeywordCategorizer()
+    print(f"{'rows':>12} {'legacy (s)':>12} {'vectorized (s)':>15} {'speedup':>9}")
+    
+    for n_rows in args.sizes:
+        descriptions = make_descriptions(n_rows)
+        
+        legacy_rows = min(n_rows, args.max_legacy_rows)
+        legacy_time, legacy_result = time_call(legacy_categorize, descriptions.iloc[:legacy_rows])
+        estimated = legacy_rows < n_rows
+        if estimated:
+            legacy_time *= n_rows / legacy_rows
+        
+        vectorized_time, result = time_call(categorizer.categorize, descriptions)
+        assert (result.iloc[:legacy_rows].to_numpy() == legacy_result.to_numpy()).all(), 'category mismatch'
+        
+        legacy_label = f"{legacy_time:.3f}{'*' if estimated else ''}"
+        print(f"{n_rows:>12,} {legacy_label:>12} {vectorized_time:>15.3f} {legacy_time / vectorized_time:>8.1f}x")
+    
+    print("* extrapolated from --max-legacy-rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark Transactions tab filtering: boolean masks versus the filter index
+
+Usage:
+    python benchmarks/bench_filters.py [--sizes 10000 1000000 10000000] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finance_engine import CATEGORY_MAPPING, TransactionFilterIndex
+
+
+def make_transactions(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """Random categorized transactions with a skewed category mix"""
+    rng = np.random.default_rng(seed)
+    categories = list(CATEGORY_MAPPING) + ['other']
+    weights = rng.dirichlet(np.ones(len(categories)))
+    types = np.array(['expense', 'income', 'transfer'])
+    return pd.DataFrame({
+        'Amount': rng.normal(0, 400, n_rows).round(2),
+        'Type': pd.Categorical(types[rng.choice(3, n_rows, p=[0.8, 0.15, 0.05])]),
+        'Category': pd.Categorical(np.array(categories)[rng.choice(len(categories), n_rows, p=weights)]),
+    })
+
+
+def mask_filter(transactions: pd.DataFrame, categories, types, amount_range) -> np.ndarray:
+    """Original four-mask filter kept for comparison"""
+    return (
+        (transactions['Category'].isin(categories)) &
+        (transactions['Type'].isin(types)) &
+        (transactions['Amount'] >= amount_range[0]) &
+        (transactions['Amount'] <= amount_range[1])
+    ).to_numpy()
+
+
+def mean_time(func, repeat: int, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--repeat', type=int, default=20, help='Filter evaluations averaged per scenario')
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'scenario':>16} {'build (s)':>10} {'mask (ms)':>10} {'index (ms)':>11} {'speedup':>9}")
+
+    for n_rows in args.sizes:
+        transactions = make_transactions(n_rows)
+        build_start = time.perf_counter()
+        index = TransactionFilterIndex(transactions)
+        build_time = time.perf_counter() - build_start
+
+        categories = list(transactions['Category'].cat.categories)
+        types = list(transactions['Type'].cat.categories)
+        scenarios = {
+            'narrow amount': (categories, types, (-25.0, 25.0)),
+            'one category': (categories[:1], types, (-1e9, 1e9)),
+            'half categories': (categories[::2], ['expense'], (-500.0, 0.0)),
+            'slider drag': (categories, ['expense', 'income'], (-800.0, 800.0)),
+        }
+
+        for name, (selected_categories, selected_types, amount_range) in scenarios.items():
+            expected = mask_filter(transactions, selected_categories, selected_types, amount_range)
+            result = index.select(selected_categories, selected_types, amount_range)
+            assert ((np.ones(n_rows, dtype=bool) if result is None else result) == expected).all(), 'filter mismatch'
+
+            mask_time = mean_time(mask_filter, args.repeat, transactions, selected_categories, selected_types, amount_range)
+            index_time = mean_time(index.select, args.repeat, selected_categories, selected_types, amount_range)
+            print(f"{n_rows:>12,} {name:>16} {build_time:>10.3f} {mask_time * 1000:>10.2f} "
+                  f"{index_time * 1000:>11.2f} {mask_time / index_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
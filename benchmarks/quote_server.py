@@ -0,0 +1,113 @@
+"""Local HTTP stand-in for a quote service, for testing the HTTP price provider
+
+Usage:
+    python benchmarks/quote_server.py [--port 8765] [--latency-ms 50] [--strict]
+
+Serves GET /quotes?symbols=A,B as {"quotes": {"A": price, "B": price}}. Symbols
+with a sample price get it; others get a stable made-up price unless --strict.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finance_engine import MOCK_PRICES
+
+
+def quote_for(symbol: str, strict: bool = False) -> Optional[float]:
+    """Sample price, or a deterministic one derived from the symbol"""
+    if symbol in MOCK_PRICES:
+        return MOCK_PRICES[symbol]
+    if strict:
+        return None
+    return round(5 + zlib.crc32(symbol.encode()) % 50_000 / 100, 2)
+
+
+class QuoteServer:
+    """Quote service on a background thread, usable as a context manager"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0.0, strict: bool = False):
+        self.latency_ms = latency_ms
+        self.strict = strict
+        self.requests: List[List[str]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path != '/quotes':
+                    self.send_error(404)
+                    return
+
+                symbols = [s for s in parse_qs(parsed.query).get('symbols', [''])[0].split(',') if s]
+                with server._lock:
+                    server.requests.append(symbols)
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+
+                quotes: Dict[str, Optional[float]] = {s: quote_for(s, server.strict) for s in symbols}
+                body = json.dumps({'quotes': quotes}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> 'QuoteServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'QuoteServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Delay added to every response')
+    parser.add_argument('--strict', action='store_true', help='Only quote symbols with a sample price')
+    args = parser.parse_args()
+
+    server = QuoteServer(args.host, args.port, args.latency_ms, args.strict)
+    print(f"Serving quotes at {server.url}/quotes?symbols=AAPL,MSFT")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""Headless benchmarks of the dashboard engine on synthetic datasets
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 10000 1000000 10000000] [--json results.json]
+                                        [--baseline previous.json --tolerance 0.25]
+
+Each size runs in a fresh process so peak memory is reported per size. Generated
+ZIP files are kept in --data-dir and reused by later runs with the same seed.
+"""
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic
+from finance_engine import (
+    DescriptionSearchIndex, FinanceDashboard, MerchantCategoryStore, PriceHistoryStore, cost_basis, peak_rss_mb
+)
+
+# Stages that touch every transaction (or as many trades) and so report rows per second
+ROW_STAGES = ('load', 'categorize', 'aggregate_cube', 'monthly_summary', 'filter_index', 'search_index', 'cost_basis')
+
+
+def dataset_path(data_dir: str, n_rows: int, seed: int) -> str:
+    """Synthetic ZIP for this size, generated on first use"""
+    path = os.path.join(data_dir, f"synthetic_{n_rows}_{seed}.zip")
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        partial = f"{path}.partial"
+        synthetic.write_zip(synthetic.generate_dataset(n_rows, seed=seed), partial)
+        os.replace(partial, path)
+    return path
+
+
+def run_size(path: str) -> Dict:
+    """Time each engine stage on one dataset"""
+    timings = {}
+
+    def timed(name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[name] = time.perf_counter() - start
+        return result
+
+    dashboard = FinanceDashboard(merchant_store=MerchantCategoryStore(path=None))
+    if not timed('load', dashboard.load_from_zip, path):
+        raise RuntimeError(f"Failed to load {path}")
+    n_rows = len(dashboard.transactions_df)
+
+    # Load already categorized through the dashboard's merchant store, so an empty store times the matching
+    timed('categorize', MerchantCategoryStore(path=None).categorize, dashboard.transactions_df['Description'])
+    timed('aggregate_cube', dashboard.build_aggregate_cube)
+    timed('monthly_summary', dashboard.calculate_monthly_summary)
+    timed('category_totals', dashboard.calculate_category_totals)
+    index = timed('filter_index', dashboard.filter_index)
+    categories = sorted(dashboard.build_aggregate_cube()['Category'].unique())
+    timed('filter_query', index.select, categories[::2], ['expense'], (-500.0, 0.0))
+    search = timed('search_index', DescriptionSearchIndex, dashboard.transactions_df['Description'])
+    timed('search_query', search.search, 'star*')
+    timed('search_substring', search.search, 'bucks')
+    timed('sort_permutation', dashboard.sort_permutation, 'Amount')
+    timed('portfolio', dashboard.calculate_portfolio_value)
+    prices = synthetic.generate_price_history(dashboard.investments_df['Symbol'].unique())
+    with tempfile.TemporaryDirectory() as history_dir:
+        store = timed('price_history', PriceHistoryStore.build, prices, history_dir)
+        timed('portfolio_history', dashboard.portfolio_history, store)
+    timed('cost_basis', cost_basis, synthetic.generate_trades(n_rows), 'fifo')
+    timed('goals', dashboard.calculate_goal_progress)
+    
+    # Re-uploading a statement that is already loaded, the common monthly-append mistake
+    statement = dashboard.transactions_df.head(1000)[['Date', 'Description', 'Amount', 'Type']].to_csv(index=False)
+    timed('append_duplicates', dashboard.copy().append_files, {'transactions': io.StringIO(statement)})
+
+    return {
+        'rows': n_rows,
+        'seconds': timings,
+        'load_breakdown': dashboard.load_timings,
+        'frame_mb': round(dashboard.memory_usage() / 1e6, 1),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def compare(results: List[Dict], baseline: List[Dict], tolerance: float, floor: float = 0.01) -> List[str]:
+    """Stages slower than the baseline by more than the tolerance"""
+    previous = {result['rows']: result['seconds'] for result in baseline}
+    regressions = []
+    for result in results:
+        for stage, seconds in result['seconds'].items():
+            before = previous.get(result['rows'], {}).get(stage)
+            if before is not None and seconds > floor and seconds > before * (1 + tolerance):
+                regressions.append(f"{result['rows']:,} rows {stage}: {before:.3f}s -> {seconds:.3f}s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'fpti-benchmarks'))
+    parser.add_argument('--json', help='Write the results to this file')
+    parser.add_argument('--baseline', help='Results file from an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown before a stage counts as a regression')
+    args = parser.parse_args()
+
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for n_rows in args.sizes:
+        path = dataset_path(args.data_dir, n_rows, args.seed)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(run_size, path).result()
+        results.append(result)
+
+        print(f"\n{result['rows']:,} rows: frames {result['frame_mb']:,.1f} MB, peak RSS {result['peak_rss_mb'] or 0:,.0f} MB")
+        print(f"{'stage':>18} {'seconds':>10} {'rows/s':>14}")
+        for stage, seconds in result['seconds'].items():
+            rate = f"{result['rows'] / seconds:,.0f}" if stage in ROW_STAGES and seconds > 0 else ''
+            print(f"{stage:>18} {seconds:>10.3f} {rate:>14}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""Synthetic financial datasets at production scale for benchmarks
+
+Usage:
+    python benchmarks/synthetic.py --rows 1000000 --out synthetic_1m.zip [--years 10] [--seed 42]
+"""
+import argparse
+import io
+import os
+import sys
+import zipfile
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finance_engine import CATEGORY_MAPPING, MOCK_PRICES
+
+# Share of transactions, typical amount and type per category
+CATEGORY_PROFILES = {
+    'grocery': (0.19, 85.0, 'expense'),
+    'dining': (0.21, 24.0, 'expense'),
+    'transportation': (0.13, 42.0, 'expense'),
+    'utilities': (0.05, 115.0, 'expense'),
+    'entertainment': (0.07, 28.0, 'expense'),
+    'healthcare': (0.04, 60.0, 'expense'),
+    'shopping': (0.15, 70.0, 'expense'),
+    'salary': (0.04, 2900.0, 'income'),
+    'investment': (0.02, 140.0, 'income'),
+    'other': (0.10, 55.0, 'expense'),
+}
+
+# Merchants that match no keyword, so some rows fall through to 'other'
+UNMATCHED_MERCHANTS = ['Venmo Transfer', 'Zelle Payment', 'ATM Withdrawal', 'Check Deposit', 'Wire Out', 'Paypal Purchase']
+
+GOAL_NAMES = ['Emergency Fund', 'House Down Payment', 'Retirement Fund', 'Vacation Fund', 'New Car', 'College Savings']
+
+STORES_PER_MERCHANT = 400
+
+
+def generate_transactions(n_rows: int, years: int = 10, seed: int = 42, end: str = '2024-12-31') -> pd.DataFrame:
+    """Transactions with merchant names drawn from the category keywords over several years"""
+    rng = np.random.default_rng(seed)
+    categories = list(CATEGORY_PROFILES)
+    weights = np.array([CATEGORY_PROFILES[category][0] for category in categories])
+    merchants = [CATEGORY_MAPPING.get(category, UNMATCHED_MERCHANTS) for category in categories]
+    counts = np.array([len(keywords) for keywords in merchants])
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    # Keywords shared by two categories map to one merchant
+    names = list(dict.fromkeys(keyword.title() for keywords in merchants for keyword in keywords))
+    merchant_codes = np.array([names.index(keyword.title()) for keywords in merchants for keyword in keywords])
+
+    category = rng.choice(len(categories), n_rows, p=weights / weights.sum())
+    merchant = merchant_codes[offsets[category] + (rng.random(n_rows) * counts[category]).astype(np.int64)]
+    store = rng.integers(0, STORES_PER_MERCHANT, n_rows)
+
+    # Descriptions are codes into every merchant/store combination, so no per-row string building
+    descriptions = [f"{name} #{store_number:04d}" for name in names for store_number in range(STORES_PER_MERCHANT)]
+    description = pd.Categorical.from_codes(merchant * STORES_PER_MERCHANT + store, descriptions)
+
+    typical = np.array([CATEGORY_PROFILES[name][1] for name in categories])[category]
+    is_income = np.array([CATEGORY_PROFILES[name][2] == 'income' for name in categories])[category]
+    spread = np.where(is_income, 0.15, 0.7)
+    amounts = np.round(typical * rng.lognormal(-spread ** 2 / 2, spread), 2)
+
+    end_date = pd.Timestamp(end)
+    start_date = end_date - pd.DateOffset(years=years) + pd.Timedelta(days=1)
+    days = (end_date - start_date).days + 1
+    dates = start_date + pd.to_timedelta(np.sort(rng.integers(0, days, n_rows)), unit='D')
+
+    return pd.DataFrame({
+        'Date': dates,
+        'Description': description,
+        'Amount': np.where(is_income, amounts, -amounts),
+        'Type': np.where(is_income, 'income', 'expense'),
+    })
+
+
+def generate_net_worth(years: int = 10, seed: int = 42, end: str = '2024-12-31') -> pd.DataFrame:
+    """Month-end assets and liabilities with steady growth and noise"""
+    rng = np.random.default_rng(seed + 1)
+    dates = pd.date_range(end=end, periods=years * 12, freq='ME')
+    growth = np.cumprod(1 + rng.normal(0.006, 0.02, len(dates)))
+    paydown = np.cumprod(1 - np.clip(rng.normal(0.004, 0.003, len(dates)), 0, None))
+    return pd.DataFrame({
+        'Date': dates,
+        'Assets': np.round(60_000 * growth, 2),
+        'Liabilities': np.round(45_000 * paydown, 2),
+    })
+
+
+def generate_investments(n_positions: int, years: int = 10, seed: int = 42, end: str = '2024-12-31') -> pd.DataFrame:
+    """Lots of the symbols the dashboard can price"""
+    rng = np.random.default_rng(seed + 2)
+    prices = MOCK_PRICES
+    symbols = np.array(list(prices))
+    symbol = symbols[rng.integers(0, len(symbols), n_positions)]
+    current = np.array([prices[s] for s in symbol])
+    end_date = pd.Timestamp(end)
+    purchase_dates = end_date - pd.to_timedelta(rng.integers(0, years * 365, n_positions), unit='D')
+    return pd.DataFrame({
+        'Symbol': symbol,
+        'Name': [f"{s} Holding" for s in symbol],
+        'Shares': rng.integers(1, 200, n_positions).astype(float),
+        'Purchase_Price': np.round(current * rng.uniform(0.5, 1.2, n_positions), 2),
+        'Purchase_Date': purchase_dates,
+    })
+
+
+def generate_trades(n_trades: int, n_symbols: int = 500, years: int = 10, seed: int = 42,
+                    end: str = '2024-12-31') -> pd.DataFrame:
+    """Brokerage trade log where about a third of the trades are sells"""
+    rng = np.random.default_rng(seed + 5)
+    symbols = list(MOCK_PRICES) + [f"SYN{i:04d}" for i in range(max(0, n_symbols - len(MOCK_PRICES)))]
+    end_date = pd.Timestamp(end)
+    dates = end_date - pd.to_timedelta(rng.integers(0, years * 365, n_trades), unit='D')
+    side = np.where(rng.random(n_trades) < 0.35, -1, 1)
+    return pd.DataFrame({
+        'Date': dates,
+        'Symbol': pd.Categorical.from_codes(rng.integers(0, n_symbols, n_trades), symbols[:n_symbols]),
+        'Shares': side * rng.integers(1, 100, n_trades).astype(float),
+        'Price': np.round(rng.uniform(10, 500, n_trades), 2),
+    })
+
+
+def generate_price_history(symbols, years: int = 10, seed: int = 42, end: str = '2024-12-31') -> pd.DataFrame:
+    """Business-day closes as random walks ending at each symbol's current price"""
+    rng = np.random.default_rng(seed + 4)
+    dates = pd.bdate_range(end=end, periods=years * 261)
+    symbols = list(symbols)
+    current = np.array([MOCK_PRICES.get(s, 20 + 480 * rng.random()) for s in symbols])
+    returns = rng.normal(0.0003, 0.015, (len(dates), len(symbols)))
+    # Walk back from today's price so the latest close matches the quote
+    closes = current * np.exp(returns[::-1].cumsum(axis=0)[::-1] - returns[-1])
+    return pd.DataFrame({
+        'Date': np.repeat(dates.to_numpy(), len(symbols)),
+        'Symbol': np.tile(symbols, len(dates)),
+        'Close': np.round(closes.ravel(), 2),
+    })
+
+
+def generate_goals(n_goals: int, seed: int = 42, end: str = '2024-12-31') -> pd.DataFrame:
+    """Savings goals at different stages of completion"""
+    rng = np.random.default_rng(seed + 3)
+    targets = np.round(rng.choice([8_000, 25_000, 80_000, 250_000, 1_000_000], n_goals), 2)
+    return pd.DataFrame({
+        'Goal_Name': [f"{GOAL_NAMES[i % len(GOAL_NAMES)]} {i // len(GOAL_NAMES) + 1}" for i in range(n_goals)],
+        'Target_Amount': targets,
+        'Current_Amount': np.round(targets * rng.uniform(0.05, 0.9, n_goals), 2),
+        'Target_Date': pd.Timestamp(end) + pd.to_timedelta(rng.integers(180, 30 * 365, n_goals), unit='D'),
+    })
+
+
+def generate_dataset(n_rows: int, years: int = 10, seed: int = 42) -> Dict[str, pd.DataFrame]:
+    """All four input tables sized for n_rows transactions"""
+    return {
+        'transactions': generate_transactions(n_rows, years, seed),
+        'net_worth': generate_net_worth(years, seed),
+        'investments': generate_investments(max(20, n_rows // 10_000), years, seed),
+        'goals': generate_goals(max(4, n_rows // 100_000), seed),
+    }
+
+
+def write_zip(frames: Dict[str, pd.DataFrame], target) -> None:
+    """Write the tables as the CSV ZIP the dashboard uploads"""
+    with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for name, df in frames.items():
+            # Stream each CSV into the archive instead of building it in memory
+            with zip_file.open(f"{name}.csv", 'w') as member, io.TextIOWrapper(member, encoding='utf-8', newline='') as text:
+                df.to_csv(text, index=False, date_format='%Y-%m-%d', float_format='%.2f')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', required=True, help='Path of the ZIP file to write')
+    parser.add_argument('--price-history', help='Also write daily closes for the held symbols to this CSV')
+    args = parser.parse_args()
+
+    dataset = generate_dataset(args.rows, args.years, args.seed)
+    write_zip(dataset, args.out)
+    print(f"Wrote {args.rows:,} transactions to {args.out}")
+
+    if args.price_history:
+        symbols = dataset['investments']['Symbol'].unique()
+        generate_price_history(symbols, args.years, args.seed).to_csv(args.price_history, index=False, date_format='%Y-%m-%d')
+        print(f"Wrote price history for {len(symbols)} symbols to {args.price_history}")
+
+
+if __name__ == '__main__':
+    main()
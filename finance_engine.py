@@ -0,0 +1,2262 @@
+"""Data engine behind the personal finance dashboard, importable without Streamlit"""
+import pandas as pd
+import numpy as np
+from pandas.api.types import union_categoricals
+from datetime import date, datetime
+from dataclasses import dataclass, field
+import zipfile
+import io
+import os
+import sys
+import time
+import tempfile
+import re
+import json
+import hashlib
+import threading
+import multiprocessing
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+try:
+    import pyarrow as pa
+except ImportError:  # Columnar snapshots are optional
+    pa = None
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+ARROW_AVAILABLE = pa is not None
+
+# Keyword mapping for auto-categorization (earlier categories win)
+CATEGORY_MAPPING = {
+    'grocery': ['grocery', 'supermarket', 'food', 'walmart', 'target', 'kroger', 'safeway', 'publix', 
+               'whole foods', 'trader joe', 'costco', 'fresh market', 'harris teeter', 'wegmans', 'sprouts'],
+    'dining': ['restaurant', 'cafe', 'pizza', 'starbucks', 'mcdonald', 'subway', 'chipotle', 'taco bell',
+              'burger', 'kfc', 'dunkin', 'panera', 'olive garden', 'red lobster', 'five guys', 'domino'],
+    'transportation': ['gas station', 'uber', 'lyft', 'metro', 'parking', 'taxi', 'bus', 'train', 'fuel',
+                     'shell', 'exxon', 'bp', 'chevron', 'marathon', 'texaco', 'mobil', 'airport'],
+    'utilities': ['electric', 'gas', 'water', 'internet', 'phone', 'cable', 'insurance', 'utility',
+                 'verizon', 'at&t', 'comcast', 'spectrum'],
+    'entertainment': ['movie', 'netflix', 'spotify', 'amazon prime', 'hulu', 'disney', 'hbo', 'theater',
+                    'concert', 'game', 'youtube', 'paramount', 'apple music', 'steam'],
+    'healthcare': ['hospital', 'pharmacy', 'doctor', 'medical', 'dentist', 'cvs', 'walgreens', 'clinic',
+                  'urgent care', 'prescription'],
+    'shopping': ['amazon', 'ebay', 'mall', 'clothing', 'electronics', 'best buy', 'apple store', 'nike',
+                'adidas', 'macy', 'target', 'home depot', 'rei', 'gamestop'],
+    'salary': ['salary', 'paycheck', 'wages', 'income', 'bonus', 'freelance', 'consulting'],
+    'investment': ['dividend', 'interest', 'capital gains', 'stock', 'bond', 'mutual fund', 'reit']
+}
+
+class KeywordCategorizer:
+    """Vectorized keyword matcher over transaction descriptions"""
+    
+    def __init__(self, category_mapping: Dict[str, List[str]] = CATEGORY_MAPPING, default: str = 'other'):
+        self.default = default
+        self.categories = list(category_mapping)
+        self.fingerprint = hashlib.sha256(
+            json.dumps([default, category_mapping]).encode('utf-8')
+        ).hexdigest()
+        # One compiled alternation per category, tried in mapping order
+        self.patterns = [
+            re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+            for keywords in category_mapping.values()
+        ]
+    
+    def categorize(self, descriptions: pd.Series) -> pd.Series:
+        """Return the first matching category for each description"""
+        result = np.full(len(descriptions), self.default, dtype=object)
+        unresolved = descriptions.notna().to_numpy(dtype=bool, copy=True)
+        lowered = descriptions.astype(str).str.lower()
+        
+        for category, pattern in zip(self.categories, self.patterns):
+            positions = np.flatnonzero(unresolved)
+            if len(positions) == 0:
+                break
+            hits = positions[lowered.iloc[positions].str.contains(pattern).to_numpy(dtype=bool)]
+            result[hits] = category
+            unresolved[hits] = False
+        
+        return pd.Series(result, index=descriptions.index, name='Category')
+
+# Opt-in location of the learned merchant -> category table
+MERCHANT_STORE_PATH = os.path.join(os.path.expanduser('~'), '.finance_dashboard', 'merchant_categories.json')
+
+class MerchantCategoryStore:
+    """Learned merchant -> category table in front of the keyword matcher"""
+    
+    def __init__(self, path: Optional[str] = None, categorizer: Optional[KeywordCategorizer] = None):
+        self.path = path
+        self.categorizer = categorizer if categorizer is not None else KeywordCategorizer()
+        self.merchants: Dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        
+        if self.path and os.path.exists(self.path):
+            self.load()
+    
+    def __len__(self) -> int:
+        return len(self.merchants)
+    
+    def load(self):
+        """Read the saved table, ignoring it if the keyword mapping has changed"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if saved.get('fingerprint') == self.categorizer.fingerprint:
+            self.merchants = dict(saved.get('merchants', {}))
+    
+    def save(self):
+        """Write newly learned merchants to the local file"""
+        if not self.path or not self._dirty:
+            return
+        
+        with self._lock:
+            write_json_atomic(self.path, {'fingerprint': self.categorizer.fingerprint, 'merchants': self.merchants})
+            self._dirty = False
+    
+    def categorize(self, descriptions: pd.Series) -> pd.Series:
+        """Categorize each unique description once and map the results back to rows"""
+        codes, uniques = pd.factorize(descriptions)
+        keys = pd.Index(uniques).astype(str).str.lower()
+        
+        # Known merchants are a dictionary lookup, only new ones reach the matcher; other sessions
+        # share the store, so the lookup reads a copy taken under the lock
+        with self._lock:
+            merchants = dict(self.merchants)
+        unique_categories = keys.map(merchants).to_numpy(dtype=object, na_value=None)
+        unknown = np.flatnonzero(pd.isna(unique_categories))
+        
+        if len(unknown) > 0:
+            matched = self.categorizer.categorize(pd.Series(uniques[unknown])).to_numpy()
+            unique_categories[unknown] = matched
+            with self._lock:
+                self.merchants.update(zip(keys[unknown], matched))
+                self._dirty = True
+        
+        result = np.append(unique_categories, self.categorizer.default).take(codes)
+        return pd.Series(result, index=descriptions.index, name='Category')
+
+# Columnar snapshot layout
+SNAPSHOT_FORMAT = 'fpti-snapshot'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_MANIFEST = 'manifest.json'
+
+def frame_to_arrow_bytes(df: pd.DataFrame) -> bytes:
+    """Encode a frame as an uncompressed Arrow IPC file"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def arrow_source_to_frame(source) -> pd.DataFrame:
+    """Decode an Arrow IPC file, sharing column buffers where the types allow"""
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+# Declared column types per input file (missing optional columns are ignored)
+CSV_SCHEMAS = {
+    'transactions': {
+        'dtypes': {'Description': 'category', 'Amount': 'float64', 'Type': 'category', 'Category': 'category'},
+        'dates': ['Date']
+    },
+    'net_worth': {
+        'dtypes': {'Assets': 'float64', 'Liabilities': 'float64'},
+        'dates': ['Date']
+    },
+    'investments': {
+        'dtypes': {'Shares': 'float64', 'Purchase_Price': 'float64'},
+        'dates': ['Purchase_Date']
+    },
+    'goals': {
+        'dtypes': {'Target_Amount': 'float64', 'Current_Amount': 'float64'},
+        'dates': ['Target_Date']
+    },
+    'trades': {
+        'dtypes': {'Symbol': 'category', 'Shares': 'float64', 'Price': 'float64'},
+        'dates': ['Date']
+    },
+    'price_history': {
+        'dtypes': {'Symbol': 'category', 'Close': 'float64'},
+        'dates': ['Date']
+    }
+}
+
+# Input file names (matched case insensitively) and the frames they load
+INPUT_FILES = {
+    'transactions.csv': 'transactions',
+    'net_worth.csv': 'net_worth',
+    'investments.csv': 'investments',
+    'goals.csv': 'goals',
+    'trades.csv': 'trades'
+}
+
+# Supported storage types for transaction amounts
+AMOUNT_DTYPES = ('float64', 'float32')
+
+# Expected date format, other formats fall back to inference
+DATE_FORMAT = '%Y-%m-%d'
+
+def schema_dtypes(name: str, amount_dtype: str = 'float64', categoricals: bool = True) -> Dict[str, str]:
+    """Column dtypes to pass to read_csv for one of the input files"""
+    dtypes = dict(CSV_SCHEMAS[name]['dtypes'])
+    if 'Amount' in dtypes:
+        dtypes['Amount'] = amount_dtype
+    if not categoricals:
+        dtypes = {column: dtype for column, dtype in dtypes.items() if dtype != 'category'}
+    return dtypes
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """Parse dates with the expected format, inferring it only when that fails"""
+    try:
+        return pd.to_datetime(values, format=DATE_FORMAT)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values)
+
+def apply_schema(df: pd.DataFrame, name: str, amount_dtype: str = 'float64') -> pd.DataFrame:
+    """Cast a parsed frame to its declared schema and derive the Month period"""
+    dtypes = {column: dtype for column, dtype in schema_dtypes(name, amount_dtype).items() if column in df.columns}
+    df = df.astype(dtypes)
+    for column in CSV_SCHEMAS[name]['dates']:
+        if column in df.columns:
+            df[column] = parse_dates(df[column])
+    if name == 'transactions':
+        df['Month'] = df['Date'].dt.to_period('M')
+    return df
+
+def read_csv_with_schema(source, name: str, amount_dtype: str = 'float64') -> pd.DataFrame:
+    """Read one input file with its declared dtypes applied by the parser"""
+    df = pd.read_csv(source, dtype=schema_dtypes(name, amount_dtype))
+    return apply_schema(df, name, amount_dtype)
+
+def estimate_default_bytes(df: pd.DataFrame) -> int:
+    """Approximate size of a frame loaded without a schema (object strings, float64)"""
+    total = int(df.index.memory_usage())
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+            sizes = np.array([sys.getsizeof(value) for value in series.cat.categories], dtype=np.int64)
+            total += 8 * len(series) + int(counts @ sizes)
+        elif series.dtype == np.float32:
+            total += 8 * len(series)
+        else:
+            total += int(series.memory_usage(index=False, deep=True))
+    return total
+
+def estimate_nbytes(value, seen: Optional[set] = None) -> int:
+    """Approximate memory held by frames, arrays and containers of them, counting shared buffers once"""
+    seen = set() if seen is None else seen
+    if value is None or isinstance(value, (bool, int, float, np.generic)) or id(value) in seen:
+        return 0
+    seen.add(id(value))
+    
+    if isinstance(value, np.ndarray):
+        # Views and shallow frame copies share their root buffer
+        root = value
+        while isinstance(root.base, np.ndarray):
+            root = root.base
+        if root is not value and id(root) in seen:
+            return 0
+        seen.add(id(root))
+        if root.dtype == object:
+            return int(pd.Series(root.ravel(), copy=False).memory_usage(index=False, deep=True))
+        return int(root.nbytes)
+    if isinstance(value, pd.DataFrame):
+        return estimate_nbytes(value.index, seen) + sum(estimate_nbytes(series, seen) for _, series in value.items())
+    if isinstance(value, pd.Series):
+        if isinstance(value.dtype, np.dtype):
+            return estimate_nbytes(value.to_numpy(), seen)
+        if isinstance(value.dtype, pd.CategoricalDtype):
+            return estimate_nbytes(value.array.codes, seen) + estimate_nbytes(value.cat.categories, seen)
+        return int(value.memory_usage(index=False, deep=True))
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(item, seen) for item in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return sum(estimate_nbytes(item, seen) for item in value)
+    if hasattr(value, '__dict__'):
+        # Indexes and result objects are measured through their attributes
+        return estimate_nbytes(vars(value), seen)
+    return sys.getsizeof(value)
+
+# Rows per chunk for streaming ingest
+STREAM_CHUNK_ROWS = 250_000
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+
+def current_rss_mb() -> Optional[float]:
+    """Current resident set size of this process in MB where /proc is available"""
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 1)
+
+def max_rss(peak: Optional[float], sample: Optional[float]) -> Optional[float]:
+    """Larger of two memory samples, either of which may be unavailable"""
+    return sample if peak is None else peak if sample is None else max(peak, sample)
+
+# Environment variable naming a JSON-lines file that receives one profile per rerun
+PERF_LOG_ENV = 'FPTI_PERF_LOG'
+
+class PerfRecorder:
+    """Named stage timings, memory and frame sizes for one rerun"""
+    
+    def __init__(self, enabled: bool = False, log_path: Optional[str] = None):
+        self.enabled = enabled
+        self.log_path = log_path
+        self.timestamp = time.time()
+        self.started = time.perf_counter()
+        self.stages = []
+        self.counters = {}
+        self.frames = {}
+        self._stack = []
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block, nesting its name under any enclosing stage"""
+        if not self.enabled:
+            yield
+            return
+        
+        self._stack.append(name)
+        path = '/'.join(self._stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self.stages.append({
+                'stage': path,
+                'start_ms': round((start - self.started) * 1000, 2),
+                'ms': round((time.perf_counter() - start) * 1000, 2),
+                'rss_mb': current_rss_mb()
+            })
+    
+    def count(self, name: str, amount: int = 1):
+        """Add to a named counter such as cache hits or payload bytes"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def record_frames(self, sizes: Dict[str, Tuple[int, int]]):
+        """Row counts and bytes of the loaded frames"""
+        if self.enabled:
+            self.frames = {name: {'rows': rows, 'bytes': size} for name, (rows, size) in sizes.items()}
+    
+    def report(self) -> Dict:
+        """Everything recorded so far as a JSON-serializable dict"""
+        return {
+            'timestamp': self.timestamp,
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 2),
+            'peak_rss_mb': peak_rss_mb(),
+            'rss_mb': current_rss_mb(),
+            'stages': sorted(self.stages, key=lambda stage: stage['start_ms']),
+            'counters': self.counters,
+            'frames': self.frames
+        }
+    
+    def write_log(self) -> Optional[Dict]:
+        """Append the report to the JSON-lines log, if one is configured"""
+        if not self.enabled:
+            return None
+        
+        report = self.report()
+        if self.log_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.log_path)), exist_ok=True)
+            with open(self.log_path, 'a') as log:
+                log.write(json.dumps(report) + '\n')
+        return report
+
+_perf_state = threading.local()
+
+def current_perf() -> PerfRecorder:
+    """Recorder for the rerun running on this thread (disabled when none was started)"""
+    recorder = getattr(_perf_state, 'recorder', None)
+    return recorder if recorder is not None else PerfRecorder()
+
+def start_perf(enabled: bool, log_path: Optional[str] = None) -> PerfRecorder:
+    """Begin recording a rerun on this thread"""
+    _perf_state.recorder = PerfRecorder(enabled=enabled, log_path=log_path)
+    return _perf_state.recorder
+
+def summarize_monthly_totals(monthly_totals: pd.Series) -> pd.DataFrame:
+    """Shape (Month, Type) amount totals into the monthly summary table"""
+    monthly_summary = monthly_totals.unstack(fill_value=0).round(2)
+    
+    monthly_summary.columns = [str(column) for column in monthly_summary.columns]
+    monthly_summary = monthly_summary.reset_index()
+    
+    # Ensure both income and expense columns exist
+    if 'income' not in monthly_summary.columns:
+        monthly_summary['income'] = 0
+    if 'expense' not in monthly_summary.columns:
+        monthly_summary['expense'] = 0
+    
+    monthly_summary['net_cash_flow'] = monthly_summary['income'] + monthly_summary['expense']
+    monthly_summary['Month_str'] = monthly_summary['Month'].astype(str)
+    
+    return monthly_summary
+
+# Grouping keys of the aggregate cube
+CUBE_KEYS = ['Date', 'Type', 'Category']
+
+def aggregate_cube(transactions: pd.DataFrame) -> pd.DataFrame:
+    """Collapse categorized transactions to daily sums and counts per type and category"""
+    cube = transactions.groupby(
+        [transactions['Date'].dt.normalize(), 'Type', 'Category'], observed=True
+    )['Amount'].agg(['sum', 'count'])
+    cube = cube.rename(columns={'sum': 'Amount', 'count': 'Count'}).reset_index()
+    cube['Month'] = cube['Date'].dt.to_period('M')
+    return cube
+
+def merge_cubes(cubes: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine partial cubes, e.g. one per ingest chunk, into a single cube"""
+    cube = pd.concat(cubes, ignore_index=True).groupby(CUBE_KEYS, observed=True)[['Amount', 'Count']].sum().reset_index()
+    cube['Month'] = cube['Date'].dt.to_period('M')
+    return cube
+
+def filter_cube(cube: pd.DataFrame, categories: Optional[List] = None, types: Optional[List] = None) -> pd.DataFrame:
+    """Restrict the cube to the selected categories and types"""
+    mask = np.ones(len(cube), dtype=bool)
+    if categories is not None:
+        mask &= cube['Category'].isin(categories).to_numpy()
+    if types is not None:
+        mask &= cube['Type'].isin(types).to_numpy()
+    return cube[mask]
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Positions kept by Largest-Triangle-Three-Buckets downsampling"""
+    n_points = len(y)
+    if n_out >= n_points or n_out < 3:
+        return np.arange(n_points)
+    
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    edges = np.linspace(1, n_points - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n_points - 1
+    
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else n_points
+        next_x = x[stop:next_stop].mean()
+        next_y = y[stop:next_stop].mean()
+        # Keep the point forming the largest triangle with the last kept point and the next bucket's mean
+        area = np.abs((x[previous] - next_x) * (y[start:stop] - y[previous]) -
+                      (x[previous] - x[start:stop]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+def downsample_frame(df: pd.DataFrame, x_column: Optional[str], y_columns: List[str], max_points: int) -> pd.DataFrame:
+    """Rows kept when each y column is downsampled to at most max_points"""
+    if len(df) <= max_points:
+        return df
+    
+    if x_column is None:
+        x = np.arange(len(df))
+    elif pd.api.types.is_datetime64_any_dtype(df[x_column]):
+        x = df[x_column].to_numpy().astype('datetime64[ns]').astype(np.int64)
+    else:
+        x = df[x_column].to_numpy(dtype='float64')
+    
+    keep = np.unique(np.concatenate([
+        lttb_indices(x, df[column].to_numpy(dtype='float64', na_value=0.0), max_points) for column in y_columns
+    ]))
+    return df.iloc[keep]
+
+def sort_key(values: pd.Series) -> np.ndarray:
+    """Array whose ascending order matches the natural order of the column"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Rank categories lexically so the order does not depend on when they were first seen
+        ranks = np.argsort(np.argsort(values.cat.categories.astype(str)))
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes >= 0, ranks[codes], len(ranks))
+    return values.to_numpy()
+
+def page_positions(permutation: np.ndarray, mask: Optional[np.ndarray], page: int, page_size: int,
+                   ascending: bool = True) -> Tuple[np.ndarray, int]:
+    """Row positions of one page of a filtered, sorted view and the total row count"""
+    ordered = permutation if ascending else permutation[::-1]
+    if mask is not None:
+        ordered = ordered[mask[ordered]]
+    start = page * page_size
+    return ordered[start:start + page_size], len(ordered)
+
+class TransactionFilterIndex:
+    """Posting lists per category and type plus an amount-sorted position array"""
+    
+    def __init__(self, transactions: pd.DataFrame):
+        self.row_count = len(transactions)
+        self.codes = {}
+        self.values = {}
+        self.postings = {}
+        for column in ('Category', 'Type'):
+            codes, uniques = pd.factorize(transactions[column], use_na_sentinel=False)
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            self.codes[column] = codes
+            self.values[column] = {value: code for code, value in enumerate(uniques)}
+            self.postings[column] = [order[bounds[i]:bounds[i + 1]] for i in range(len(uniques))]
+        
+        self.amounts = transactions['Amount'].to_numpy(dtype='float64')
+        self.amount_order = np.argsort(self.amounts, kind='stable')
+        self.sorted_amounts = self.amounts[self.amount_order]
+    
+    def _allowed(self, column: str, selected) -> Optional[np.ndarray]:
+        """Lookup table of selected codes, or None when every value is selected"""
+        allowed = np.zeros(len(self.postings[column]), dtype=bool)
+        for value in selected:
+            code = self.values[column].get(value)
+            if code is not None:
+                allowed[code] = True
+        return None if allowed.all() else allowed
+    
+    def select(self, categories, types, amount_range: Tuple[float, float]) -> Optional[np.ndarray]:
+        """Boolean row mask for the filters, or None when nothing is filtered out"""
+        allowed = {'Category': self._allowed('Category', categories), 'Type': self._allowed('Type', types)}
+        start = np.searchsorted(self.sorted_amounts, amount_range[0], side='left')
+        stop = np.searchsorted(self.sorted_amounts, amount_range[1], side='right')
+        
+        if all(table is None for table in allowed.values()) and start == 0 and stop == self.row_count:
+            return None
+        
+        # Drive from the smallest candidate set and check the other filters by lookup
+        sizes = {'Amount': stop - start}
+        for column, table in allowed.items():
+            if table is not None:
+                sizes[column] = sum(len(self.postings[column][code]) for code in np.flatnonzero(table))
+        driver = min(sizes, key=sizes.get)
+        
+        if driver == 'Amount':
+            candidates = self.amount_order[start:stop]
+        else:
+            postings = [self.postings[driver][code] for code in np.flatnonzero(allowed[driver])]
+            candidates = np.concatenate(postings) if postings else np.empty(0, dtype=np.intp)
+            allowed[driver] = None
+            if start > 0 or stop < self.row_count:
+                candidate_amounts = self.amounts[candidates]
+                candidates = candidates[(candidate_amounts >= amount_range[0]) & (candidate_amounts <= amount_range[1])]
+        
+        for column, table in allowed.items():
+            if table is not None:
+                candidates = candidates[table[self.codes[column][candidates]]]
+        
+        mask = np.zeros(self.row_count, dtype=bool)
+        mask[candidates] = True
+        return mask
+
+SEARCH_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Byte values of the letters and digits that make up description words
+SEARCH_WORD_BYTES = np.zeros(256, dtype=bool)
+SEARCH_WORD_BYTES[np.frombuffer(b'abcdefghijklmnopqrstuvwxyz0123456789', dtype=np.uint8)] = True
+
+# Trigram symbol per byte: word letters and digits are 1-36, 0 marks the start (or short end) of a word
+SEARCH_GRAM_SYMBOLS = np.zeros(256, dtype=np.int64)
+SEARCH_GRAM_SYMBOLS[SEARCH_WORD_BYTES] = np.arange(1, 37)
+SEARCH_GRAM_BASE = 37
+
+def utf8_buffer(texts: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """UTF-8 bytes of the strings laid end to end and the offset of each one, plus the end"""
+    if pa is not None:
+        # Arrow-backed strings already are such a buffer
+        array = pa.array(texts, type=pa.large_string())
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks()
+        offsets = np.frombuffer(array.buffers()[1], dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+        data_buffer = array.buffers()[2]
+        data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.empty(0, dtype=np.uint8)
+        return data[offsets[0]:offsets[-1]], offsets - offsets[0]
+    
+    encoded = [text.encode('utf-8') for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+def word_codes(data: np.ndarray, is_word: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Dense id per word occurrence, equal for equal words"""
+    if pa is not None:
+        offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        words = pa.Array.from_buffers(pa.large_binary(), len(starts),
+                                      [None, pa.py_buffer(offsets), pa.py_buffer(data[is_word])])
+        return words.dictionary_encode().indices.to_numpy().astype(np.int64)
+    
+    return pd.factorize(np.array([data[start:start + length].tobytes() for start, length in zip(starts, lengths)],
+                                 dtype=object))[0]
+
+def ramps(counts: np.ndarray) -> np.ndarray:
+    """0 up to each count, concatenated"""
+    total = int(counts.sum())
+    return np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+
+def gather_ranges(values: np.ndarray, begin: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """values[begin[i]:end[i]] for every i, concatenated"""
+    counts = end - begin
+    return values[np.repeat(begin, counts) + ramps(counts)]
+
+def intersect_sorted(lists: List[np.ndarray]) -> np.ndarray:
+    """Values present in every sorted, duplicate-free array, smallest first"""
+    lists = sorted(lists, key=len)
+    result = lists[0]
+    for other in lists[1:]:
+        if len(result) == 0 or len(other) == 0:
+            return result[:0]
+        at = np.minimum(np.searchsorted(other, result), len(other) - 1)
+        result = result[other[at] == result]
+    return result
+
+class DescriptionSearchIndex:
+    """Inverted index from description words to distinct descriptions, with a trigram index over the words"""
+    
+    def __init__(self, descriptions: pd.Series):
+        if isinstance(descriptions.dtype, pd.CategoricalDtype):
+            codes, uniques = descriptions.cat.codes.to_numpy(), descriptions.cat.categories
+        else:
+            codes, uniques = pd.factorize(descriptions)
+        self.codes = codes
+        self.texts = pd.Series(pd.Index(uniques).astype(str).str.lower())
+        self.data, offsets = utf8_buffer(self.texts)
+        n_texts = len(self.texts)
+        
+        # Words are runs of letters and digits, split where one description ends and the next begins
+        is_word = SEARCH_WORD_BYTES[self.data]
+        inner = offsets[1:-1]
+        inner = inner[(inner > 0) & (inner < len(self.data))]
+        follows_word = np.zeros(len(self.data), dtype=bool)
+        follows_word[1:] = is_word[:-1]
+        follows_word[inner] = False
+        starts = np.flatnonzero(is_word & ~follows_word)
+        precedes_word = np.zeros(len(self.data), dtype=bool)
+        precedes_word[:-1] = is_word[1:]
+        precedes_word[inner - 1] = False
+        ends = np.flatnonzero(is_word & ~precedes_word) + 1
+        lengths = ends - starts
+        text_ids = np.searchsorted(offsets, starts, side='right') - 1
+        
+        # Posting list of each distinct word: the descriptions containing it, ascending
+        words = word_codes(self.data, is_word, starts, lengths)
+        n_words = int(words.max()) + 1 if len(words) else 0
+        first = np.full(n_words, len(words), dtype=np.int64)
+        np.minimum.at(first, words, np.arange(len(words)))
+        self.word_starts = starts[first]
+        self.word_lengths = lengths[first]
+        pairs = np.sort(words * max(n_texts, 1) + text_ids)
+        pairs = pairs[np.r_[True, pairs[1:] != pairs[:-1]]] if len(pairs) else pairs
+        self.postings = (pairs % max(n_texts, 1)).astype(np.int32)
+        self.posting_offsets = np.zeros(n_words + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pairs // max(n_texts, 1), minlength=n_words), out=self.posting_offsets[1:])
+        
+        # Every word lists its trigrams plus one start gram (start marker and first two symbols)
+        def symbols(positions):
+            return SEARCH_GRAM_SYMBOLS[self.data[positions]]
+        
+        n_inner = np.maximum(self.word_lengths - 2, 0)
+        inner_owner = np.repeat(np.arange(n_words), n_inner)
+        at = np.repeat(self.word_starts, n_inner) + ramps(n_inner)
+        inner_grams = (symbols(at) * SEARCH_GRAM_BASE + symbols(at + 1)) * SEARCH_GRAM_BASE + symbols(at + 2)
+        second = np.where(self.word_lengths > 1, symbols(np.minimum(self.word_starts + 1, len(self.data) - 1)), 0)
+        start_grams = symbols(self.word_starts) * SEARCH_GRAM_BASE + second
+        grams = np.concatenate([inner_grams, start_grams]).astype(np.uint16)
+        owners = np.concatenate([inner_owner, np.arange(n_words)]).astype(np.int32)
+        # A stable sort keeps each gram's words ascending; a word repeating a trigram is listed once
+        order = np.argsort(grams, kind='stable')
+        grams, owners = grams[order], owners[order]
+        keep = np.ones(len(grams), dtype=bool)
+        keep[1:] = (grams[1:] != grams[:-1]) | (owners[1:] != owners[:-1])
+        self.gram_words = owners[keep]
+        self.gram_offsets = np.zeros(SEARCH_GRAM_BASE ** 3 + 1, dtype=np.int64)
+        np.cumsum(np.bincount(grams[keep], minlength=SEARCH_GRAM_BASE ** 3), out=self.gram_offsets[1:])
+        
+        # Reruns repeat the same query while other widgets change
+        self._last = (None, None)
+    
+    def _gram_words(self, gram: int) -> np.ndarray:
+        return self.gram_words[self.gram_offsets[gram]:self.gram_offsets[gram + 1]]
+    
+    def word_ids(self, word: str, prefix: bool) -> np.ndarray:
+        """Distinct words starting with (or, for words of three or more letters, containing) the word"""
+        values = np.frombuffer(word.encode('ascii'), dtype=np.uint8)
+        symbols = SEARCH_GRAM_SYMBOLS[values]
+        base = SEARCH_GRAM_BASE
+        trigrams = [self._gram_words((symbols[i] * base + symbols[i + 1]) * base + symbols[i + 2])
+                    for i in range(len(symbols) - 2)]
+        
+        if prefix and len(symbols) == 1:
+            # Start grams are ordered by first symbol, so one letter is one contiguous range
+            return self.gram_words[self.gram_offsets[symbols[0] * base]:self.gram_offsets[symbols[0] * base + base]]
+        if prefix:
+            candidates = intersect_sorted([self._gram_words(symbols[0] * base + symbols[1])] + trigrams)
+        else:
+            candidates = intersect_sorted(trigrams)
+        if len(symbols) <= (2 if prefix else 3):
+            return candidates
+        
+        # Trigrams can all be present without forming the word, so the letters are compared
+        lengths = self.word_lengths[candidates]
+        windows = np.where(lengths >= len(values), 1 if prefix else lengths - len(values) + 1, 0)
+        at = np.repeat(self.word_starts[candidates], windows) + ramps(windows)
+        found = np.ones(len(at), dtype=bool)
+        for offset, value in enumerate(values):
+            found &= self.data[at + offset] == value
+        return candidates[np.bincount(np.repeat(np.arange(len(candidates)), windows)[found], minlength=len(candidates)) > 0]
+    
+    def text_mask(self, words: np.ndarray) -> np.ndarray:
+        """Distinct descriptions containing any of the words"""
+        mask = np.zeros(len(self.texts), dtype=bool)
+        mask[gather_ranges(self.postings, self.posting_offsets[words], self.posting_offsets[words + 1])] = True
+        return mask
+    
+    def match(self, query: str) -> Optional[np.ndarray]:
+        """Distinct descriptions matching every term, or None for an empty query"""
+        matched = None
+        for term in query.lower().split():
+            words = SEARCH_TOKEN_PATTERN.findall(term)
+            if term.endswith('*') or len(term) < 3:
+                # Prefix terms are split into words the same way descriptions are
+                hits = [self.text_mask(self.word_ids(word, prefix=True)) for word in words]
+            elif words == [term]:
+                hits = [self.text_mask(self.word_ids(term, prefix=False))]
+            else:
+                # Punctuation or other letters: the longer words narrow the candidates, the text confirms the term
+                candidates = np.ones(len(self.texts), dtype=bool)
+                for word in words:
+                    if len(word) >= 3:
+                        candidates &= self.text_mask(self.word_ids(word, prefix=False))
+                positions = np.flatnonzero(candidates)
+                term_hits = np.zeros(len(self.texts), dtype=bool)
+                term_hits[positions] = self.texts.take(positions).str.contains(term, regex=False).to_numpy(dtype=bool)
+                hits = [term_hits]
+            for term_hits in hits:
+                matched = term_hits if matched is None else matched & term_hits
+        return matched
+    
+    def search(self, query: str) -> Optional[np.ndarray]:
+        """Boolean row mask for the query, or None when the query is empty"""
+        last_query, last_mask = self._last
+        if query == last_query:
+            return last_mask
+        
+        matched = self.match(query)
+        # Rows without a description have code -1 and never match
+        mask = None if matched is None else np.append(matched, False)[self.codes]
+        self._last = (query, mask)
+        return mask
+
+def combine_masks(*masks: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """AND together row masks where None means no filtering"""
+    combined = None
+    for mask in masks:
+        if mask is not None:
+            combined = mask if combined is None else combined & mask
+    return combined
+
+# Columns identifying a transaction when merging appended statements
+FINGERPRINT_COLUMNS = ['Date', 'Description', 'Amount']
+
+def transaction_fingerprints(transactions: pd.DataFrame) -> np.ndarray:
+    """64-bit hash of each row's Date, Description and Amount"""
+    keys = transactions[FINGERPRINT_COLUMNS].copy(deep=False)
+    keys['Description'] = keys['Description'].astype(object)
+    keys['Amount'] = keys['Amount'].astype('float64').round(2)
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+def new_row_mask(existing: np.ndarray, incoming: np.ndarray) -> np.ndarray:
+    """Mark incoming rows not already present, counting repeated identical rows"""
+    # The k-th copy of a fingerprint is new once k exceeds the copies already loaded
+    existing_counts = np.searchsorted(existing, incoming, side='right') - np.searchsorted(existing, incoming, side='left')
+    occurrence = pd.Series(incoming).groupby(incoming).cumcount().to_numpy()
+    return occurrence >= existing_counts
+
+def concat_frames(first: pd.DataFrame, second: pd.DataFrame) -> pd.DataFrame:
+    """Concatenate two frames, keeping shared categorical columns categorical"""
+    combined = pd.concat([first, second], ignore_index=True)
+    for column in combined.columns:
+        if (column in first.columns and column in second.columns
+                and isinstance(first[column].dtype, pd.CategoricalDtype)
+                and isinstance(second[column].dtype, pd.CategoricalDtype)):
+            combined[column] = union_categoricals([first[column], second[column]], ignore_order=True)
+    return combined
+
+# Offline sample quotes used when no quote service is configured
+MOCK_PRICES = {
+    'AAPL': 175.50, 'GOOGL': 142.30, 'MSFT': 378.85, 'TSLA': 248.42,
+    'SPY': 445.67, 'VTI': 235.89, 'NVDA': 455.30, 'AMZN': 155.80,
+    'META': 325.40, 'BRK.B': 380.25, 'VOO': 425.60, 'QQQ': 385.90,
+    'JNJ': 160.25, 'PG': 148.70, 'KO': 64.15, 'DIS': 92.40,
+    'V': 252.80, 'JPM': 168.90, 'UNH': 492.15, 'HD': 328.60
+}
+
+# Quote fetching and caching defaults
+QUOTE_TTL_SECONDS = 300
+QUOTE_BATCH_SIZE = 100
+QUOTE_MAX_WORKERS = 8
+QUOTE_TIMEOUT_SECONDS = 5.0
+QUOTE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.finance_dashboard', 'quotes')
+
+def write_json_atomic(path: str, data):
+    """Replace a JSON file through a uniquely named temporary file in the same directory"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        remove_file(tmp_path)
+        raise
+
+class PriceProvider:
+    """Source of current quotes for a batch of symbols"""
+    name = 'base'
+    
+    def fetch(self, symbols: List[str]) -> Dict[str, float]:
+        """Quotes for the symbols it knows, in one batched call"""
+        raise NotImplementedError
+    
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        return self.fetch(list(dict.fromkeys(symbols)))
+
+class MockPriceProvider(PriceProvider):
+    """Fixed offline quotes"""
+    name = 'mock'
+    
+    def __init__(self, prices: Optional[Dict[str, float]] = None):
+        self.prices = dict(MOCK_PRICES if prices is None else prices)
+    
+    def fetch(self, symbols: List[str]) -> Dict[str, float]:
+        return {symbol: self.prices[symbol] for symbol in symbols if symbol in self.prices}
+
+class HttpPriceProvider(PriceProvider):
+    """Quote service answering GET {base_url}/quotes?symbols=A,B with {"quotes": {"A": price}}"""
+    
+    def __init__(self, base_url: str, batch_size: int = QUOTE_BATCH_SIZE, max_workers: int = QUOTE_MAX_WORKERS,
+                 timeout: float = QUOTE_TIMEOUT_SECONDS):
+        self.base_url = base_url.rstrip('/')
+        self.name = f"http:{self.base_url}"
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.errors: List[str] = []
+    
+    def _fetch_batch(self, symbols: List[str]) -> Dict[str, float]:
+        url = f"{self.base_url}/quotes?{urlencode({'symbols': ','.join(symbols)})}"
+        with urlopen(url, timeout=self.timeout) as response:
+            payload = json.load(response)
+        return {symbol: float(price) for symbol, price in payload.get('quotes', {}).items() if price is not None}
+    
+    def fetch(self, symbols: List[str]) -> Dict[str, float]:
+        batches = [symbols[i:i + self.batch_size] for i in range(0, len(symbols), self.batch_size)]
+        prices = {}
+        errors = []
+        if not batches:
+            return prices
+        
+        # Batches are requested concurrently, so the call takes about one round-trip
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+            futures = [executor.submit(self._fetch_batch, batch) for batch in batches]
+            for batch, future in zip(batches, futures):
+                try:
+                    prices.update(future.result())
+                except (OSError, ValueError) as e:
+                    errors.append(f"{len(batch)} symbols from {batch[0]}: {e}")
+        
+        self.errors = errors
+        return prices
+
+class CachedPriceProvider(PriceProvider):
+    """Per-symbol TTL cache in front of a provider, optionally shared through a file per provider"""
+    
+    def __init__(self, provider: PriceProvider, ttl_seconds: float = QUOTE_TTL_SECONDS, cache_dir: Optional[str] = None):
+        self.provider = provider
+        self.name = provider.name
+        self.ttl_seconds = ttl_seconds
+        # Each provider (one per quote service URL) gets its own file
+        self.path = None
+        if cache_dir:
+            self.path = os.path.join(cache_dir, f"{hashlib.sha256(self.name.encode('utf-8')).hexdigest()[:16]}.json")
+        # Symbol -> (price or None when the provider has no quote, fetch time)
+        self.quotes: Dict[str, Tuple[Optional[float], float]] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'fetches': 0}
+        self._lock = threading.Lock()
+        
+        if self.path:
+            self.load()
+    
+    @property
+    def errors(self) -> List[str]:
+        return getattr(self.provider, 'errors', [])
+    
+    def load(self):
+        """Merge fresher quotes saved by other sessions or processes"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if saved.get('provider') != self.name:
+            return
+        with self._lock:
+            for symbol, (price, fetched_at) in saved.get('quotes', {}).items():
+                if symbol not in self.quotes or self.quotes[symbol][1] < fetched_at:
+                    self.quotes[symbol] = (price, fetched_at)
+    
+    def save(self):
+        """Write the cached quotes, merged with any saved meanwhile, to this provider's file"""
+        if not self.path:
+            return
+        
+        self.load()
+        with self._lock:
+            quotes = {symbol: list(entry) for symbol, entry in self.quotes.items()}
+        write_json_atomic(self.path, {'provider': self.name, 'quotes': quotes})
+    
+    def _fresh(self, symbols: List[str], now: float) -> Tuple[Dict[str, float], List[str]]:
+        prices = {}
+        missing = []
+        with self._lock:
+            for symbol in symbols:
+                entry = self.quotes.get(symbol)
+                if entry is not None and now - entry[1] < self.ttl_seconds:
+                    if entry[0] is not None:
+                        prices[symbol] = entry[0]
+                else:
+                    missing.append(symbol)
+        return prices, missing
+    
+    def fetch(self, symbols: List[str]) -> Dict[str, float]:
+        return self.get_prices(symbols)
+    
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Cached quotes, fetching every stale or unknown symbol in one batched call"""
+        symbols = list(dict.fromkeys(symbols))
+        now = time.time()
+        prices, missing = self._fresh(symbols, now)
+        
+        if missing and self.path:
+            self.load()
+            disk_prices, missing = self._fresh(missing, now)
+            prices.update(disk_prices)
+        
+        if missing:
+            fetched = self.provider.fetch(missing)
+            failed = bool(getattr(self.provider, 'errors', None))
+            with self._lock:
+                self.stats['fetches'] += 1
+                for symbol in missing:
+                    # Remember symbols without a quote too, unless the request itself failed
+                    if symbol in fetched or not failed:
+                        self.quotes[symbol] = (fetched.get(symbol), now)
+            prices.update(fetched)
+            self.save()
+        
+        with self._lock:
+            self.stats['hits'] += len(symbols) - len(missing)
+            self.stats['misses'] += len(missing)
+        return prices
+
+# Daily closing prices kept between sessions for historical valuation
+PRICE_HISTORY_PATH = os.environ.get(
+    'FPTI_PRICE_HISTORY', os.path.join(os.path.expanduser('~'), '.finance_dashboard', 'price_history')
+)
+
+# Symbols filled at a time when building the price history or valuing holdings
+PRICE_HISTORY_BLOCK_SYMBOLS = 256
+
+class PriceHistoryStore:
+    """Daily closes as a memory-mapped days x symbols matrix with one contiguous column per symbol"""
+    
+    def __init__(self, directory: str, start: str, symbols: List[str], closes: np.ndarray, version: str):
+        self.directory = directory
+        self.start = np.datetime64(start, 'D')
+        self.symbols = symbols
+        self.columns = pd.Index(symbols)
+        self.closes = closes
+        self.version = version
+    
+    @property
+    def end(self) -> np.datetime64:
+        return self.start + (len(self.closes) - 1)
+    
+    @property
+    def dates(self) -> np.ndarray:
+        return self.start + np.arange(len(self.closes))
+    
+    @classmethod
+    def open(cls, directory: str) -> Optional['PriceHistoryStore']:
+        """Map a saved price history, or None when there is none"""
+        try:
+            with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            closes = np.load(os.path.join(directory, 'closes.npy'), mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        
+        if closes.shape != (meta['days'], len(meta['symbols'])):
+            return None
+        return cls(directory, meta['start'], meta['symbols'], closes, meta['version'])
+    
+    @classmethod
+    def read_csv(cls, source, directory: str) -> 'PriceHistoryStore':
+        """Build the store from a CSV of Date, Symbol and Close rows"""
+        return cls.build(read_csv_with_schema(source, 'price_history'), directory)
+    
+    @classmethod
+    def build(cls, prices: pd.DataFrame, directory: str) -> 'PriceHistoryStore':
+        """Write closes from Date, Symbol and Close rows, carrying each close forward over days without one"""
+        missing = [column for column in ('Date', 'Symbol', 'Close') if column not in prices.columns]
+        if missing:
+            raise ValueError(f"Price history is missing columns: {', '.join(missing)}")
+        prices = prices.dropna(subset=['Date', 'Symbol', 'Close'])
+        if prices.empty:
+            raise ValueError("Price history needs Date, Symbol and Close values")
+        
+        symbol_values = prices['Symbol'].astype(str).astype('category')
+        symbols = list(symbol_values.cat.categories)
+        codes = symbol_values.cat.codes.to_numpy().astype(np.int64)
+        days = prices['Date'].to_numpy().astype('datetime64[D]')
+        start = days.min()
+        n_days = int((days.max() - start).astype(np.int64)) + 1
+        day = (days - start).astype(np.int64)
+        close = prices['Close'].to_numpy(dtype=np.float64)
+        
+        # Group rows by symbol so each block of columns is one contiguous slice
+        order = np.lexsort((day, codes))
+        codes, day, close = codes[order], day[order], close[order]
+        bounds = np.searchsorted(codes, np.arange(len(symbols) + 1))
+        
+        os.makedirs(directory, exist_ok=True)
+        closes_path = os.path.join(directory, 'closes.npy')
+        # A unique temp file per build, so concurrent builds never write into each other
+        fd, tmp_path = tempfile.mkstemp(suffix='.npy.tmp', dir=directory)
+        os.close(fd)
+        try:
+            closes = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float64,
+                                               shape=(n_days, len(symbols)), fortran_order=True)
+            rows = np.arange(n_days)
+            for first in range(0, len(symbols), PRICE_HISTORY_BLOCK_SYMBOLS):
+                last = min(first + PRICE_HISTORY_BLOCK_SYMBOLS, len(symbols))
+                block = np.full((n_days, last - first), np.nan)
+                block[day[bounds[first]:bounds[last]], codes[bounds[first]:bounds[last]] - first] = close[bounds[first]:bounds[last]]
+                latest = np.where(np.isnan(block), 0, rows[:, None])
+                np.maximum.accumulate(latest, axis=0, out=latest)
+                closes[:, first:last] = block[latest, np.arange(last - first)]
+            closes.flush()
+            del closes
+            os.replace(tmp_path, closes_path)
+        except BaseException:
+            remove_file(tmp_path)
+            raise
+        
+        meta = {'start': str(start), 'days': n_days, 'symbols': symbols, 'version': f"{time.time_ns():x}"}
+        write_json_atomic(os.path.join(directory, 'meta.json'), meta)
+        return cls.open(directory)
+
+def portfolio_value_series(positions: pd.DataFrame, store: PriceHistoryStore,
+                           start: np.datetime64, end: np.datetime64) -> pd.DataFrame:
+    """Daily market value and net amount invested of dated position changes"""
+    lo = int((start - store.start).astype(np.int64))
+    n_days = int((end - start).astype(np.int64)) + 1
+    if n_days <= 0:
+        return pd.DataFrame({'Date': pd.Series(dtype='datetime64[ns]'), 'Value': [], 'Cost': [], 'Growth': []})
+    
+    columns = store.columns.get_indexer(positions['Symbol'].astype(str))
+    shares = positions['Shares'].to_numpy(dtype=np.float64)
+    cost = positions['Invested'].to_numpy(dtype=np.float64)
+    changed = positions['Date'].to_numpy().astype('datetime64[D]')
+    
+    # Day each change enters the range; changes made earlier or on an unknown date count from the first day
+    entry = np.where(np.isnat(changed), 0, (changed - start).astype(np.int64))
+    entry = np.maximum(entry, 0)
+    held = (columns >= 0) & (entry < n_days) & np.isfinite(shares) & np.isfinite(cost)
+    columns, shares, cost, entry = columns[held], shares[held], cost[held], entry[held]
+    
+    flows = np.zeros(n_days)
+    value = np.zeros(n_days)
+    used, position = np.unique(columns, return_inverse=True)
+    
+    # Shares held per day and symbol are the running sum of signed changes, valued a block of symbols at a time
+    for first in range(0, len(used), PRICE_HISTORY_BLOCK_SYMBOLS):
+        last = min(first + PRICE_HISTORY_BLOCK_SYMBOLS, len(used))
+        closes = np.asfortranarray(store.closes[lo:lo + n_days, used[first:last]])
+        
+        # A change counts from the first day its symbol has a close, so money is never paid into a position worth 0
+        priced = ~np.isnan(closes)
+        first_close = np.where(priced.any(axis=0), priced.argmax(axis=0), n_days)
+        in_block = np.flatnonzero((position >= first) & (position < last))
+        block_position = position[in_block] - first
+        block_entry = np.maximum(entry[in_block], first_close[block_position])
+        counted = block_entry < n_days
+        in_block, block_position, block_entry = in_block[counted], block_position[counted], block_entry[counted]
+        flows += np.bincount(block_entry, weights=cost[in_block], minlength=n_days)
+        
+        held_shares = np.zeros((n_days, last - first), order='F')
+        np.add.at(held_shares, (block_entry, block_position), shares[in_block])
+        np.cumsum(held_shares, axis=0, out=held_shares)
+        closes[~priced] = 0
+        held_shares *= closes
+        value += held_shares.sum(axis=1)
+    
+    return pd.DataFrame({
+        'Date': (start + np.arange(n_days)).astype('datetime64[ns]'),
+        'Value': value,
+        'Cost': flows.cumsum(),
+        'Growth': time_weighted_growth(value, flows),
+    })
+
+def affine_scan(weight: np.ndarray, offset: np.ndarray) -> np.ndarray:
+    """x[i] = weight[i] * x[i - 1] + offset[i] from x[-1] = 0, composing the steps by repeated doubling"""
+    weight = weight.astype(np.float64)
+    offset = offset.astype(np.float64)
+    step = 1
+    # After each pass position i has folded in the steps of the last 2 * step trades
+    while step < len(weight) and weight[step:].any():
+        offset[step:] = offset[step:] + weight[step:] * offset[:-step]
+        weight[step:] = weight[step:] * weight[:-step]
+        step *= 2
+    return offset
+
+# Ways of matching sold shares to the lots they came from
+COST_BASIS_METHODS = ('fifo', 'lifo', 'average')
+
+# Columns of the dated position changes behind the portfolio value history
+POSITION_COLUMNS = ['Symbol', 'Date', 'Shares', 'Invested']
+
+@dataclass
+class CostBasis:
+    """Open lots, per-symbol totals and the cash flows of the trades that were filled"""
+    lots: pd.DataFrame
+    summary: pd.DataFrame
+    cash_flows: pd.DataFrame
+
+def cost_basis(trades: pd.DataFrame, method: str = 'fifo') -> CostBasis:
+    """Open lots and per-symbol cost basis of a trade log with positive buys and negative sells"""
+    if method not in COST_BASIS_METHODS:
+        raise ValueError(f"Unknown cost basis method: {method}")
+    
+    trades = trades.dropna(subset=['Date', 'Symbol', 'Shares', 'Price'])
+    trades = trades[trades['Shares'] != 0]
+    if trades.empty:
+        return CostBasis(
+            pd.DataFrame({'Symbol': pd.Series(dtype=object), 'Name': pd.Series(dtype=object), 'Shares': pd.Series(dtype='float64'),
+                          'Purchase_Price': pd.Series(dtype='float64'), 'Purchase_Date': pd.Series(dtype='datetime64[ns]')}),
+            pd.DataFrame({'Symbol': pd.Series(dtype=object), **{column: pd.Series(dtype='float64') for column in (
+                'Shares', 'Cost_Basis', 'Average_Cost', 'Proceeds', 'Realized_Gain')}, 'Trades': pd.Series(dtype='int64')}),
+            pd.DataFrame({'Symbol': pd.Series(dtype=object), 'Date': pd.Series(dtype='datetime64[ns]'),
+                          'Shares': pd.Series(dtype='float64'), 'Amount': pd.Series(dtype='float64')})
+        )
+    
+    symbol_values = trades['Symbol'].astype(str).astype('category')
+    symbols = np.asarray(symbol_values.cat.categories)
+    
+    # Trades of a symbol in date order, same-day trades in file order
+    order = np.lexsort((np.arange(len(trades)), trades['Date'].to_numpy(), symbol_values.cat.codes.to_numpy()))
+    group = symbol_values.cat.codes.to_numpy()[order].astype(np.int64)
+    shares = trades['Shares'].to_numpy(dtype=np.float64)[order]
+    price = trades['Price'].to_numpy(dtype=np.float64)[order]
+    dates = trades['Date'].to_numpy()[order]
+    names = trades['Name'].astype(str).to_numpy()[order] if 'Name' in trades.columns else None
+    n_groups = len(symbols)
+    
+    first = np.ones(len(group), dtype=bool)
+    first[1:] = group[1:] != group[:-1]
+    by_symbol = pd.Series(shares).groupby(group)
+    
+    # Position after each trade, with sells beyond the position held cut back to it
+    running = by_symbol.cumsum().to_numpy()
+    held = running - np.minimum(pd.Series(running).groupby(group).cummin().to_numpy(), 0)
+    before = np.zeros_like(held)
+    before[1:] = held[:-1]
+    before[first] = 0
+    filled = held - before
+    
+    buy = filled > 0
+    sell = filled < 0
+    buy_cost = np.bincount(group[buy], weights=filled[buy] * price[buy], minlength=n_groups)
+    proceeds = np.bincount(group[sell], weights=-filled[sell] * price[sell], minlength=n_groups)
+    position = np.bincount(group, weights=filled, minlength=n_groups)
+    
+    # FIFO sells consume the earliest bought shares, so a lot keeps what lies beyond the total sold
+    bought = np.where(buy, filled, 0)
+    sold = np.bincount(group[sell], weights=-filled[sell], minlength=n_groups)
+    fifo_left = np.clip(pd.Series(bought).groupby(group).cumsum().to_numpy() - sold[group], 0, bought)
+    
+    if method == 'lifo':
+        # A lot fills the position levels just below the position after its purchase and loses any
+        # level the position later drops below
+        lowest_after = pd.Series(held[::-1]).groupby(group[::-1]).cummin().to_numpy()[::-1]
+        remaining = np.clip(lowest_after - (held - bought), 0, bought)
+    else:
+        remaining = fifo_left
+    
+    if method == 'average':
+        # Only buys move the average price: after one it is (average * before + filled * price) / held.
+        # Each trade is that affine step (sells keep the average) and a symbol's first trade or a buy
+        # into a closed position starts over, so the weight on the earlier average is at most one
+        held_or_one = np.where(held > 0, held, 1)
+        weight = np.where(buy, before / held_or_one, 1.0)
+        weight[first] = 0
+        average_after = affine_scan(weight, np.where(buy, filled * price / held_or_one, 0.0))
+        basis_after = np.where(held > 0, average_after * held, 0)
+        last = np.flatnonzero(np.r_[first[1:], True])
+        basis = np.zeros(n_groups)
+        basis[group[last]] = basis_after[last]
+        average = np.divide(basis, position, out=np.zeros(n_groups), where=position > 0)
+        lot_price = average[group]
+    else:
+        lot_price = price
+        basis = np.bincount(group, weights=remaining * price, minlength=n_groups)
+    
+    open_lot = remaining > 0
+    lots = pd.DataFrame({
+        'Symbol': symbols[group[open_lot]],
+        'Name': names[open_lot] if names is not None else symbols[group[open_lot]],
+        'Shares': remaining[open_lot],
+        'Purchase_Price': lot_price[open_lot],
+        'Purchase_Date': dates[open_lot],
+    })
+    summary = pd.DataFrame({
+        'Symbol': symbols,
+        'Shares': position,
+        'Cost_Basis': basis,
+        'Average_Cost': np.divide(basis, position, out=np.full(n_groups, np.nan), where=position > 0),
+        'Proceeds': proceeds,
+        'Realized_Gain': proceeds - (buy_cost - basis),
+        'Trades': np.bincount(group, minlength=n_groups),
+    })
+    traded = filled != 0
+    cash_flows = pd.DataFrame({
+        'Symbol': symbols[group[traded]],
+        'Date': dates[traded],
+        'Shares': filled[traded],
+        'Amount': -filled[traded] * price[traded],
+    })
+    return CostBasis(lots, summary, cash_flows)
+
+# Bounds and tolerance for solving annualized money-weighted returns
+XIRR_MIN_RATE = -0.999999
+XIRR_MAX_RATE = 1e6
+XIRR_TOLERANCE = 1e-9
+
+def xirr(amounts: np.ndarray, dates: np.ndarray, groups: np.ndarray, n_groups: int,
+         max_newton: int = 50, max_bisect: int = 200) -> np.ndarray:
+    """Annual rate discounting each group's dated cash flows to zero, solved for every group at once"""
+    groups = np.asarray(groups, dtype=np.int64)
+    amounts = np.asarray(amounts, dtype=np.float64)
+    days = np.asarray(dates).astype('datetime64[D]').astype(np.int64).astype(np.float64)
+    
+    # Time in years from each group's first flow keeps the discount factors in range
+    first = np.full(n_groups, np.inf)
+    np.minimum.at(first, groups, days)
+    years = (days - first[groups]) / 365.0
+    
+    # A rate exists only for groups with both money in and money out
+    solvable = (np.bincount(groups, weights=amounts < 0, minlength=n_groups) > 0) & \
+               (np.bincount(groups, weights=amounts > 0, minlength=n_groups) > 0)
+    
+    def npv(rate: np.ndarray, active: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Only the flows of groups still being solved are evaluated
+        flows = np.flatnonzero(active[groups])
+        flow_groups, flow_years = groups[flows], years[flows]
+        growth = 1 + rate[flow_groups]
+        discounted = amounts[flows] * growth ** -flow_years
+        value = np.bincount(flow_groups, weights=discounted, minlength=n_groups)
+        slope = np.bincount(flow_groups, weights=-flow_years * discounted / growth, minlength=n_groups)
+        return value, slope
+    
+    rate = np.full(n_groups, 0.1)
+    done = ~solvable
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        # Newton steps for every group still moving
+        for _ in range(max_newton):
+            value, slope = npv(rate, ~done)
+            step = value / slope
+            moving = ~done & np.isfinite(step)
+            rate = np.where(moving, rate - step, rate)
+            done |= moving & (np.abs(step) < XIRR_TOLERANCE * np.maximum(1, np.abs(rate)))
+            if done.all():
+                break
+        
+        # Groups where Newton diverged or left the valid range fall back to bisection
+        failed = solvable & ~(done & (rate > XIRR_MIN_RATE) & (rate < XIRR_MAX_RATE))
+        if failed.any():
+            low = np.full(n_groups, XIRR_MIN_RATE)
+            high = np.full(n_groups, XIRR_MAX_RATE)
+            low_value, _ = npv(low, failed)
+            high_value, _ = npv(high, failed)
+            bracketed = failed & (np.sign(low_value) != np.sign(high_value))
+            for _ in range(max_bisect):
+                middle = (low + high) / 2
+                middle_value, _ = npv(middle, bracketed)
+                same_side = np.sign(middle_value) == np.sign(low_value)
+                low = np.where(bracketed & same_side, middle, low)
+                low_value = np.where(bracketed & same_side, middle_value, low_value)
+                high = np.where(bracketed & ~same_side, middle, high)
+                if np.all((high - low)[bracketed] < XIRR_TOLERANCE * np.maximum(1, np.abs(low[bracketed]))):
+                    break
+            rate = np.where(bracketed, (low + high) / 2, rate)
+            rate[failed & ~bracketed] = np.nan
+    
+    rate[~solvable] = np.nan
+    return rate
+
+def time_weighted_growth(value: np.ndarray, flows: np.ndarray) -> np.ndarray:
+    """Growth of one dollar with each day's money in (buys) and out (sells) taken out of that day's return"""
+    previous = np.concatenate([[0.0], value[:-1]])
+    daily = np.divide(value - flows, previous, out=np.ones_like(value), where=previous > 0)
+    return np.cumprod(daily)
+
+# Monte Carlo settings for goal projections
+GOAL_SIMULATION_PATHS = 20_000
+GOAL_SIMULATION_CHUNK = 2_000
+GOAL_SIMULATION_MIN_MONTHS = 120
+GOAL_SIMULATION_MAX_MONTHS = 600
+GOAL_COMPLETION_PERCENTILES = (10, 50, 90)
+DAYS_PER_MONTH = 30.44
+
+def simulate_goal_months(monthly_flows: np.ndarray, needs: np.ndarray, horizon: int, n_paths: int,
+                         seed) -> np.ndarray:
+    """Months until cumulative savings first cover each need on paths resampled from past months
+
+    Paths that never get there within the horizon report horizon + 1.
+    """
+    rng = np.random.default_rng(seed)
+    savings = np.cumsum(rng.choice(monthly_flows, size=(n_paths, horizon)), axis=1)
+    np.maximum.accumulate(savings, axis=1, out=savings)
+    
+    # Savings so far only ever rise, so the months spent below a need are the months before reaching it
+    months = np.empty((n_paths, len(needs)), dtype=np.int32)
+    for goal, need in enumerate(needs):
+        months[:, goal] = (savings < need).sum(axis=1) + 1
+    return months
+
+def simulate_goals(monthly_flows: np.ndarray, needs: np.ndarray, horizon: int,
+                   n_paths: int = GOAL_SIMULATION_PATHS, seed: int = 0, workers: int = 1) -> np.ndarray:
+    """Completion months of every goal on n_paths paths, in chunks optionally spread over processes"""
+    sizes = [min(GOAL_SIMULATION_CHUNK, n_paths - start) for start in range(0, n_paths, GOAL_SIMULATION_CHUNK)]
+    # One seed per chunk keeps results identical however the chunks are run
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    chunks = [(monthly_flows, needs, horizon, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    
+    if workers > 1 and len(chunks) > 1:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context) as executor:
+            results = list(executor.map(simulate_goal_months, *zip(*chunks)))
+    else:
+        results = [simulate_goal_months(*chunk) for chunk in chunks]
+    return np.concatenate(results)
+
+@dataclass
+class LoadResult:
+    """Outcome of a load or append; loaders report failures here instead of raising or displaying them"""
+    ok: bool
+    error: Optional[str] = None
+    snapshot: bool = False
+    rows: Dict[str, int] = field(default_factory=dict)
+    stats: Dict = field(default_factory=dict)
+    
+    def __bool__(self) -> bool:
+        return self.ok
+
+# Figures kept per dataset version, across filter and zoom states
+FIGURE_CACHE_MAX_ENTRIES = 64
+
+class DatasetFrame:
+    """Dashboard frame attribute that bumps the dataset version when reassigned"""
+    
+    def __set_name__(self, owner, name):
+        self.attr = f"_{name}"
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.__dict__.get(self.attr)
+    
+    def __set__(self, obj, value):
+        obj.__dict__[self.attr] = value
+        obj.invalidate()
+
+class FinanceDashboard:
+    transactions_df = DatasetFrame()
+    net_worth_df = DatasetFrame()
+    investments_df = DatasetFrame()
+    goals_df = DatasetFrame()
+    trades_df = DatasetFrame()
+    
+    def __init__(self, merchant_store: Optional[MerchantCategoryStore] = None,
+                 price_provider: Optional[PriceProvider] = None):
+        self.merchant_store = merchant_store if merchant_store is not None else MerchantCategoryStore()
+        self.price_provider = price_provider if price_provider is not None else CachedPriceProvider(MockPriceProvider())
+        self.data_version = 0
+        self._derived = {}
+        # Cached dashboards are shared by sessions, so derived results are written under a lock
+        self._derived_lock = threading.RLock()
+        self._figure_lock = threading.Lock()
+        self._cached_bytes = None
+        self.ingest_stats = None
+        self.load_timings = {}
+        self.append_stats = None
+        self.transactions_df = None
+        self.net_worth_df = None
+        self.investments_df = None
+        self.goals_df = None
+        self.trades_df = None
+    
+    def invalidate(self):
+        """Start a new dataset version and drop everything derived from the old one"""
+        with self._derived_lock:
+            self.data_version += 1
+            self._derived = {}
+            self._figures = OrderedDict()
+    
+    def _derived_value(self, name: str, builder):
+        """Compute a derived result once per dataset version"""
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        
+        with self._derived_lock:
+            # Another session may have built it while this one waited
+            if name not in self._derived:
+                with current_perf().stage(f"derive:{name}"):
+                    self._derived[name] = builder()
+            return self._derived[name]
+    
+    def cached_figure(self, name: str, inputs: Tuple, builder):
+        """Reuse a figure built for the same dataset version and view inputs"""
+        key = (name, self.data_version, inputs)
+        with self._figure_lock:
+            figure = self._figures.get(key)
+            if figure is not None:
+                self._figures.move_to_end(key)
+                current_perf().count('figure_cache_hits')
+                return figure
+        
+        with current_perf().stage(f"figure:{name}"):
+            figure = builder()
+        with self._figure_lock:
+            self._figures[key] = figure
+            while len(self._figures) > FIGURE_CACHE_MAX_ENTRIES:
+                self._figures.popitem(last=False)
+        return figure
+    
+    def memory_usage(self) -> int:
+        """Total in-memory size of the loaded frames in bytes"""
+        total = 0
+        for df in (self.transactions_df, self.net_worth_df, self.investments_df, self.goals_df, self.trades_df):
+            if df is not None:
+                total += int(df.memory_usage(index=True, deep=True).sum())
+        return total
+    
+    def cached_bytes(self) -> int:
+        """Approximate size of the frames plus every derived result, measured again as results are added"""
+        derived = dict(self._derived)
+        key = (self.data_version, len(derived))
+        if self._cached_bytes is None or self._cached_bytes[0] != key:
+            frames = [self.transactions_df, self.net_worth_df, self.investments_df, self.goals_df, self.trades_df]
+            self._cached_bytes = (key, estimate_nbytes([frames, derived]))
+        return self._cached_bytes[1]
+        
+    def memory_report(self) -> Dict[str, Dict[str, int]]:
+        """Bytes used per frame compared with an untyped read_csv load"""
+        def build():
+            report = {}
+            frames = {
+                'transactions': self.transactions_df,
+                'net_worth': self.net_worth_df,
+                'investments': self.investments_df,
+                'goals': self.goals_df,
+                'trades': self.trades_df
+            }
+            for name, df in frames.items():
+                if df is not None:
+                    report[name] = {
+                        'before': estimate_default_bytes(df),
+                        'after': int(df.memory_usage(index=True, deep=True).sum())
+                    }
+            return report
+        
+        return self._derived_value('memory_report', build)
+    
+    def load_from_zip(self, zip_file, streaming: bool = False, spill: bool = False,
+                      amount_dtype: str = 'float64') -> LoadResult:
+        """Load data from uploaded ZIP file"""
+        try:
+            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+                file_names = zip_ref.namelist()
+                
+                # Processed snapshots carry their own manifest
+                if SNAPSHOT_MANIFEST in file_names:
+                    return self._load_snapshot_zip(zip_ref)
+                
+                # Find matching files (case insensitive)
+                members = {}
+                for file_name in file_names:
+                    name = INPUT_FILES.get(file_name.lower())
+                    if name is not None:
+                        members[name] = file_name
+                
+                if 'transactions' not in members:
+                    return LoadResult(False, "Missing required file: transactions.csv")
+                
+                sources = {name: zip_ref.open(member) for name, member in members.items()}
+                try:
+                    return self.load_files(sources, streaming=streaming, spill=spill, amount_dtype=amount_dtype)
+                finally:
+                    for source in sources.values():
+                        source.close()
+                
+        except Exception as e:
+            return LoadResult(False, f"Error loading ZIP file: {str(e)}")
+    
+    def _load_result(self, snapshot: bool = False) -> LoadResult:
+        """Successful load result with the row count of each loaded frame"""
+        frames = {
+            'transactions': self.transactions_df,
+            'net_worth': self.net_worth_df,
+            'investments': self.investments_df,
+            'goals': self.goals_df,
+            'trades': self.trades_df
+        }
+        return LoadResult(True, snapshot=snapshot, rows={name: len(df) for name, df in frames.items() if df is not None})
+    
+    def load_files(self, sources: Dict, streaming: bool = False, spill: bool = False,
+                   amount_dtype: str = 'float64') -> LoadResult:
+        """Parse the input files concurrently and replace the current dataset"""
+        if sources.get('transactions') is None:
+            return LoadResult(False, "Missing required file: transactions.csv")
+        
+        try:
+            self._load_files(sources, streaming, spill, amount_dtype)
+        except Exception as e:
+            return LoadResult(False, f"Error loading CSV files: {str(e)}")
+        return self._load_result()
+    
+    def _load_files(self, sources: Dict, streaming: bool, spill: bool, amount_dtype: str):
+        def parse(name, source):
+            start = time.perf_counter()
+            if name == 'transactions' and streaming:
+                frame, derived = self._stream_transactions(source, spill=spill, amount_dtype=amount_dtype)
+            else:
+                frame, derived = read_csv_with_schema(source, name, amount_dtype), {}
+            return frame, derived, time.perf_counter() - start
+        
+        frames = {}
+        derived = {}
+        timings = {}
+        sources = {name: source for name, source in sources.items() if source is not None}
+        
+        # Each file parses in its own thread, so the load takes as long as the largest file
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {name: executor.submit(parse, name, source) for name, source in sources.items()}
+            for name, future in futures.items():
+                frames[name], file_derived, timings[name] = future.result()
+                derived.update(file_derived)
+        
+        self._set_dataset(frames, derived)
+        
+        # Categorize and index once per load so views only read cached results
+        start = time.perf_counter()
+        self.categorize_transactions()
+        timings['categorize'] = time.perf_counter() - start
+        start = time.perf_counter()
+        self.search_index()
+        timings['search_index'] = time.perf_counter() - start
+        self.load_timings = timings
+    
+    def copy(self) -> 'FinanceDashboard':
+        """New dashboard sharing this one's frames and derived results"""
+        clone = FinanceDashboard(merchant_store=self.merchant_store, price_provider=self.price_provider)
+        clone._set_dataset(
+            {
+                'transactions': self.transactions_df,
+                'net_worth': self.net_worth_df,
+                'investments': self.investments_df,
+                'goals': self.goals_df,
+                'trades': self.trades_df
+            },
+            dict(self._derived)
+        )
+        clone.ingest_stats = self.ingest_stats
+        clone.load_timings = self.load_timings
+        return clone
+    
+    def append_files(self, sources: Dict, amount_dtype: str = 'float64') -> LoadResult:
+        """Merge delta transactions/net worth files without reprocessing the existing history"""
+        try:
+            stats = self._append_files(sources, amount_dtype)
+        except Exception as e:
+            return LoadResult(False, f"Error appending statements: {str(e)}")
+        result = self._load_result()
+        result.stats = stats
+        return result
+    
+    def _append_files(self, sources: Dict, amount_dtype: str) -> Dict[str, int]:
+        start = time.perf_counter()
+        stats = {'received': 0, 'added': 0, 'duplicates': 0}
+        frames = {
+            'transactions': self.transactions_df,
+            'net_worth': self.net_worth_df,
+            'investments': self.investments_df,
+            'goals': self.goals_df,
+            'trades': self.trades_df
+        }
+        new_rows = None
+        
+        if sources.get('transactions') is not None:
+            delta = read_csv_with_schema(sources['transactions'], 'transactions', amount_dtype)
+            stats['received'] = len(delta)
+            
+            if self.transactions_df is None:
+                new_rows = delta
+            else:
+                new_rows = delta[new_row_mask(self.transaction_fingerprints(), transaction_fingerprints(delta))]
+            stats['added'] = len(new_rows)
+            stats['duplicates'] = stats['received'] - stats['added']
+        
+        if new_rows is not None and len(new_rows) > 0:
+            # Only the new rows are categorized and folded into the cube
+            new_categorized = self._categorize_frame(new_rows.reset_index(drop=True))
+            self.merchant_store.save()
+            if self.transactions_df is None:
+                fingerprints = np.array([], dtype=np.uint64)
+                combined = new_categorized
+                cube = aggregate_cube(new_categorized)
+            else:
+                fingerprints = self.transaction_fingerprints()
+                combined = concat_frames(self.categorize_transactions(), new_categorized)
+                cube = merge_cubes([self.build_aggregate_cube(), aggregate_cube(new_categorized)])
+            
+            frames['transactions'] = combined
+            added = np.sort(transaction_fingerprints(new_categorized))
+            derived = {
+                'categorized': combined,
+                'cube': cube,
+                'fingerprints': np.insert(fingerprints, np.searchsorted(fingerprints, added), added)
+            }
+        else:
+            # Without new transactions everything derived from them still holds; only the memory report covers net worth
+            derived = {name: value for name, value in self._derived.items() if name != 'memory_report'}
+        
+        if sources.get('net_worth') is not None:
+            delta = read_csv_with_schema(sources['net_worth'], 'net_worth')
+            if self.net_worth_df is None:
+                frames['net_worth'] = delta
+            else:
+                # A newer statement replaces the balances recorded for the same date
+                existing = self.net_worth_df[~self.net_worth_df['Date'].isin(delta['Date'])]
+                frames['net_worth'] = pd.concat([existing, delta], ignore_index=True).sort_values('Date', ignore_index=True)
+        
+        self._set_dataset(frames, derived)
+        stats['seconds'] = round(time.perf_counter() - start, 3)
+        self.append_stats = stats
+        return stats
+    
+    def transaction_fingerprints(self) -> np.ndarray:
+        """Sorted Date + Description + Amount hashes of the loaded transactions"""
+        return self._derived_value('fingerprints', lambda: np.sort(transaction_fingerprints(self.transactions_df)))
+    
+    def _set_dataset(self, frames: Dict[str, pd.DataFrame], derived: Optional[Dict] = None):
+        """Replace all frames at once and seed any results computed while loading"""
+        self.transactions_df = frames.get('transactions')
+        self.net_worth_df = frames.get('net_worth')
+        self.investments_df = frames.get('investments')
+        self.goals_df = frames.get('goals')
+        self.trades_df = frames.get('trades')
+        
+        if derived:
+            with self._derived_lock:
+                self._derived.update(derived)
+    
+    def _stream_transactions(self, source, chunksize: int = STREAM_CHUNK_ROWS, spill: bool = False,
+                             amount_dtype: str = 'float64') -> Tuple[pd.DataFrame, Dict]:
+        """Read transactions in chunks, folding each into running aggregates"""
+        start = time.perf_counter()
+        # Memory is sampled per chunk, since the process peak also covers earlier loads
+        baseline_rss = current_rss_mb()
+        peak_rss = baseline_rss
+        cubes = []
+        chunks = []
+        writer = None
+        spill_path = None
+        rows = 0
+        n_chunks = 0
+        
+        try:
+            # Strings stay plain per chunk, categories are built once for the whole frame
+            dtypes = schema_dtypes('transactions', amount_dtype, categoricals=False)
+            for chunk in pd.read_csv(source, chunksize=chunksize, dtype=dtypes):
+                chunk['Date'] = parse_dates(chunk['Date'])
+                chunk['Month'] = chunk['Date'].dt.to_period('M')
+                chunk = self._categorize_frame(chunk)
+                chunk['Category'] = chunk['Category'].astype(object)
+                rows += len(chunk)
+                n_chunks += 1
+                
+                # Fold the chunk into the running aggregate cube
+                cubes.append(aggregate_cube(chunk))
+                if len(cubes) > 1:
+                    cubes = [merge_cubes(cubes)]
+                
+                if spill and pa is not None:
+                    # Month is an extension type, so it is rebuilt from Date on reload
+                    batch = chunk.drop(columns='Month')
+                    if writer is None:
+                        spill_path = new_spill_path()
+                        schema = pa.Schema.from_pandas(batch, preserve_index=False)
+                        writer = pa.ipc.new_file(spill_path, schema)
+                    writer.write_table(pa.Table.from_pandas(batch, schema=schema, preserve_index=False))
+                else:
+                    chunks.append(chunk)
+                peak_rss = max_rss(peak_rss, current_rss_mb())
+            
+            if writer is not None:
+                writer.close()
+                writer = None
+                transactions_df = apply_schema(arrow_source_to_frame(pa.memory_map(spill_path, 'r')), 'transactions', amount_dtype)
+            else:
+                transactions_df = pd.concat(chunks, ignore_index=True).astype(
+                    {'Description': 'category', 'Type': 'category', 'Category': 'category'}
+                )
+            peak_rss = max_rss(peak_rss, current_rss_mb())
+        finally:
+            if writer is not None:
+                writer.close()
+            if spill_path is not None:
+                # A mapped file stays readable once unlinked; where open files cannot be deleted it goes with the dashboard
+                try:
+                    os.remove(spill_path)
+                except OSError:
+                    weakref.finalize(self, remove_file, spill_path)
+        
+        derived = {'categorized': transactions_df, 'cube': merge_cubes(cubes)}
+        # Merchants learned from every chunk are written once per load
+        self.merchant_store.save()
+        
+        self.ingest_stats = {
+            'rows': rows,
+            'chunks': n_chunks,
+            'seconds': round(time.perf_counter() - start, 3),
+            'peak_growth_mb': round(peak_rss - baseline_rss, 1) if baseline_rss is not None else None,
+            'spilled': spill_path is not None
+        }
+        return transactions_df, derived
+    
+    def categorize_transactions(self) -> pd.DataFrame:
+        """Categorized view of the transactions, computed once per dataset version"""
+        if self.transactions_df is None:
+            return pd.DataFrame()
+        
+        def build():
+            categorized = self._categorize_frame(self.transactions_df)
+            self.merchant_store.save()
+            return categorized
+        
+        return self._derived_value('categorized', build)
+    
+    def _categorize_frame(self, transactions: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of the frame with missing or 'other' categories filled in"""
+        categorized = transactions.copy(deep=False)
+        
+        if 'Category' in transactions.columns:
+            categories = transactions['Category'].to_numpy(dtype=object, copy=True)
+        else:
+            categories = np.full(len(transactions), 'other', dtype=object)
+        
+        # Apply auto-categorization
+        mask = pd.isna(categories) | (categories == 'other')
+        if mask.any():
+            categories[mask] = self.merchant_store.categorize(transactions['Description'][mask]).to_numpy()
+        
+        categorized['Category'] = pd.Categorical(categories)
+        return categorized
+    
+    def calculate_monthly_summary(self) -> pd.DataFrame:
+        """Calculate monthly income and expenses"""
+        if self.transactions_df is None:
+            return pd.DataFrame()
+        
+        return self._derived_value('monthly_summary', self._build_monthly_summary)
+    
+    def _build_monthly_summary(self) -> pd.DataFrame:
+        cube = self.build_aggregate_cube()
+        return summarize_monthly_totals(cube.groupby(['Month', 'Type'], observed=True)['Amount'].sum())
+    
+    def build_aggregate_cube(self) -> pd.DataFrame:
+        """Daily amount sums and counts by type and category, shared by every view"""
+        if self.transactions_df is None:
+            return pd.DataFrame()
+        
+        return self._derived_value('cube', lambda: aggregate_cube(self.categorize_transactions()))
+    
+    def calculate_category_totals(self) -> pd.Series:
+        """Total expenses per category, largest first"""
+        if self.transactions_df is None:
+            return pd.Series(dtype=float)
+        
+        def build():
+            cube = self.build_aggregate_cube()
+            return cube[cube['Type'] == 'expense'].groupby('Category', observed=True)['Amount'].sum().abs().sort_values(ascending=False)
+        
+        return self._derived_value('category_totals', build)
+    
+    def calculate_type_totals(self, month: Optional[pd.Period] = None) -> Dict[str, float]:
+        """Income and expense totals, optionally for a single month"""
+        cube = self.build_aggregate_cube()
+        if month is not None:
+            cube = cube[cube['Month'] == month]
+        
+        return {
+            'income': float(cube.loc[cube['Type'] == 'income', 'Amount'].sum()),
+            'expense': float(cube.loc[cube['Type'] == 'expense', 'Amount'].sum())
+        }
+    
+    def amount_bounds(self) -> Tuple[float, float]:
+        """Smallest and largest transaction amount"""
+        return self._derived_value(
+            'amount_bounds',
+            lambda: (float(self.transactions_df['Amount'].min()), float(self.transactions_df['Amount'].max()))
+        )
+    
+    def sort_permutation(self, column: str) -> np.ndarray:
+        """Stable ascending argsort of a categorized transaction column"""
+        return self._derived_value(
+            f'sort:{column}',
+            lambda: np.argsort(sort_key(self.categorize_transactions()[column]), kind='stable')
+        )
+    
+    def filter_index(self) -> TransactionFilterIndex:
+        """Category, type and amount index over the categorized transactions"""
+        return self._derived_value('filter_index', lambda: TransactionFilterIndex(self.categorize_transactions()))
+    
+    def search_index(self) -> DescriptionSearchIndex:
+        """Description search index, built with each load and, after an append, on the next search"""
+        return self._derived_value('search_index', lambda: DescriptionSearchIndex(self.transactions_df['Description']))
+    
+    def transaction_page(self, column: str, ascending: bool, page: int, page_size: int,
+                         mask: Optional[np.ndarray] = None) -> Tuple[pd.DataFrame, int]:
+        """One page of categorized transactions in the requested order and the filtered row count"""
+        positions, total = page_positions(self.sort_permutation(column), mask, page, page_size, ascending)
+        return self.categorize_transactions().iloc[positions], total
+    
+    def snapshot_tables(self) -> Dict[str, pd.DataFrame]:
+        """Processed frames and precomputed aggregates that make up a snapshot"""
+        tables = {}
+        
+        if self.transactions_df is not None:
+            transactions = self.categorize_transactions().copy(deep=False)
+            for column in ('Type', 'Category'):
+                transactions[column] = transactions[column].astype('category')
+            tables['transactions'] = transactions
+            tables['cube'] = self.build_aggregate_cube()
+            tables['monthly_summary'] = self.calculate_monthly_summary()
+            tables['category_totals'] = self.calculate_category_totals().rename('Amount').rename_axis('Category').reset_index()
+        
+        if self.net_worth_df is not None:
+            net_worth = self.net_worth_df.copy(deep=False)
+            net_worth['Net_Worth'] = net_worth['Assets'] - net_worth['Liabilities']
+            tables['net_worth'] = net_worth
+        
+        if self.investments_df is not None:
+            tables['investments'] = self.investments_df
+        
+        if self.goals_df is not None:
+            tables['goals'] = self.goals_df
+        
+        if self.trades_df is not None:
+            tables['trades'] = self.trades_df
+        
+        return tables
+    
+    def _snapshot_manifest(self, table_names: List[str]) -> str:
+        return json.dumps({
+            'format': SNAPSHOT_FORMAT,
+            'version': SNAPSHOT_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'tables': table_names
+        })
+    
+    def export_snapshot(self) -> bytes:
+        """Serialize the processed dataset as a ZIP of uncompressed Arrow IPC files"""
+        if pa is None:
+            raise ImportError("pyarrow is required for snapshots")
+        
+        tables = self.snapshot_tables()
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+            for name, df in tables.items():
+                zip_file.writestr(f"{name}.arrow", frame_to_arrow_bytes(df))
+            zip_file.writestr(SNAPSHOT_MANIFEST, self._snapshot_manifest(list(tables)))
+        
+        return zip_buffer.getvalue()
+    
+    def _load_snapshot_zip(self, zip_ref: zipfile.ZipFile) -> LoadResult:
+        if pa is None:
+            return LoadResult(False, "pyarrow is required to load snapshot files")
+        
+        try:
+            manifest = json.loads(zip_ref.read(SNAPSHOT_MANIFEST))
+        except ValueError:
+            return LoadResult(False, f"Snapshot {SNAPSHOT_MANIFEST} is not valid JSON")
+        
+        # Foreign or newer snapshots are refused before any table is read
+        if not isinstance(manifest, dict) or manifest.get('format') != SNAPSHOT_FORMAT:
+            return LoadResult(False, f"{SNAPSHOT_MANIFEST} does not describe a {SNAPSHOT_FORMAT} file")
+        if manifest.get('version') != SNAPSHOT_VERSION:
+            return LoadResult(False, f"Snapshot version {manifest.get('version')} is not supported (expected "
+                                     f"{SNAPSHOT_VERSION}); export it again or upload the CSV files")
+        names = manifest.get('tables')
+        if not isinstance(names, list) or 'transactions' not in names:
+            return LoadResult(False, "Snapshot does not list a transactions table")
+        missing = [name for name in names if f"{name}.arrow" not in zip_ref.namelist()]
+        if missing:
+            return LoadResult(False, f"Snapshot is missing tables: {', '.join(missing)}")
+        
+        tables = {}
+        for name in names:
+            tables[name] = arrow_source_to_frame(pa.py_buffer(zip_ref.read(f"{name}.arrow")))
+        
+        self._restore_snapshot(tables)
+        self.search_index()
+        return self._load_result(snapshot=True)
+    
+    def _restore_snapshot(self, tables: Dict[str, pd.DataFrame]):
+        # Seed derived results so nothing is recomputed after the reload
+        derived = {}
+        if tables.get('transactions') is not None:
+            derived['categorized'] = tables['transactions']
+            if 'cube' in tables:
+                derived['cube'] = tables['cube']
+            if 'monthly_summary' in tables:
+                derived['monthly_summary'] = tables['monthly_summary']
+            if 'category_totals' in tables:
+                derived['category_totals'] = tables['category_totals'].set_index('Category')['Amount']
+        
+        self._set_dataset(tables, derived)
+    
+    def calculate_cost_basis(self, method: str = 'fifo') -> CostBasis:
+        """Open lots and per-symbol cost basis of the trade log"""
+        return self._derived_value(f"cost_basis:{method}", lambda: cost_basis(self.trades_df, method))
+    
+    def holdings(self, method: str = 'fifo') -> Optional[pd.DataFrame]:
+        """Open lots left by the trade log when there is one, otherwise the investments file"""
+        if self.trades_df is not None:
+            return self.calculate_cost_basis(method).lots
+        return self.investments_df
+    
+    def get_investment_prices(self, symbols: Optional[List[str]] = None,
+                              provider: Optional[PriceProvider] = None, method: str = 'fifo') -> Dict:
+        """Current quotes, by default for every held symbol from the dashboard's provider"""
+        if symbols is None:
+            holdings = self.holdings(method)
+            if holdings is None:
+                return {}
+            symbols = holdings['Symbol'].dropna().astype(str).unique().tolist()
+        return (provider or self.price_provider).get_prices(symbols)
+    
+    def calculate_portfolio_value(self, provider: Optional[PriceProvider] = None, method: str = 'fifo') -> pd.DataFrame:
+        """Calculate portfolio performance"""
+        return self.portfolio_valuation(provider, method)['portfolio']
+    
+    def portfolio_valuation(self, provider: Optional[PriceProvider] = None, method: str = 'fifo') -> Dict:
+        """Holdings at current quotes with their money-weighted returns, cached until the quotes change"""
+        holdings = self.holdings(method)
+        if holdings is None:
+            return {'portfolio': pd.DataFrame(), 'xirr': np.nan, 'symbol_xirr': pd.Series(dtype='float64')}
+        
+        current_prices = self.get_investment_prices(provider=provider, method=method)
+        quotes = tuple(sorted(current_prices.items()))
+        # Returns run up to today, so a valuation from an earlier day is stale even at the same quotes
+        today = datetime.now().date()
+        name = f"valuation:{method}:{today}"
+        valuation = self._derived.get(name)
+        if valuation is None or valuation['quotes'] != quotes:
+            with self._derived_lock, current_perf().stage(f"derive:{name}"):
+                valuation = self._value_holdings(holdings, current_prices, method, today)
+                valuation['quotes'] = quotes
+                self._derived[name] = valuation
+        return valuation
+    
+    def _value_holdings(self, holdings: pd.DataFrame, current_prices: Dict, method: str, current_date: date) -> Dict:
+        portfolio = holdings.copy()
+        
+        # Holdings without a quote stay NaN rather than being valued at zero
+        portfolio['Current_Price'] = portfolio['Symbol'].map(current_prices).astype('float64')
+        portfolio['Current_Value'] = portfolio['Shares'] * portfolio['Current_Price']
+        portfolio['Total_Cost'] = portfolio['Shares'] * portfolio['Purchase_Price']
+        portfolio['Gain_Loss'] = portfolio['Current_Value'] - portfolio['Total_Cost']
+        portfolio['Gain_Loss_Pct'] = np.where(portfolio['Total_Cost'] > 0, 
+                                            (portfolio['Gain_Loss'] / portfolio['Total_Cost'] * 100).round(2), 0)
+        
+        # Each holding pays its cost on the purchase date and returns its value today
+        today = np.datetime64(current_date, 'D')
+        purchased = pd.to_datetime(portfolio.get('Purchase_Date', pd.Series(pd.NaT, index=portfolio.index)))
+        rows = np.flatnonzero(portfolio['Current_Value'].notna().to_numpy() & purchased.notna().to_numpy())
+        amounts = np.concatenate([-portfolio['Total_Cost'].to_numpy()[rows], portfolio['Current_Value'].to_numpy()[rows]])
+        dates = np.concatenate([purchased.to_numpy()[rows].astype('datetime64[D]'), np.full(len(rows), today)])
+        groups = np.tile(np.arange(len(rows)), 2)
+        
+        if self.trades_df is not None:
+            # Each symbol and the portfolio use the actual trades plus today's value of what is still held,
+            # leaving out symbols still held without a quote
+            basis = self.calculate_cost_basis(method)
+            value = portfolio.groupby('Symbol', observed=True)['Current_Value'].sum(min_count=1)
+            summary = basis.summary.set_index('Symbol')
+            symbols = summary.index[(summary['Shares'] <= 0) | summary.index.isin(value.dropna().index)]
+            flows = basis.cash_flows[basis.cash_flows['Symbol'].isin(symbols)]
+            held = value.reindex(symbols).dropna()
+            symbol_amounts = np.concatenate([flows['Amount'].to_numpy(), held.to_numpy()])
+            symbol_dates = np.concatenate([flows['Date'].to_numpy().astype('datetime64[D]'), np.full(len(held), today)])
+            symbol_groups = symbols.get_indexer(np.concatenate([flows['Symbol'].to_numpy(), held.index.to_numpy()]))
+            portfolio_amounts, portfolio_dates = symbol_amounts, symbol_dates
+        else:
+            symbols = pd.Index([])
+            symbol_amounts = np.array([])
+            symbol_dates = np.array([], dtype='datetime64[D]')
+            symbol_groups = np.array([], dtype=np.int64)
+            portfolio_amounts, portfolio_dates = amounts, dates
+        
+        # Holdings, symbols and the whole portfolio are solved in one pass, the portfolio as the last group
+        n_groups = len(rows) + len(symbols) + 1
+        rates = xirr(
+            np.concatenate([amounts, symbol_amounts, portfolio_amounts]),
+            np.concatenate([dates, symbol_dates, portfolio_dates]),
+            np.concatenate([groups, len(rows) + symbol_groups, np.full(len(portfolio_amounts), n_groups - 1)]),
+            n_groups
+        )
+        
+        portfolio['XIRR_Pct'] = np.nan
+        portfolio.iloc[rows, portfolio.columns.get_loc('XIRR_Pct')] = (rates[:len(rows)] * 100).round(2)
+        return {
+            'portfolio': portfolio,
+            'xirr': rates[-1],
+            'symbol_xirr': pd.Series(rates[len(rows):-1], index=symbols, dtype='float64'),
+        }
+    
+    def positions(self) -> Optional[pd.DataFrame]:
+        """Dated share changes and money invested, from every trade in the trade log when there is one,
+        otherwise from the purchases in the investments file"""
+        if self.trades_df is None and self.investments_df is None:
+            return None
+        
+        def build():
+            if self.trades_df is not None:
+                # Filled shares do not depend on how sells are matched to lots, so any method will do
+                flows = self.calculate_cost_basis().cash_flows
+                return pd.DataFrame({
+                    'Symbol': flows['Symbol'],
+                    'Date': pd.to_datetime(flows['Date']),
+                    'Shares': flows['Shares'],
+                    'Invested': -flows['Amount'],
+                })
+            # Purchase_Date is optional, holdings without one count from the start of the price history
+            investments = self.investments_df.reindex(columns=['Symbol', 'Shares', 'Purchase_Price', 'Purchase_Date'])
+            return pd.DataFrame({
+                'Symbol': investments['Symbol'],
+                'Date': pd.to_datetime(investments['Purchase_Date']),
+                'Shares': investments['Shares'],
+                'Invested': investments['Shares'] * investments['Purchase_Price'],
+            })
+        
+        return self._derived_value('positions', build)
+    
+    def positions_key(self) -> str:
+        """Hash of the position changes that the portfolio value history depends on"""
+        def build():
+            positions = self.positions().reindex(columns=POSITION_COLUMNS)
+            return f"{int(pd.util.hash_pandas_object(positions, index=False).sum()):x}"
+        
+        return self._derived_value('positions_key', build)
+    
+    def portfolio_history(self, store: PriceHistoryStore, start=None, end=None) -> pd.DataFrame:
+        """Daily portfolio value from the price history, cached per position changes and date range"""
+        positions = self.positions()
+        if positions is None:
+            return pd.DataFrame()
+        
+        if start is None:
+            start = positions['Date'].min()
+        start = store.start if start is None or pd.isna(start) else max(np.datetime64(pd.Timestamp(start), 'D'), store.start)
+        end = store.end if end is None else min(np.datetime64(pd.Timestamp(end), 'D'), store.end)
+        
+        def build():
+            return portfolio_value_series(positions.reindex(columns=POSITION_COLUMNS), store, start, end)
+        
+        key = f"portfolio_history:{self.positions_key()}:{store.version}:{start}:{end}"
+        return self._derived_value(key, build)
+    
+    def calculate_goal_progress(self, n_paths: int = GOAL_SIMULATION_PATHS, workers: int = 1) -> pd.DataFrame:
+        """Calculate goal progress with simulated chances of reaching each goal"""
+        if self.goals_df is None:
+            return pd.DataFrame()
+        
+        current_date = datetime.now()
+        
+        def build():
+            goals = self.goals_df.copy()
+            
+            goals['Progress_Pct'] = np.where(goals['Target_Amount'] > 0,
+                                           (goals['Current_Amount'] / goals['Target_Amount'] * 100).round(2), 0)
+            
+            goals['Days_Remaining'] = (goals['Target_Date'] - current_date).dt.days
+            
+            goals['Required_Monthly_Savings'] = np.where(
+                goals['Days_Remaining'] > 0,
+                (goals['Target_Amount'] - goals['Current_Amount']) / (goals['Days_Remaining'] / DAYS_PER_MONTH),
+                0
+            ).round(2)
+            
+            return self._project_goals(goals, current_date, n_paths, workers)
+        
+        # Days remaining change daily, so the date is part of the key
+        return self._derived_value(f"goal_progress:{n_paths}:{current_date.date()}", build)
+    
+    def _project_goals(self, goals: pd.DataFrame, current_date: datetime, n_paths: int, workers: int) -> pd.DataFrame:
+        goals['Success_Probability'] = np.nan
+        for percentile in GOAL_COMPLETION_PERCENTILES:
+            goals[f"Completion_P{percentile}"] = pd.NaT
+        
+        # The month in progress is left out, its cash flow is still incomplete
+        monthly = self.calculate_monthly_summary()
+        if not monthly.empty:
+            monthly = monthly[monthly['Month'] < pd.Period(current_date, 'M')]
+        monthly_flows = monthly['net_cash_flow'].to_numpy(dtype=np.float64) if not monthly.empty else np.array([])
+        goals.attrs['history_months'] = len(monthly_flows)
+        goals.attrs['simulation_paths'] = n_paths
+        if len(monthly_flows) == 0:
+            return goals
+        
+        # Savings fund open goals one at a time in target date order, so each goal
+        # is reached once savings cover it and every goal due before it
+        remaining = (goals['Target_Amount'] - goals['Current_Amount']).clip(lower=0).fillna(0).to_numpy()
+        order = np.argsort(goals['Target_Date'].to_numpy(), kind='stable')
+        needs = np.empty(len(goals))
+        needs[order] = np.cumsum(remaining[order])
+        open_goals = remaining > 0
+        
+        months_left = goals['Days_Remaining'].to_numpy(dtype=np.float64) / DAYS_PER_MONTH
+        horizon = int(np.clip(2 * np.nanmax(months_left, initial=0), GOAL_SIMULATION_MIN_MONTHS, GOAL_SIMULATION_MAX_MONTHS))
+        months = simulate_goals(monthly_flows, needs[open_goals], horizon, n_paths, workers=workers)
+        
+        probability = np.full(len(goals), 100.0)
+        probability[open_goals] = (months <= months_left[open_goals]).mean(axis=0) * 100
+        goals['Success_Probability'] = probability.round(1)
+        
+        today = pd.Timestamp(current_date).normalize()
+        for percentile, completion in zip(GOAL_COMPLETION_PERCENTILES,
+                                          np.percentile(months, GOAL_COMPLETION_PERCENTILES, axis=0, method='higher')):
+            dates = np.full(len(goals), today, dtype='datetime64[ns]')
+            dates[open_goals] = np.where(
+                completion <= horizon,
+                (today + pd.to_timedelta(completion * DAYS_PER_MONTH, unit='D')).normalize(),
+                np.datetime64('NaT')
+            )
+            goals[f"Completion_P{percentile}"] = dates
+        
+        return goals
+
+# Ingest cache limits (parsed datasets are shared across reruns and sessions)
+INGEST_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+INGEST_CACHE_MAX_ENTRIES = 8
+
+class IngestCache:
+    """LRU cache of loaded dashboards keyed on a hash of the uploaded bytes
+
+    The byte budget covers each dashboard's frames and derived results. Derived
+    results keep growing as views are opened, so an entry is measured again
+    whenever it is read.
+    """
+    
+    def __init__(self, max_bytes: int = INGEST_CACHE_MAX_BYTES, max_entries: int = INGEST_CACHE_MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """Content digest of a single upload"""
+        return hashlib.sha256(data).hexdigest()
+    
+    @staticmethod
+    def make_key(kind: str, *digests: Optional[str]) -> str:
+        """Combine the upload kind and per-file digests into a cache key"""
+        parts = [kind] + [digest if digest is not None else '-' for digest in digests]
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional['FinanceDashboard']:
+        """Return the cached dashboard for a key and mark it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+        
+        dashboard = entry[0]
+        self._store(key, dashboard, dashboard.cached_bytes())
+        return dashboard
+    
+    def put(self, key: str, dashboard: 'FinanceDashboard'):
+        """Store a loaded dashboard, evicting least recently used entries over the limits"""
+        self._store(key, dashboard, dashboard.cached_bytes())
+    
+    def _store(self, key: str, dashboard: 'FinanceDashboard', nbytes: int):
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (dashboard, nbytes)
+            self._total_bytes += nbytes
+            
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_bytes
+    
+    def stats(self) -> Dict:
+        """Current number of entries and bytes held"""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._total_bytes}
+
+def new_spill_path() -> str:
+    """Temporary Arrow file for rows spilled during streaming ingest"""
+    spill_dir = os.path.join(tempfile.gettempdir(), 'finance_dashboard')
+    os.makedirs(spill_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix='.arrow', dir=spill_dir)
+    os.close(fd)
+    return path
+
+def remove_file(path: str):
+    """Delete a file if it can be, e.g. once nothing maps it any more"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -7,15 +7,14 @@ import numpy as np
 from datetime import datetime, timedelta
 import zipfile
 import io
-from typing import Dict, List, Tuple
+import os
+from typing import Dict, List, Optional, Tuple
 import base64
 
-# Configure Streamlit page
-st.set_page_config(
-    page_title="Personal Finance Dashboard",
-    page_icon="💰",
-    layout="wide",
-    initial_sidebar_state="expanded"
+from finance_engine import (
+    AMOUNT_DTYPES, ARROW_AVAILABLE, COST_BASIS_METHODS, MERCHANT_STORE_PATH, PERF_LOG_ENV, PRICE_HISTORY_PATH, QUOTE_CACHE_DIR,
+    CachedPriceProvider, FinanceDashboard, HttpPriceProvider, IngestCache, MerchantCategoryStore, PriceHistoryStore,
+    combine_masks, current_perf, downsample_frame, filter_cube, start_perf
 )
 
 # Custom CSS for beautiful styling
@@ -257,179 +256,59 @@ def load_custom_css():
     </style>
     """, unsafe_allow_html=True)
 
-class FinanceDashboard:
-    def __init__(self):
-        self.transactions_df = None
-        self.net_worth_df = None
-        self.investments_df = None
-        self.goals_df = None
-        
-    def load_from_zip(self, zip_file):
-        """Load data from uploaded ZIP file"""
-        try:
-            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                file_names = zip_ref.namelist()
-                
-                # Required file names (case insensitive)
-                required_files = {
-                    'transactions.csv': None,
-                    'net_worth.csv': None,
-                    'investments.csv': None,
-                    'goals.csv': None
-                }
-                
-                # Find matching files
-                for file_name in file_names:
-                    lower_name = file_name.lower()
-                    if lower_name in required_files:
-                        required_files[lower_name] = file_name
-                
-                # Load transactions (required)
-                if required_files['transactions.csv']:
-                    with zip_ref.open(required_files['transactions.csv']) as f:
-                        self.transactions_df = pd.read_csv(f)
-                        self.transactions_df['Date'] = pd.to_datetime(self.transactions_df['Date'])
-                        self.transactions_df['Month'] = self.transactions_df['Date'].dt.to_period('M')
-                else:
-                    st.error("❌ Missing required file: transactions.csv")
-                    return False
-                
-                # Load optional files
-                if required_files['net_worth.csv']:
-                    with zip_ref.open(required_files['net_worth.csv']) as f:
-                        self.net_worth_df = pd.read_csv(f)
-                        self.net_worth_df['Date'] = pd.to_datetime(self.net_worth_df['Date'])
-                
-                if required_files['investments.csv']:
-                    with zip_ref.open(required_files['investments.csv']) as f:
-                        self.investments_df = pd.read_csv(f)
-                
-                if required_files['goals.csv']:
-                    with zip_ref.open(required_files['goals.csv']) as f:
-                        self.goals_df = pd.read_csv(f)
-                        self.goals_df['Target_Date'] = pd.to_datetime(self.goals_df['Target_Date'])
-                
-                return True
-                
-        except Exception as e:
-            st.error(f"❌ Error loading ZIP file: {str(e)}")
-            return False
-    
-    def categorize_transactions(self) -> pd.DataFrame:
-        """Categorize transactions with enhanced mapping"""
-        if self.transactions_df is None:
-            return pd.DataFrame()
-        
-        # Add Category column if it doesn't exist
-        if 'Category' not in self.transactions_df.columns:
-            self.transactions_df['Category'] = 'other'
-        
-        # Enhanced category mapping
-        category_mapping = {
-            'grocery': ['grocery', 'supermarket', 'food', 'walmart', 'target', 'kroger', 'safeway', 'publix', 
-                       'whole foods', 'trader joe', 'costco', 'fresh market', 'harris teeter', 'wegmans', 'sprouts'],
-            'dining': ['restaurant', 'cafe', 'pizza', 'starbucks', 'mcdonald', 'subway', 'chipotle', 'taco bell',
-                      'burger', 'kfc', 'dunkin', 'panera', 'olive garden', 'red lobster', 'five guys', 'domino'],
-            'transportation': ['gas station', 'uber', 'lyft', 'metro', 'parking', 'taxi', 'bus', 'train', 'fuel',
-                             'shell', 'exxon', 'bp', 'chevron', 'marathon', 'texaco', 'mobil', 'airport'],
-            'utilities': ['electric', 'gas', 'water', 'internet', 'phone', 'cable', 'insurance', 'utility',
-                         'verizon', 'at&t', 'comcast', 'spectrum'],
-            'entertainment': ['movie', 'netflix', 'spotify', 'amazon prime', 'hulu', 'disney', 'hbo', 'theater',
-                            'concert', 'game', 'youtube', 'paramount', 'apple music', 'steam'],
-            'healthcare': ['hospital', 'pharmacy', 'doctor', 'medical', 'dentist', 'cvs', 'walgreens', 'clinic',
-                          'urgent care', 'prescription'],
-            'shopping': ['amazon', 'ebay', 'mall', 'clothing', 'electronics', 'best buy', 'apple store', 'nike',
-                        'adidas', 'macy', 'target', 'home depot', 'rei', 'gamestop'],
-            'salary': ['salary', 'paycheck', 'wages', 'income', 'bonus', 'freelance', 'consulting'],
-            'investment': ['dividend', 'interest', 'capital gains', 'stock', 'bond', 'mutual fund', 'reit']
-        }
-        
-        def auto_categorize(description):
-            if pd.isna(description):
-                return 'other'
-            description_lower = str(description).lower()
-            for category, keywords in category_mapping.items():
-                if any(keyword in description_lower for keyword in keywords):
-                    return category
-            return 'other'
-        
-        # Apply auto-categorization
-        mask = (self.transactions_df['Category'].isna()) | (self.transactions_df['Category'] == 'other')
-        self.transactions_df.loc[mask, 'Category'] = self.transactions_df.loc[mask, 'Description'].apply(auto_categorize)
-        
-        return self.transactions_df
-    
-    def calculate_monthly_summary(self) -> pd.DataFrame:
-        """Calculate monthly income and expenses"""
-        if self.transactions_df is None:
-            return pd.DataFrame()
-        
-        monthly_summary = self.transactions_df.groupby(['Month', 'Type']).agg({
-            'Amount': 'sum'
-        }).unstack(fill_value=0).round(2)
-        
-        monthly_summary.columns = monthly_summary.columns.droplevel(0)
-        monthly_summary = monthly_summary.reset_index()
-        
-        # Ensure both income and expense columns exist
-        if 'income' not in monthly_summary.columns:
-            monthly_summary['income'] = 0
-        if 'expense' not in monthly_summary.columns:
-            monthly_summary['expense'] = 0
-        
-        monthly_summary['net_cash_flow'] = monthly_summary['income'] + monthly_summary['expense']
-        monthly_summary['Month_str'] = monthly_summary['Month'].astype(str)
-        
-        return monthly_summary
-    
-    def get_investment_prices(self) -> Dict:
-        """Get simulated investment prices"""
-        mock_prices = {
-            'AAPL': 175.50, 'GOOGL': 142.30, 'MSFT': 378.85, 'TSLA': 248.42,
-            'SPY': 445.67, 'VTI': 235.89, 'NVDA': 455.30, 'AMZN': 155.80,
-            'META': 325.40, 'BRK.B': 380.25, 'VOO': 425.60, 'QQQ': 385.90,
-            'JNJ': 160.25, 'PG': 148.70, 'KO': 64.15, 'DIS': 92.40,
-            'V': 252.80, 'JPM': 168.90, 'UNH': 492.15, 'HD': 328.60
-        }
-        return mock_prices
-    
-    def calculate_portfolio_value(self) -> pd.DataFrame:
-        """Calculate portfolio performance"""
-        if self.investments_df is None:
-            return pd.DataFrame()
-        
-        current_prices = self.get_investment_prices()
-        portfolio = self.investments_df.copy()
-        
-        portfolio['Current_Price'] = portfolio['Symbol'].map(current_prices).fillna(0)
-        portfolio['Current_Value'] = portfolio['Shares'] * portfolio['Current_Price']
-        portfolio['Total_Cost'] = portfolio['Shares'] * portfolio['Purchase_Price']
-        portfolio['Gain_Loss'] = portfolio['Current_Value'] - portfolio['Total_Cost']
-        portfolio['Gain_Loss_Pct'] = np.where(portfolio['Total_Cost'] > 0, 
-                                            (portfolio['Gain_Loss'] / portfolio['Total_Cost'] * 100).round(2), 0)
-        
-        return portfolio
-    
-    def calculate_goal_progress(self) -> pd.DataFrame:
-        """Calculate goal progress"""
-        if self.goals_df is None:
-            return pd.DataFrame()
-        
-        goals = self.goals_df.copy()
-        current_date = datetime.now()
-        
-        goals['Progress_Pct'] = np.where(goals['Target_Amount'] > 0,
-                                       (goals['Current_Amount'] / goals['Target_Amount'] * 100).round(2), 0)
-        
-        goals['Days_Remaining'] = (goals['Target_Date'] - current_date).dt.days
-        
-        goals['Required_Monthly_Savings'] = np.where(
-            goals['Days_Remaining'] > 0,
-            (goals['Target_Amount'] - goals['Current_Amount']) / (goals['Days_Remaining'] / 30.44),
-            0
-        ).round(2)
-        
-        return goals
+
+@st.cache_resource
+def get_ingest_cache() -> IngestCache:
+    """Process-wide ingest cache that survives script reruns"""
+    return IngestCache()
+
+@st.cache_resource
+def get_merchant_store(path: str) -> MerchantCategoryStore:
+    """Persistent merchant table shared by all sessions"""
+    return MerchantCategoryStore(path)
+
+# Default quote service URL; without one the offline sample prices are used
+QUOTES_URL_ENV = 'FPTI_QUOTES_URL'
+
+@st.cache_resource
+def get_price_provider(quotes_url: str, cache_dir: Optional[str]) -> CachedPriceProvider:
+    """Quote cache for a service shared by all sessions and, when saved to disk, other processes"""
+    return CachedPriceProvider(HttpPriceProvider(quotes_url), cache_dir=cache_dir)
+
+def selected_price_provider() -> Optional[CachedPriceProvider]:
+    """Provider for the quote service chosen in the sidebar, or None for sample prices"""
+    quotes_url = st.session_state.get('quotes_url', '').strip()
+    if not quotes_url:
+        return None
+    return get_price_provider(quotes_url, QUOTE_CACHE_DIR if st.session_state.get('save_quotes') else None)
+
+@st.cache_resource(max_entries=2)
+def get_price_history(path: str, modified: float) -> Optional[PriceHistoryStore]:
+    """Memory-mapped price history shared by all sessions"""
+    return PriceHistoryStore.open(path)
+
+def current_price_history() -> Optional[PriceHistoryStore]:
+    """Price history store, mapped again whenever it has been rebuilt"""
+    try:
+        modified = os.path.getmtime(os.path.join(PRICE_HISTORY_PATH, 'meta.json'))
+    except OSError:
+        return None
+    return get_price_history(PRICE_HISTORY_PATH, modified)
+
+def get_upload_digest(uploaded_file) -> Optional[str]:
+    """Content digest of an uploaded file, computed once per upload"""
+    if uploaded_file is None:
+        return None
+    
+    digests = st.session_state.setdefault('upload_digests', {})
+    file_id = getattr(uploaded_file, 'file_id', None)
+    if file_id is not None and file_id in digests:
+        return digests[file_id]
+    
+    digest = IngestCache.hash_bytes(uploaded_file.getvalue())
+    if file_id is not None:
+        digests[file_id] = digest
+    return digest
 
 def create_sample_zip():
     """Create downloadable sample ZIP file"""
@@ -494,12 +373,12 @@ def show_upload_interface():
         zip_file = st.file_uploader(
             "Choose ZIP file",
             type=['zip'],
-            help="Upload a ZIP file containing: transactions.csv (required), net_worth.csv, investments.csv, goals.csv",
+            help="Upload a ZIP file containing: transactions.csv (required), net_worth.csv, investments.csv, goals.csv, trades.csv",
             key="zip_upload"
         )
         
         if zip_file:
-            return 'zip', zip_file, None, None, None
+            return 'zip', zip_file, None, None, None, None
     
     with col2:
         st.subheader("📄 Individual File Upload")
@@ -533,10 +412,17 @@ def show_upload_interface():
             key="goals_upload"
         )
         
+        trades_file = st.file_uploader(
+            "🧾 Trades CSV (Optional)",
+            type=['csv'],
+            help="Required: Date, Symbol, Shares (negative for sells), Price columns",
+            key="trades_upload"
+        )
+        
         if transactions_file:
-            return 'individual', transactions_file, net_worth_file, investments_file, goals_file
+            return 'individual', transactions_file, net_worth_file, investments_file, goals_file, trades_file
     
-    return None, None, None, None, None
+    return None, None, None, None, None, None
 
 def show_file_requirements():
     """Show detailed file requirements"""
@@ -550,7 +436,8 @@ financial_data.zip
 ├── transactions.csv    (REQUIRED)
 ├── net_worth.csv      (optional)  
 ├── investments.csv    (optional)
-└── goals.csv          (optional)
+├── goals.csv          (optional)
+└── trades.csv         (optional)
         """)
         
         st.markdown("### 📊 File Formats")
@@ -589,13 +476,24 @@ Emergency Fund,15000,8500,2025-12-31
 House Down Payment,50000,15000,2026-06-30
         """)
         
+        # Trades format
+        st.markdown("#### 5. trades.csv (Optional)")
+        st.code("""
+Date,Symbol,Shares,Price
+2023-03-01,AAPL,40,148.20
+2024-05-15,AAPL,-15,182.40
+        """)
+        st.markdown("**Positive shares are buys, negative are sells.** When present, holdings come from the "
+                    "open lots of this trade log instead of investments.csv")
+        
         st.markdown("### 💡 **Tips for Success**")
         st.markdown("""
-        - **File names must be exact:** transactions.csv, net_worth.csv, investments.csv, goals.csv
+        - **File names must be exact:** transactions.csv, net_worth.csv, investments.csv, goals.csv, trades.csv
         - **Date format:** YYYY-MM-DD preferred (but flexible)
         - **Amount format:** Positive for income, negative for expenses
         - **No empty rows** in the middle of your data
         - **UTF-8 encoding** recommended for special characters
+        - **Snapshots:** a snapshot ZIP exported from the sidebar can be uploaded in place of the CSV ZIP
         """)
 
 def show_sample_download():
@@ -628,26 +526,79 @@ def show_sample_download():
         4. Re-zip and upload to the dashboard
         """)
 
+# Display formats rendered by the table widget, so frames stay numeric
+DISPLAY_FORMATS = {
+    'money': 'dollar',
+    'whole_money': '$%,.0f',
+    'percent': '%.1f%%',
+    'date': 'YYYY-MM-DD',
+}
+
+def display_column_config(formats: Dict[str, str], labels: Optional[Dict[str, str]] = None) -> Dict:
+    """Build column configs from a column -> display format mapping"""
+    labels = labels or {}
+    config = {}
+    for column, kind in formats.items():
+        if kind == 'date':
+            config[column] = st.column_config.DateColumn(labels.get(column), format=DISPLAY_FORMATS[kind])
+        else:
+            config[column] = st.column_config.NumberColumn(labels.get(column), format=DISPLAY_FORMATS[kind])
+    for column, label in labels.items():
+        config.setdefault(column, label)
+    return config
+
+def show_formatted_table(df: pd.DataFrame, formats: Dict[str, str], columns: Optional[List[str]] = None,
+                         labels: Optional[Dict[str, str]] = None, **kwargs):
+    """Render a numeric frame with formatting applied client-side"""
+    st.dataframe(
+        df,
+        column_config=display_column_config(formats, labels),
+        column_order=columns,
+        use_container_width=True,
+        **kwargs
+    )
+
+def show_chart(figure):
+    """Render a Plotly figure, recording its payload size while profiling"""
+    perf = current_perf()
+    if perf.enabled:
+        perf.count('charts')
+        perf.count('chart_payload_bytes', len(figure.to_json()))
+    st.plotly_chart(figure, use_container_width=True)
+
+DEFAULT_CHART_WIDTH_PX = 1200
+
+def chart_series(df: pd.DataFrame, x_column: Optional[str], y_columns: List[str], key: str,
+                 width_fraction: float = 1.0) -> Tuple[pd.DataFrame, Tuple]:
+    """Zoom and downsample a series to about one point per pixel, with the view inputs used"""
+    budget = max(3, int(st.session_state.get('chart_width_px', DEFAULT_CHART_WIDTH_PX) * width_fraction))
+    if len(df) <= budget:
+        return df, (budget, None)
+    
+    zoom = None    
+    if x_column is not None and pd.api.types.is_datetime64_any_dtype(df[x_column]):
+        if not df[x_column].is_monotonic_increasing:
+            df = df.sort_values(x_column)
+        dates = df[x_column]
+        first, last = dates.iloc[0].date(), dates.iloc[-1].date()
+        zoom = st.slider("Zoom", min_value=first, max_value=last, value=(first, last), key=key)
+        start, stop = np.searchsorted(dates.to_numpy(), np.array([zoom[0], zoom[1] + timedelta(days=1)], dtype='datetime64[ns]'))
+        df = df.iloc[start:stop]
+    
+    sampled = downsample_frame(df, x_column, y_columns, budget)
+    if len(sampled) < len(df):
+        st.caption(f"Showing {len(sampled):,} of {len(df):,} points, zoom in for full detail")
+    return sampled, (budget, zoom)
+
 def create_beautiful_metrics(dashboard):
     """Create beautiful metric cards"""
     if dashboard.transactions_df is None:
         return
     
     # Calculate metrics
-    current_month = datetime.now().month
-    current_year = datetime.now().year
-    
-    monthly_income = dashboard.transactions_df[
-        (dashboard.transactions_df['Type'] == 'income') & 
-        (dashboard.transactions_df['Date'].dt.month == current_month) &
-        (dashboard.transactions_df['Date'].dt.year == current_year)
-    ]['Amount'].sum()
-    
-    monthly_expenses = abs(dashboard.transactions_df[
-        (dashboard.transactions_df['Type'] == 'expense') & 
-        (dashboard.transactions_df['Date'].dt.month == current_month) &
-        (dashboard.transactions_df['Date'].dt.year == current_year)
-    ]['Amount'].sum())
+    current_totals = dashboard.calculate_type_totals(month=pd.Period(datetime.now(), 'M'))
+    monthly_income = current_totals['income']
+    monthly_expenses = abs(current_totals['expense'])
     
     net_flow = monthly_income - monthly_expenses
     
@@ -687,29 +638,31 @@ def create_enhanced_charts(dashboard):
         st.subheader("💸 Expense Breakdown")
         
         if dashboard.transactions_df is not None:
-            expense_data = dashboard.transactions_df[
-                dashboard.transactions_df['Type'] == 'expense'
-            ].groupby('Category')['Amount'].sum().abs().sort_values(ascending=False)
+            expense_data = dashboard.calculate_category_totals()
             
             if not expense_data.empty:
-                fig_pie = px.pie(
-                    values=expense_data.values, 
-                    names=expense_data.index,
-                    title="",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                fig_pie.update_traces(
-                    textposition='inside', 
-                    textinfo='percent+label',
-                    hovertemplate='<b>%{label}</b><br>Amount: $%{value:,.0f}<br>Percentage: %{percent}<extra></extra>'
-                )
-                fig_pie.update_layout(
-                    showlegend=True,
-                    legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.02),
-                    margin=dict(t=0, b=0, l=0, r=0),
-                    height=400
-                )
-                st.plotly_chart(fig_pie, use_container_width=True)
+                def build_expense_pie():
+                    fig_pie = px.pie(
+                        values=expense_data.values, 
+                        names=expense_data.index,
+                        title="",
+                        color_discrete_sequence=px.colors.qualitative.Set3
+                    )
+                    fig_pie.update_traces(
+                        textposition='inside', 
+                        textinfo='percent+label',
+                        hovertemplate='<b>%{label}</b><br>Amount: $%{value:,.0f}<br>Percentage: %{percent}<extra></extra>'
+                    )
+                    fig_pie.update_layout(
+                        showlegend=True,
+                        legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.02),
+                        margin=dict(t=0, b=0, l=0, r=0),
+                        height=400
+                    )
+                    return fig_pie
+                
+                fig_pie = dashboard.cached_figure('expense_pie', (), build_expense_pie)
+                show_chart(fig_pie)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
@@ -719,77 +672,88 @@ def create_enhanced_charts(dashboard):
         if dashboard.transactions_df is not None:
             monthly_summary = dashboard.calculate_monthly_summary()
             if not monthly_summary.empty:
-                fig_cashflow = go.Figure()
-                
-                fig_cashflow.add_trace(go.Scatter(
-                    x=monthly_summary['Month_str'],
-                    y=monthly_summary['income'],
-                    mode='lines+markers',
-                    name='Income',
-                    line=dict(color='#10b981', width=3),
-                    marker=dict(size=8),
-                    hovertemplate='<b>Income</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
-                ))
-                
-                fig_cashflow.add_trace(go.Scatter(
-                    x=monthly_summary['Month_str'],
-                    y=monthly_summary['expense'].abs(),
-                    mode='lines+markers',
-                    name='Expenses',
-                    line=dict(color='#ef4444', width=3),
-                    marker=dict(size=8),
-                    hovertemplate='<b>Expenses</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
-                ))
+                monthly_summary, cashflow_view = chart_series(monthly_summary, None, ['income', 'expense'],
+                                               key="overview_cashflow_zoom", width_fraction=0.5)
+                def build_cashflow_trend():
+                    fig_cashflow = go.Figure()
+                    
+                    fig_cashflow.add_trace(go.Scatter(
+                        x=monthly_summary['Month_str'],
+                        y=monthly_summary['income'],
+                        mode='lines+markers',
+                        name='Income',
+                        line=dict(color='#10b981', width=3),
+                        marker=dict(size=8),
+                        hovertemplate='<b>Income</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+                    ))
+                    
+                    fig_cashflow.add_trace(go.Scatter(
+                        x=monthly_summary['Month_str'],
+                        y=monthly_summary['expense'].abs(),
+                        mode='lines+markers',
+                        name='Expenses',
+                        line=dict(color='#ef4444', width=3),
+                        marker=dict(size=8),
+                        hovertemplate='<b>Expenses</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+                    ))
+                    
+                    fig_cashflow.update_layout(
+                        title="",
+                        xaxis_title="Month",
+                        yaxis_title="Amount ($)",
+                        hovermode='x unified',
+                        margin=dict(t=0, b=0, l=0, r=0),
+                        height=400,
+                        showlegend=True,
+                        legend=dict(yanchor="top", y=0.99, xanchor="left", x=0.01)
+                    )
+                    return fig_cashflow
                 
-                fig_cashflow.update_layout(
-                    title="",
-                    xaxis_title="Month",
-                    yaxis_title="Amount ($)",
-                    hovermode='x unified',
-                    margin=dict(t=0, b=0, l=0, r=0),
-                    height=400,
-                    showlegend=True,
-                    legend=dict(yanchor="top", y=0.99, xanchor="left", x=0.01)
-                )
-                
-                st.plotly_chart(fig_cashflow, use_container_width=True)
+                fig_cashflow = dashboard.cached_figure('cashflow_trend', cashflow_view, build_cashflow_trend)
+                show_chart(fig_cashflow)
         st.markdown('</div>', unsafe_allow_html=True)
 
-def show_dashboard_content(dashboard):
+def show_dashboard_content(dashboard, lazy_tabs: bool = True):
     """Show the main dashboard content"""
+    perf = current_perf()
+    
     # Beautiful metrics
-    create_beautiful_metrics(dashboard)
+    with perf.stage("render:metrics"):
+        create_beautiful_metrics(dashboard)
     
     st.markdown("---")
     
     # Enhanced charts
-    create_enhanced_charts(dashboard)
+    with perf.stage("render:overview_charts"):
+        create_enhanced_charts(dashboard)
     
     # Navigation tabs
     st.markdown("---")
     
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "💳 Transactions", 
-        "💰 Cash Flow", 
-        "📈 Investments", 
-        "💎 Net Worth", 
-        "🎯 Goals"
-    ])
-    
-    with tab1:
-        show_transactions_tab(dashboard)
-    
-    with tab2:
-        show_cash_flow_tab(dashboard)
-    
-    with tab3:
-        show_investments_tab(dashboard)
-    
-    with tab4:
-        show_net_worth_tab(dashboard)
+    sections = {
+        "💳 Transactions": show_transactions_tab,
+        "💰 Cash Flow": show_cash_flow_tab,
+        "📈 Investments": show_investments_tab,
+        "💎 Net Worth": show_net_worth_tab,
+        "🎯 Goals": show_goals_tab
+    }
     
-    with tab5:
-        show_goals_tab(dashboard)
+    if lazy_tabs:
+        # Only the selected section computes and ships its figures
+        selected_section = st.radio(
+            "Section",
+            list(sections),
+            horizontal=True,
+            label_visibility="collapsed",
+            key="overview_section"
+        )
+        with perf.stage(f"render:{sections[selected_section].__name__}"):
+            sections[selected_section](dashboard)
+    else:
+        tabs = st.tabs(list(sections))
+        for tab, show_section in zip(tabs, sections.values()):
+            with tab, perf.stage(f"render:{show_section.__name__}"):
+                show_section(dashboard)
 
 def show_transactions_tab(dashboard):
     """Enhanced transactions analysis tab"""
@@ -799,14 +763,16 @@ def show_transactions_tab(dashboard):
     
     # Categorize transactions
     categorized_df = dashboard.categorize_transactions()
+    cube = dashboard.build_aggregate_cube()
     
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)
     
+    totals = dashboard.calculate_type_totals()
     total_transactions = len(categorized_df)
-    date_range_days = (categorized_df['Date'].max() - categorized_df['Date'].min()).days
-    total_income = categorized_df[categorized_df['Type'] == 'income']['Amount'].sum()
-    total_expenses = abs(categorized_df[categorized_df['Type'] == 'expense']['Amount'].sum())
+    date_range_days = (cube['Date'].max() - cube['Date'].min()).days if not cube.empty else 0
+    total_income = totals['income']
+    total_expenses = abs(totals['expense'])
     
     with col1:
         st.metric("Total Transactions", f"{total_transactions:,}")
@@ -820,107 +786,157 @@ def show_transactions_tab(dashboard):
     st.markdown("---")
     
     # Interactive filters
+    search_query = st.text_input(
+        "Search descriptions",
+        placeholder="e.g. amazon, uber*",
+        help="Every term must match. Terms match anywhere in the description; "
+             "terms shorter than 3 characters or ending in * match the start of a word.",
+        key="trans_search"
+    )
+    
     col1, col2, col3 = st.columns(3)
     
+    category_options = sorted(cube['Category'].unique())
+    type_options = list(cube['Type'].unique())
+    amount_min, amount_max = dashboard.amount_bounds()
+    
     with col1:
         selected_categories = st.multiselect(
             "Filter by Category",
-            options=sorted(categorized_df['Category'].unique()),
-            default=sorted(categorized_df['Category'].unique()),
+            options=category_options,
+            default=category_options,
             key="trans_cat_filter"
         )
     
     with col2:
         selected_types = st.multiselect(
             "Filter by Type",
-            options=categorized_df['Type'].unique(),
-            default=categorized_df['Type'].unique(),
+            options=type_options,
+            default=type_options,
             key="trans_type_filter"
         )
     
     with col3:
         amount_range = st.slider(
             "Amount Range",
-            min_value=float(categorized_df['Amount'].min()),
-            max_value=float(categorized_df['Amount'].max()),
-            value=(float(categorized_df['Amount'].min()), float(categorized_df['Amount'].max())),
+            min_value=amount_min,
+            max_value=amount_max,
+            value=(amount_min, amount_max),
             key="trans_amount_filter"
         )
     
     # Apply filters
-    filtered_df = categorized_df[
-        (categorized_df['Category'].isin(selected_categories)) &
-        (categorized_df['Type'].isin(selected_types)) &
-        (categorized_df['Amount'] >= amount_range[0]) &
-        (categorized_df['Amount'] <= amount_range[1])
-    ]
+    search_mask = dashboard.search_index().search(search_query) if search_query.strip() else None
+    full_amount_range = amount_range[0] <= amount_min and amount_range[1] >= amount_max and search_mask is None
+    filtered_cube = filter_cube(cube, selected_categories, selected_types)
+    mask = combine_masks(
+        dashboard.filter_index().select(selected_categories, selected_types, amount_range),
+        search_mask
+    )
+    filtered_count = len(categorized_df) if mask is None else int(np.count_nonzero(mask))
+    filter_state = (tuple(selected_categories), tuple(selected_types), tuple(amount_range), search_query)
     
     # Enhanced transaction table
     st.subheader("📊 Transaction Details")
     
-    if not filtered_df.empty:
-        # Format the dataframe for better display
-        display_df = filtered_df.copy()
-        display_df['Amount'] = display_df['Amount'].apply(lambda x: f"${x:,.2f}")
-        display_df['Date'] = display_df['Date'].dt.strftime('%Y-%m-%d')
-        
-        st.dataframe(
-            display_df[['Date', 'Description', 'Amount', 'Type', 'Category']].sort_values('Date', ascending=False),
-            use_container_width=True,
-            height=400
-        )
+    if filtered_count > 0:
+        show_transaction_page(dashboard, mask, filtered_count)
         
-        # Category analysis
+        # Category analysis (the cube answers category/type filters, amount ranges and searches need the rows)
+        if full_amount_range or mask is None:
+            totals_source = filtered_cube
+        else:
+            totals_source = categorized_df[['Date', 'Type', 'Category', 'Amount']].take(np.flatnonzero(mask))
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.subheader("📊 Spending by Category")
-            category_totals = filtered_df[filtered_df['Type'] == 'expense'].groupby('Category')['Amount'].sum().abs().sort_values(ascending=True)
+            category_totals = totals_source[totals_source['Type'] == 'expense'].groupby('Category', observed=True)['Amount'].sum().abs().sort_values(ascending=True)
             
             if not category_totals.empty:
-                fig_bar = px.bar(
-                    x=category_totals.values,
-                    y=category_totals.index,
-                    orientation='h',
-                    title="",
-                    color=category_totals.values,
-                    color_continuous_scale='Viridis'
-                )
-                fig_bar.update_layout(
-                    xaxis_title="Amount ($)",
-                    yaxis_title="Category",
-                    height=400,
-                    coloraxis_showscale=False
-                )
-                st.plotly_chart(fig_bar, use_container_width=True)
+                def build_category_spending():
+                    fig_bar = px.bar(
+                        x=category_totals.values,
+                        y=category_totals.index,
+                        orientation='h',
+                        title="",
+                        color=category_totals.values,
+                        color_continuous_scale='Viridis'
+                    )
+                    fig_bar.update_layout(
+                        xaxis_title="Amount ($)",
+                        yaxis_title="Category",
+                        height=400,
+                        coloraxis_showscale=False
+                    )
+                    return fig_bar
+                
+                fig_bar = dashboard.cached_figure('category_spending', filter_state, build_category_spending)
+                show_chart(fig_bar)
             st.markdown('</div>', unsafe_allow_html=True)
         
         with col2:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.subheader("📈 Transaction Timeline")
-            daily_totals = filtered_df.groupby('Date')['Amount'].sum().reset_index()
+            daily_totals = totals_source.groupby('Date')['Amount'].sum().reset_index()
+            daily_totals, timeline_view = chart_series(daily_totals, 'Date', ['Amount'], key="trans_timeline_zoom", width_fraction=0.5)
             
             if not daily_totals.empty:
-                fig_timeline = px.line(
-                    daily_totals,
-                    x='Date',
-                    y='Amount',
-                    title="",
-                    line_shape='spline'
-                )
-                fig_timeline.update_traces(line=dict(width=3))
-                fig_timeline.update_layout(
-                    xaxis_title="Date",
-                    yaxis_title="Net Amount ($)",
-                    height=400
-                )
-                st.plotly_chart(fig_timeline, use_container_width=True)
+                def build_transaction_timeline():
+                    fig_timeline = px.line(
+                        daily_totals,
+                        x='Date',
+                        y='Amount',
+                        title="",
+                        line_shape='spline'
+                    )
+                    fig_timeline.update_traces(line=dict(width=3))
+                    fig_timeline.update_layout(
+                        xaxis_title="Date",
+                        yaxis_title="Net Amount ($)",
+                        height=400
+                    )
+                    return fig_timeline
+                
+                fig_timeline = dashboard.cached_figure('transaction_timeline', filter_state + timeline_view, build_transaction_timeline)
+                show_chart(fig_timeline)
             st.markdown('</div>', unsafe_allow_html=True)
     
     else:
         st.info("No transactions match the selected filters")
 
+TABLE_SORT_COLUMNS = ['Date', 'Amount', 'Description', 'Type', 'Category']
+TABLE_PAGE_SIZES = [50, 100, 250, 500]
+
+def show_transaction_page(dashboard, mask: Optional[np.ndarray], total_rows: int):
+    """Paginated transaction table that only formats and sends the visible page"""
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    
+    with col1:
+        sort_column = st.selectbox("Sort by", TABLE_SORT_COLUMNS, key="trans_sort_column")
+    with col2:
+        ascending = st.toggle("Ascending", value=False, key="trans_sort_ascending")
+    with col3:
+        page_size = st.selectbox("Rows per page", TABLE_PAGE_SIZES, index=1, key="trans_page_size")
+    
+    page_count = max(1, -(-total_rows // page_size))
+    with col4:
+        # Unkeyed so the page resets whenever the filters change the page count
+        page = st.number_input(f"Page (of {page_count:,})", min_value=1, max_value=page_count, value=1, step=1)
+    
+    page_df, total_rows = dashboard.transaction_page(sort_column, ascending, int(page) - 1, page_size, mask)
+    first_row = (int(page) - 1) * page_size
+    
+    show_formatted_table(
+        page_df,
+        {'Date': 'date', 'Amount': 'money'},
+        columns=['Date', 'Description', 'Amount', 'Type', 'Category'],
+        hide_index=True,
+        height=400
+    )
+    st.caption(f"Showing rows {first_row + 1:,}–{first_row + len(page_df):,} of {total_rows:,}")
+
 def show_cash_flow_tab(dashboard):
     """Enhanced cash flow analysis tab"""
     if dashboard.transactions_df is None:
@@ -956,94 +972,123 @@ def show_cash_flow_tab(dashboard):
     st.markdown('<div class="chart-container">', unsafe_allow_html=True)
     st.subheader("💰 Monthly Cash Flow Analysis")
     
-    fig_cashflow = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=('Cash Flow Trends', 'Net Cash Flow'),
-        vertical_spacing=0.1,
-        row_heights=[0.7, 0.3]
-    )
-    
-    # Main cash flow chart
-    fig_cashflow.add_trace(
-        go.Bar(
-            x=monthly_summary['Month_str'],
-            y=monthly_summary['income'],
-            name='Income',
-            marker_color='#10b981',
-            hovertemplate='<b>Income</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
-        ),
-        row=1, col=1
-    )
-    
-    fig_cashflow.add_trace(
-        go.Bar(
-            x=monthly_summary['Month_str'],
-            y=monthly_summary['expense'],
-            name='Expenses',
-            marker_color='#ef4444',
-            hovertemplate='<b>Expenses</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
-        ),
-        row=1, col=1
-    )
-    
-    # Net cash flow
-    fig_cashflow.add_trace(
-        go.Scatter(
-            x=monthly_summary['Month_str'],
-            y=monthly_summary['net_cash_flow'],
-            mode='lines+markers',
-            name='Net Cash Flow',
-            line=dict(color='#6366f1', width=3),
-            marker=dict(size=8),
-            hovertemplate='<b>Net Cash Flow</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
-        ),
-        row=2, col=1
-    )
-    
-    fig_cashflow.update_layout(
-        height=600,
-        barmode='group',
-        showlegend=True,
-        legend=dict(yanchor="top", y=0.99, xanchor="right", x=0.99)
-    )
-    
-    fig_cashflow.update_xaxes(title_text="Month", row=2, col=1)
-    fig_cashflow.update_yaxes(title_text="Amount ($)", row=1, col=1)
-    fig_cashflow.update_yaxes(title_text="Net Amount ($)", row=2, col=1)
+    def build_monthly_cash_flow():
+        fig_cashflow = make_subplots(
+            rows=2, cols=1,
+            subplot_titles=('Cash Flow Trends', 'Net Cash Flow'),
+            vertical_spacing=0.1,
+            row_heights=[0.7, 0.3]
+        )
+        
+        # Main cash flow chart
+        fig_cashflow.add_trace(
+            go.Bar(
+                x=monthly_summary['Month_str'],
+                y=monthly_summary['income'],
+                name='Income',
+                marker_color='#10b981',
+                hovertemplate='<b>Income</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+            ),
+            row=1, col=1
+        )
+        
+        fig_cashflow.add_trace(
+            go.Bar(
+                x=monthly_summary['Month_str'],
+                y=monthly_summary['expense'],
+                name='Expenses',
+                marker_color='#ef4444',
+                hovertemplate='<b>Expenses</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+            ),
+            row=1, col=1
+        )
+        
+        # Net cash flow
+        fig_cashflow.add_trace(
+            go.Scatter(
+                x=monthly_summary['Month_str'],
+                y=monthly_summary['net_cash_flow'],
+                mode='lines+markers',
+                name='Net Cash Flow',
+                line=dict(color='#6366f1', width=3),
+                marker=dict(size=8),
+                hovertemplate='<b>Net Cash Flow</b><br>Month: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+            ),
+            row=2, col=1
+        )
+        
+        fig_cashflow.update_layout(
+            height=600,
+            barmode='group',
+            showlegend=True,
+            legend=dict(yanchor="top", y=0.99, xanchor="right", x=0.99)
+        )
+        
+        fig_cashflow.update_xaxes(title_text="Month", row=2, col=1)
+        fig_cashflow.update_yaxes(title_text="Amount ($)", row=1, col=1)
+        fig_cashflow.update_yaxes(title_text="Net Amount ($)", row=2, col=1)
+        return fig_cashflow
     
-    st.plotly_chart(fig_cashflow, use_container_width=True)
+    fig_cashflow = dashboard.cached_figure('monthly_cash_flow', (), build_monthly_cash_flow)
+    show_chart(fig_cashflow)
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Cash flow table
     st.subheader("📊 Monthly Summary Table")
-    display_summary = monthly_summary[['Month_str', 'income', 'expense', 'net_cash_flow']].copy()
-    display_summary.columns = ['Month', 'Income', 'Expenses', 'Net Cash Flow']
-    display_summary['Income'] = display_summary['Income'].apply(lambda x: f"${x:,.2f}")
-    display_summary['Expenses'] = display_summary['Expenses'].apply(lambda x: f"${x:,.2f}")
-    display_summary['Net Cash Flow'] = display_summary['Net Cash Flow'].apply(lambda x: f"${x:,.2f}")
-    
-    st.dataframe(display_summary, use_container_width=True)
+    show_formatted_table(
+        monthly_summary,
+        {'income': 'money', 'expense': 'money', 'net_cash_flow': 'money'},
+        columns=['Month_str', 'income', 'expense', 'net_cash_flow'],
+        labels={'Month_str': 'Month', 'income': 'Income', 'expense': 'Expenses', 'net_cash_flow': 'Net Cash Flow'}
+    )
+
+COST_BASIS_LABELS = {'fifo': 'FIFO (first in, first out)', 'lifo': 'LIFO (last in, first out)', 'average': 'Average cost'}
 
 def show_investments_tab(dashboard):
     """Enhanced investments analysis tab"""
-    if dashboard.investments_df is None:
-        st.warning("No investment data available. Upload an investments.csv file to see your portfolio analysis.")
+    if dashboard.holdings() is None:
+        st.warning("No investment data available. Upload an investments.csv or trades.csv file to see your portfolio analysis.")
         return
     
-    portfolio = dashboard.calculate_portfolio_value()
+    # Lots from a trade log depend on how sells are matched to buys
+    method = 'fifo'
+    if dashboard.trades_df is not None:
+        method = st.selectbox(
+            "🧾 Cost basis method",
+            COST_BASIS_METHODS,
+            format_func=COST_BASIS_LABELS.get,
+            key="cost_basis_method"
+        )
+    
+    price_provider = selected_price_provider()
+    valuation = dashboard.portfolio_valuation(provider=price_provider, method=method)
+    portfolio = valuation['portfolio']
     
     if portfolio.empty:
         st.warning("No investment data available")
         return
     
+    # Holdings without a quote are left out of value and return
+    priced = portfolio['Current_Price'].notna()
+    if price_provider is not None and price_provider.errors:
+        st.warning(f"⚠️ Quote service errors: {'; '.join(price_provider.errors)}")
+    if not priced.all():
+        missing = portfolio.loc[~priced, 'Symbol'].astype(str).unique()
+        st.caption(f"No current quote for {len(missing)} symbol(s): {', '.join(missing[:20])}. "
+                   "They are excluded from value and return.")
+    
+    # Charts are cached per set of quotes, so new prices rebuild them
+    price_key = int(pd.util.hash_pandas_object(portfolio['Current_Price'], index=False).sum())
+    
     # Portfolio summary metrics
     total_value = portfolio['Current_Value'].sum()
-    total_cost = portfolio['Total_Cost'].sum()
+    total_cost = portfolio.loc[priced, 'Total_Cost'].sum()
     total_gain_loss = portfolio['Gain_Loss'].sum()
     total_gain_loss_pct = (total_gain_loss / total_cost * 100) if total_cost > 0 else 0
     num_positions = len(portfolio)
+    annualized = f"{valuation['xirr'] * 100:.1f}%" if np.isfinite(valuation['xirr']) else "n/a"
     
-    col1, col2, col3, col4, col5 = st.columns(5)
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
     
     with col1:
         st.metric("Portfolio Value", f"${total_value:,.0f}")
@@ -1054,6 +1099,8 @@ def show_investments_tab(dashboard):
     with col4:
         st.metric("Total Return", f"{total_gain_loss_pct:.1f}%")
     with col5:
+        st.metric("Annualized Return", annualized, help="Money-weighted return (XIRR) from each purchase to today")
+    with col6:
         st.metric("Positions", f"{num_positions}")
     
     st.markdown("---")
@@ -1065,73 +1112,185 @@ def show_investments_tab(dashboard):
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("📊 Portfolio Allocation")
         
-        fig_allocation = px.pie(
-            portfolio, 
-            values='Current_Value', 
-            names='Symbol',
-            title="",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        fig_allocation.update_traces(
-            textposition='inside', 
-            textinfo='percent+label',
-            hovertemplate='<b>%{label}</b><br>Value: $%{value:,.0f}<br>Percentage: %{percent}<extra></extra>'
-        )
-        fig_allocation.update_layout(
-            showlegend=True,
-            legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.02),
-            height=400
-        )
-        st.plotly_chart(fig_allocation, use_container_width=True)
+        def build_portfolio_allocation():
+            fig_allocation = px.pie(
+                portfolio[priced], 
+                values='Current_Value', 
+                names='Symbol',
+                title="",
+                color_discrete_sequence=px.colors.qualitative.Set3
+            )
+            fig_allocation.update_traces(
+                textposition='inside', 
+                textinfo='percent+label',
+                hovertemplate='<b>%{label}</b><br>Value: $%{value:,.0f}<br>Percentage: %{percent}<extra></extra>'
+            )
+            fig_allocation.update_layout(
+                showlegend=True,
+                legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.02),
+                height=400
+            )
+            return fig_allocation
+        
+        fig_allocation = dashboard.cached_figure('portfolio_allocation', (price_key, method), build_portfolio_allocation)
+        show_chart(fig_allocation)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("📈 Performance by Holding")
         
-        # Sort by gain/loss percentage for better visualization
-        portfolio_sorted = portfolio.sort_values('Gain_Loss_Pct', ascending=True)
-        
-        fig_performance = px.bar(
-            portfolio_sorted,
-            x='Gain_Loss_Pct',
-            y='Symbol',
-            orientation='h',
-            title="",
-            color='Gain_Loss_Pct',
-            color_continuous_scale='RdYlGn',
-            color_continuous_midpoint=0
-        )
-        fig_performance.update_layout(
-            xaxis_title="Gain/Loss (%)",
-            yaxis_title="Symbol",
-            height=400,
-            coloraxis_showscale=False
-        )
-        fig_performance.update_traces(
-            hovertemplate='<b>%{y}</b><br>Return: %{x:.1f}%<extra></extra>'
-        )
-        st.plotly_chart(fig_performance, use_container_width=True)
+        def build_holding_performance():
+            # Sort by gain/loss percentage for better visualization
+            portfolio_sorted = portfolio[priced].sort_values('Gain_Loss_Pct', ascending=True)
+            
+            fig_performance = px.bar(
+                portfolio_sorted,
+                x='Gain_Loss_Pct',
+                y='Symbol',
+                orientation='h',
+                title="",
+                color='Gain_Loss_Pct',
+                color_continuous_scale='RdYlGn',
+                color_continuous_midpoint=0
+            )
+            fig_performance.update_layout(
+                xaxis_title="Gain/Loss (%)",
+                yaxis_title="Symbol",
+                height=400,
+                coloraxis_showscale=False
+            )
+            fig_performance.update_traces(
+                hovertemplate='<b>%{y}</b><br>Return: %{x:.1f}%<extra></extra>'
+            )
+            return fig_performance
+        
+        fig_performance = dashboard.cached_figure('holding_performance', (price_key, method), build_holding_performance)
+        show_chart(fig_performance)
         st.markdown('</div>', unsafe_allow_html=True)
     
+    show_portfolio_history(dashboard)
+    
     # Detailed portfolio table
     st.subheader("📈 Portfolio Details")
     
-    # Format portfolio data for display
-    display_portfolio = portfolio.copy()
-    display_portfolio['Current_Price'] = display_portfolio['Current_Price'].apply(lambda x: f"${x:.2f}")
-    display_portfolio['Purchase_Price'] = display_portfolio['Purchase_Price'].apply(lambda x: f"${x:.2f}")
-    display_portfolio['Current_Value'] = display_portfolio['Current_Value'].apply(lambda x: f"${x:,.0f}")
-    display_portfolio['Total_Cost'] = display_portfolio['Total_Cost'].apply(lambda x: f"${x:,.0f}")
-    display_portfolio['Gain_Loss'] = display_portfolio['Gain_Loss'].apply(lambda x: f"${x:,.0f}")
-    display_portfolio['Gain_Loss_Pct'] = display_portfolio['Gain_Loss_Pct'].apply(lambda x: f"{x:.1f}%")
+    show_formatted_table(
+        portfolio,
+        {'Purchase_Price': 'money', 'Current_Price': 'money', 'Total_Cost': 'whole_money',
+         'Current_Value': 'whole_money', 'Gain_Loss': 'whole_money', 'Gain_Loss_Pct': 'percent', 'XIRR_Pct': 'percent'},
+        columns=['Symbol', 'Name', 'Shares', 'Purchase_Price', 'Current_Price',
+                 'Total_Cost', 'Current_Value', 'Gain_Loss', 'Gain_Loss_Pct', 'XIRR_Pct']
+    )
     
-    st.dataframe(
-        display_portfolio[['Symbol', 'Name', 'Shares', 'Purchase_Price', 'Current_Price', 
-                         'Total_Cost', 'Current_Value', 'Gain_Loss', 'Gain_Loss_Pct']],
-        use_container_width=True
+    if dashboard.trades_df is not None:
+        show_cost_basis_summary(dashboard, method, portfolio, valuation['symbol_xirr'])
+
+def show_cost_basis_summary(dashboard, method: str, portfolio: pd.DataFrame, symbol_xirr: pd.Series):
+    """Per-symbol position, cost basis and realized gain from the trade log"""
+    st.subheader("🧾 Cost Basis by Symbol")
+    
+    summary = dashboard.calculate_cost_basis(method).summary.copy()
+    prices = portfolio.groupby('Symbol', observed=True)['Current_Price'].first()
+    summary['Current_Value'] = np.where(summary['Shares'] > 0, summary['Shares'] * summary['Symbol'].map(prices), 0)
+    summary['Unrealized_Gain'] = summary['Current_Value'] - summary['Cost_Basis']
+    summary['XIRR_Pct'] = (summary['Symbol'].map(symbol_xirr) * 100).round(2)
+    
+    st.caption(f"Realized gain from {summary['Trades'].sum():,} trades: ${summary['Realized_Gain'].sum():,.0f}")
+    show_formatted_table(
+        summary,
+        {'Cost_Basis': 'whole_money', 'Average_Cost': 'money', 'Proceeds': 'whole_money', 'Realized_Gain': 'whole_money',
+         'Current_Value': 'whole_money', 'Unrealized_Gain': 'whole_money', 'XIRR_Pct': 'percent'},
+        columns=['Symbol', 'Shares', 'Average_Cost', 'Cost_Basis', 'Current_Value', 'Unrealized_Gain',
+                 'Proceeds', 'Realized_Gain', 'XIRR_Pct', 'Trades']
     )
 
+def show_price_history_upload():
+    """Build the shared price history store from an uploaded CSV"""
+    price_file = st.file_uploader(
+        "Daily closing prices CSV (Date, Symbol, Close)",
+        type=['csv'],
+        help=f"Saved to {PRICE_HISTORY_PATH} and reused by later sessions",
+        key="price_history_upload"
+    )
+    if price_file is None:
+        return
+    
+    # The uploader keeps its file across reruns, so build once per upload
+    digest = get_upload_digest(price_file)
+    if st.session_state.get('price_history_digest') == digest:
+        return
+    
+    try:
+        with st.spinner("🔄 Building price history..."):
+            PriceHistoryStore.read_csv(price_file, PRICE_HISTORY_PATH)
+    except ValueError as e:
+        st.error(f"❌ Could not read price history: {e}")
+        return
+    
+    st.session_state['price_history_digest'] = digest
+    st.rerun()
+
+def show_portfolio_history(dashboard):
+    """Chart portfolio value over time against the local price history"""
+    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+    st.subheader("📉 Portfolio Value Over Time")
+    
+    price_history = current_price_history()
+    if price_history is None:
+        st.info("Upload daily closing prices to chart how your portfolio value developed since each purchase.")
+        show_price_history_upload()
+        st.markdown('</div>', unsafe_allow_html=True)
+        return
+    
+    history = dashboard.portfolio_history(price_history)
+    if history.empty:
+        st.info("The price history does not cover your holdings' purchase dates.")
+    else:
+        history_series, history_view = chart_series(history, 'Date', ['Value', 'Cost'], key="portfolio_history_zoom")
+        
+        def build_portfolio_history():
+            fig_history = go.Figure()
+            fig_history.add_trace(go.Scatter(
+                x=history_series['Date'],
+                y=history_series['Value'],
+                mode='lines',
+                name='Market Value',
+                line=dict(color='#667eea', width=3),
+                hovertemplate='<b>Market Value</b><br>Date: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+            ))
+            fig_history.add_trace(go.Scatter(
+                x=history_series['Date'],
+                y=history_series['Cost'],
+                mode='lines',
+                name='Amount Invested',
+                line=dict(color='#f59e0b', width=2, dash='dash'),
+                hovertemplate='<b>Amount Invested</b><br>Date: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+            ))
+            fig_history.update_layout(
+                xaxis_title="Date",
+                yaxis_title="Amount ($)",
+                hovermode='x unified',
+                height=400
+            )
+            return fig_history
+        
+        fig_history = dashboard.cached_figure(
+            'portfolio_history', (price_history.version,) + history_view, build_portfolio_history
+        )
+        show_chart(fig_history)
+        
+        # Time-weighted return leaves out the timing and size of buys and sells
+        held_days = int((history['Value'] > 0).sum())
+        growth = history['Growth'].iloc[-1]
+        yearly = growth ** (365 / held_days) - 1 if held_days >= 365 else np.nan
+        yearly_text = f", {yearly * 100:.1f}% a year" if np.isfinite(yearly) else ""
+        st.caption(f"Time-weighted return {(growth - 1) * 100:.1f}%{yearly_text}. "
+                   f"Closing prices for {len(price_history.symbols):,} symbols through {price_history.end}")
+    
+    with st.expander("Replace price history"):
+        show_price_history_upload()
+    st.markdown('</div>', unsafe_allow_html=True)
+
 def show_net_worth_tab(dashboard):
     """Enhanced net worth tracking tab"""
     if dashboard.net_worth_df is None:
@@ -1185,77 +1344,81 @@ def show_net_worth_tab(dashboard):
     st.markdown('<div class="chart-container">', unsafe_allow_html=True)
     st.subheader("💎 Net Worth Timeline")
     
-    fig_net_worth = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=('Assets vs Liabilities', 'Net Worth Trend'),
-        vertical_spacing=0.1,
-        row_heights=[0.6, 0.4]
-    )
-    
-    # Assets vs Liabilities
-    fig_net_worth.add_trace(
-        go.Scatter(
-            x=dashboard.net_worth_df['Date'],
-            y=dashboard.net_worth_df['Assets'],
-            mode='lines+markers',
-            name='Assets',
-            line=dict(color='#10b981', width=3),
-            marker=dict(size=6),
-            hovertemplate='<b>Assets</b><br>Date: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
-        ),
-        row=1, col=1
-    )
-    
-    fig_net_worth.add_trace(
-        go.Scatter(
-            x=dashboard.net_worth_df['Date'],
-            y=dashboard.net_worth_df['Liabilities'],
-            mode='lines+markers',
-            name='Liabilities',
-            line=dict(color='#ef4444', width=3),
-            marker=dict(size=6),
-            hovertemplate='<b>Liabilities</b><br>Date: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
-        ),
-        row=1, col=1
+    net_worth_series, net_worth_view = chart_series(
+        dashboard.net_worth_df, 'Date', ['Assets', 'Liabilities', 'Net_Worth'], key="net_worth_zoom"
     )
     
-    # Net Worth
-    fig_net_worth.add_trace(
-        go.Scatter(
-            x=dashboard.net_worth_df['Date'],
-            y=dashboard.net_worth_df['Net_Worth'],
-            mode='lines+markers',
-            name='Net Worth',
-            line=dict(color='#6366f1', width=4),
-            marker=dict(size=8),
-            fill='tonexty' if len(dashboard.net_worth_df) > 1 else None,
-            hovertemplate='<b>Net Worth</b><br>Date: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
-        ),
-        row=2, col=1
-    )
-    
-    fig_net_worth.update_layout(
-        height=600,
-        showlegend=True,
-        legend=dict(yanchor="top", y=0.99, xanchor="right", x=0.99)
-    )
-    
-    fig_net_worth.update_xaxes(title_text="Date", row=2, col=1)
-    fig_net_worth.update_yaxes(title_text="Amount ($)", row=1, col=1)
-    fig_net_worth.update_yaxes(title_text="Net Worth ($)", row=2, col=1)
+    def build_net_worth_timeline():
+        fig_net_worth = make_subplots(
+            rows=2, cols=1,
+            subplot_titles=('Assets vs Liabilities', 'Net Worth Trend'),
+            vertical_spacing=0.1,
+            row_heights=[0.6, 0.4]
+        )
+        
+        # Assets vs Liabilities
+        fig_net_worth.add_trace(
+            go.Scatter(
+                x=net_worth_series['Date'],
+                y=net_worth_series['Assets'],
+                mode='lines+markers',
+                name='Assets',
+                line=dict(color='#10b981', width=3),
+                marker=dict(size=6),
+                hovertemplate='<b>Assets</b><br>Date: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+            ),
+            row=1, col=1
+        )
+        
+        fig_net_worth.add_trace(
+            go.Scatter(
+                x=net_worth_series['Date'],
+                y=net_worth_series['Liabilities'],
+                mode='lines+markers',
+                name='Liabilities',
+                line=dict(color='#ef4444', width=3),
+                marker=dict(size=6),
+                hovertemplate='<b>Liabilities</b><br>Date: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+            ),
+            row=1, col=1
+        )
+        
+        # Net Worth
+        fig_net_worth.add_trace(
+            go.Scatter(
+                x=net_worth_series['Date'],
+                y=net_worth_series['Net_Worth'],
+                mode='lines+markers',
+                name='Net Worth',
+                line=dict(color='#6366f1', width=4),
+                marker=dict(size=8),
+                fill='tonexty' if len(net_worth_series) > 1 else None,
+                hovertemplate='<b>Net Worth</b><br>Date: %{x}<br>Amount: $%{y:,.0f}<extra></extra>'
+            ),
+            row=2, col=1
+        )
+        
+        fig_net_worth.update_layout(
+            height=600,
+            showlegend=True,
+            legend=dict(yanchor="top", y=0.99, xanchor="right", x=0.99)
+        )
+        
+        fig_net_worth.update_xaxes(title_text="Date", row=2, col=1)
+        fig_net_worth.update_yaxes(title_text="Amount ($)", row=1, col=1)
+        fig_net_worth.update_yaxes(title_text="Net Worth ($)", row=2, col=1)
+        return fig_net_worth
     
-    st.plotly_chart(fig_net_worth, use_container_width=True)
+    fig_net_worth = dashboard.cached_figure('net_worth_timeline', net_worth_view, build_net_worth_timeline)
+    show_chart(fig_net_worth)
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Net worth history table
     st.subheader("📊 Net Worth History")
-    display_nw = dashboard.net_worth_df.copy()
-    display_nw['Date'] = display_nw['Date'].dt.strftime('%Y-%m-%d')
-    display_nw['Assets'] = display_nw['Assets'].apply(lambda x: f"${x:,.0f}")
-    display_nw['Liabilities'] = display_nw['Liabilities'].apply(lambda x: f"${x:,.0f}")
-    display_nw['Net_Worth'] = display_nw['Net_Worth'].apply(lambda x: f"${x:,.0f}")
-    
-    st.dataframe(display_nw.sort_values('Date', ascending=False), use_container_width=True)
+    show_formatted_table(
+        dashboard.net_worth_df.sort_values('Date', ascending=False),
+        {'Date': 'date', 'Assets': 'whole_money', 'Liabilities': 'whole_money', 'Net_Worth': 'whole_money'}
+    )
 
 def show_goals_tab(dashboard):
     """Enhanced financial goals tracking tab"""
@@ -1299,69 +1462,84 @@ def show_goals_tab(dashboard):
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("🎯 Goals Progress Overview")
         
-        fig_goals = px.bar(
-            goals_progress,
-            x='Goal_Name',
-            y='Progress_Pct',
-            title="",
-            color='Progress_Pct',
-            color_continuous_scale='RdYlGn',
-            color_continuous_midpoint=50
-        )
-        fig_goals.add_hline(y=100, line_dash="dash", line_color="green", annotation_text="Target")
-        fig_goals.add_hline(y=50, line_dash="dash", line_color="orange", annotation_text="Halfway")
-        
-        fig_goals.update_layout(
-            xaxis_title="Goals",
-            yaxis_title="Progress (%)",
-            height=400,
-            xaxis_tickangle=-45,
-            coloraxis_showscale=False
-        )
-        fig_goals.update_traces(
-            hovertemplate='<b>%{x}</b><br>Progress: %{y:.1f}%<extra></extra>'
-        )
-        st.plotly_chart(fig_goals, use_container_width=True)
+        def build_goals_progress():
+            fig_goals = px.bar(
+                goals_progress,
+                x='Goal_Name',
+                y='Progress_Pct',
+                title="",
+                color='Progress_Pct',
+                color_continuous_scale='RdYlGn',
+                color_continuous_midpoint=50
+            )
+            fig_goals.add_hline(y=100, line_dash="dash", line_color="green", annotation_text="Target")
+            fig_goals.add_hline(y=50, line_dash="dash", line_color="orange", annotation_text="Halfway")
+            
+            fig_goals.update_layout(
+                xaxis_title="Goals",
+                yaxis_title="Progress (%)",
+                height=400,
+                xaxis_tickangle=-45,
+                coloraxis_showscale=False
+            )
+            fig_goals.update_traces(
+                hovertemplate='<b>%{x}</b><br>Progress: %{y:.1f}%<extra></extra>'
+            )
+            return fig_goals
+        
+        fig_goals = dashboard.cached_figure('goals_progress', (), build_goals_progress)
+        show_chart(fig_goals)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.subheader("💰 Goal Amounts")
         
-        fig_amounts = go.Figure()
-        
-        fig_amounts.add_trace(go.Bar(
-            x=goals_progress['Goal_Name'],
-            y=goals_progress['Current_Amount'],
-            name='Current Amount',
-            marker_color='#6366f1',
-            hovertemplate='<b>%{x}</b><br>Current: $%{y:,.0f}<extra></extra>'
-        ))
-        
-        fig_amounts.add_trace(go.Bar(
-            x=goals_progress['Goal_Name'],
-            y=goals_progress['Target_Amount'] - goals_progress['Current_Amount'],
-            name='Remaining Amount',
-            marker_color='#e5e7eb',
-            hovertemplate='<b>%{x}</b><br>Remaining: $%{y:,.0f}<extra></extra>'
-        ))
-        
-        fig_amounts.update_layout(
-            barmode='stack',
-            xaxis_title="Goals",
-            yaxis_title="Amount ($)",
-            height=400,
-            xaxis_tickangle=-45,
-            showlegend=True,
-            legend=dict(yanchor="top", y=0.99, xanchor="right", x=0.99)
-        )
-        
-        st.plotly_chart(fig_amounts, use_container_width=True)
+        def build_goal_amounts():
+            fig_amounts = go.Figure()
+            
+            fig_amounts.add_trace(go.Bar(
+                x=goals_progress['Goal_Name'],
+                y=goals_progress['Current_Amount'],
+                name='Current Amount',
+                marker_color='#6366f1',
+                hovertemplate='<b>%{x}</b><br>Current: $%{y:,.0f}<extra></extra>'
+            ))
+            
+            fig_amounts.add_trace(go.Bar(
+                x=goals_progress['Goal_Name'],
+                y=goals_progress['Target_Amount'] - goals_progress['Current_Amount'],
+                name='Remaining Amount',
+                marker_color='#e5e7eb',
+                hovertemplate='<b>%{x}</b><br>Remaining: $%{y:,.0f}<extra></extra>'
+            ))
+            
+            fig_amounts.update_layout(
+                barmode='stack',
+                xaxis_title="Goals",
+                yaxis_title="Amount ($)",
+                height=400,
+                xaxis_tickangle=-45,
+                showlegend=True,
+                legend=dict(yanchor="top", y=0.99, xanchor="right", x=0.99)
+            )
+            return fig_amounts
+        
+        fig_amounts = dashboard.cached_figure('goal_amounts', (), build_goal_amounts)
+        show_chart(fig_amounts)
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Individual goal progress
     st.subheader("🎯 Individual Goal Progress")
     
+    history_months = goals_progress.attrs.get('history_months', 0)
+    simulated = history_months > 0
+    if simulated:
+        st.caption(
+            f"Chances are from {goals_progress.attrs['simulation_paths']:,} simulated savings paths that replay "
+            f"your {history_months} past months of net cash flow in random order. Savings fill goals in target date order."
+        )
+    
     for _, goal in goals_progress.iterrows():
         with st.container():
             st.markdown(f"### {goal['Goal_Name']}")
@@ -1369,7 +1547,7 @@ def show_goals_tab(dashboard):
             progress = min(goal['Progress_Pct'] / 100, 1.0)
             st.progress(progress)
             
-            col1, col2, col3, col4 = st.columns(4)
+            col1, col2, col3, col4, col5 = st.columns(5)
             
             with col1:
                 st.metric("Progress", f"{goal['Progress_Pct']:.1f}%")
@@ -1389,8 +1567,119 @@ def show_goals_tab(dashboard):
                 else:
                     st.metric("Status", "✅ Complete")
             
+            with col5:
+                if simulated:
+                    st.metric("Chance On Time", f"{goal['Success_Probability']:.0f}%")
+            
+            if simulated and goal['Progress_Pct'] < 100:
+                st.caption(completion_caption(goal))
+            
             st.markdown("---")
 
+def completion_caption(goal) -> str:
+    """Likely completion date of a goal with its 10th to 90th percentile range"""
+    def month(date):
+        return date.strftime('%b %Y') if pd.notna(date) else 'beyond the simulated horizon'
+    
+    if pd.isna(goal['Completion_P50']):
+        return "📅 Most simulated paths do not reach this goal at your current savings rate"
+    return (f"📅 Likely reached around {month(goal['Completion_P50'])} "
+            f"(80% of paths between {month(goal['Completion_P10'])} and {month(goal['Completion_P90'])})")
+
+def show_append_interface(dashboard, ingest_cache, cache_key, amount_dtype):
+    """Sidebar uploads for delta statements, returning the dashboard to display"""
+    st.sidebar.markdown("### ➕ Append Statements")
+    
+    delta_transactions = st.sidebar.file_uploader(
+        "New transactions CSV",
+        type=['csv'],
+        help="Rows already loaded (same Date, Description and Amount) are skipped",
+        key="append_trans_upload"
+    )
+    delta_net_worth = st.sidebar.file_uploader(
+        "New net worth CSV",
+        type=['csv'],
+        help="Balances replace any already loaded for the same date",
+        key="append_net_upload"
+    )
+    
+    if delta_transactions is None and delta_net_worth is None:
+        st.sidebar.markdown("---")
+        return dashboard
+    
+    append_key = IngestCache.make_key(
+        'append', cache_key, get_upload_digest(delta_transactions), get_upload_digest(delta_net_worth)
+    )
+    appended = ingest_cache.get(append_key)
+    
+    if appended is None:
+        with st.spinner("🔄 Appending statements..."):
+            # Cached dashboards are shared, so the merge happens on a copy
+            appended = dashboard.copy()
+            result = appended.append_files(
+                {'transactions': delta_transactions, 'net_worth': delta_net_worth},
+                amount_dtype=amount_dtype
+            )
+        if not result:
+            st.sidebar.error(f"❌ {result.error}")
+            st.sidebar.markdown("---")
+            return dashboard
+        ingest_cache.put(append_key, appended)
+    
+    stats = appended.append_stats
+    if stats is not None and delta_transactions is not None:
+        st.sidebar.success(f"✅ Added {stats['added']:,} new transactions ({stats['duplicates']:,} duplicates skipped)")
+    
+    st.sidebar.markdown("---")
+    return appended
+
+def show_snapshot_export(dashboard):
+    """Offer the processed dataset as a columnar snapshot"""
+    st.sidebar.markdown("### 📦 Snapshot")
+    
+    if not ARROW_AVAILABLE:
+        st.sidebar.caption("Install pyarrow to export processed snapshots")
+        st.sidebar.markdown("---")
+        return
+    
+    st.sidebar.caption("Re-upload the snapshot ZIP to skip CSV parsing and categorization")
+    if st.sidebar.button("📦 Prepare Snapshot", key="prepare_snapshot"):
+        with st.spinner("🔄 Building snapshot..."):
+            snapshot = dashboard.export_snapshot()
+        st.sidebar.download_button(
+            label="⬇️ Download Snapshot",
+            data=snapshot,
+            file_name="financial_snapshot.zip",
+            mime="application/zip",
+            key="download_snapshot"
+        )
+    
+    st.sidebar.markdown("---")
+
+def show_perf_panel(report: Dict):
+    """Sidebar debug panel with the stage timings of this rerun"""
+    with st.sidebar.expander("🩺 Performance Profile", expanded=True):
+        peak = f", peak RSS {report['peak_rss_mb']:,.0f} MB" if report['peak_rss_mb'] is not None else ""
+        st.caption(f"Rerun: {report['total_ms']:,.0f} ms{peak}")
+        
+        if report['stages']:
+            stages = pd.DataFrame(report['stages'])
+            st.dataframe(
+                stages[['stage', 'ms', 'rss_mb']],
+                column_config={
+                    'stage': 'Stage',
+                    'ms': st.column_config.NumberColumn('ms', format='%.1f'),
+                    'rss_mb': st.column_config.NumberColumn('RSS MB', format='%.0f')
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+        
+        for name, value in report['counters'].items():
+            st.caption(f"{name.replace('_', ' ').capitalize()}: {value:,}")
+        for name, frame in report['frames'].items():
+            st.caption(f"{name.replace('_', ' ').title()}: {frame['rows']:,} rows, {frame['bytes'] / 1e6:,.1f} MB")
+
 def show_theme_toggle():
     """Add theme toggle functionality"""
     if st.sidebar.button("🌓 Toggle Theme"):
@@ -1419,6 +1708,14 @@ def apply_theme():
 
 def main():
     """Main application function"""
+    # Configure Streamlit page
+    st.set_page_config(
+        page_title="Personal Finance Dashboard",
+        page_icon="💰",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
     # Load custom CSS and apply theme
     load_custom_css()
     apply_theme()
@@ -1447,11 +1744,80 @@ def main():
     
     st.sidebar.markdown("---")
     
+    # Settings
+    st.sidebar.markdown("### ⚙️ Settings")
+    lazy_tabs = st.sidebar.checkbox(
+        "⚡ Lazy tab rendering",
+        value=True,
+        help="Only build the Overview section that is currently shown",
+        key="lazy_tabs"
+    )
+    
+    streaming_ingest = st.sidebar.checkbox(
+        "🌊 Streaming ingest",
+        value=False,
+        help="Read transactions.csv in chunks with bounded memory, spilling rows to a temporary Arrow file",
+        key="streaming_ingest"
+    )
+    
+    st.sidebar.number_input(
+        "📐 Chart width (px)",
+        min_value=200,
+        max_value=4000,
+        value=DEFAULT_CHART_WIDTH_PX,
+        step=100,
+        help="Time-series charts are downsampled to about one point per pixel of this width",
+        key="chart_width_px"
+    )
+    
+    amount_dtype = st.sidebar.selectbox(
+        "🔢 Amount precision",
+        AMOUNT_DTYPES,
+        index=0,
+        help="float32 halves the memory used by transaction amounts at reduced precision",
+        key="amount_dtype"
+    )
+    
+    remember_merchants = st.sidebar.checkbox(
+        "💾 Remember merchant categories",
+        value=False,
+        help=f"Save learned merchant categories to {MERCHANT_STORE_PATH} so later uploads are pre-classified",
+        key="remember_merchants"
+    )
+    
+    st.sidebar.text_input(
+        "💹 Quote service URL",
+        value=os.environ.get(QUOTES_URL_ENV, ''),
+        help="Fetch current prices from this service, cached for a few minutes. "
+             f"Leave empty to use offline sample prices. Defaults to {QUOTES_URL_ENV}.",
+        key="quotes_url"
+    )
+    
+    st.sidebar.checkbox(
+        "💾 Save quotes to disk",
+        value=False,
+        help=f"Keep fetched quotes in {QUOTE_CACHE_DIR} so restarts and other processes reuse them until they expire",
+        key="save_quotes"
+    )
+    
+    profiling = st.sidebar.checkbox(
+        "🩺 Performance profiling",
+        value=False,
+        help=f"Time each stage of a rerun and show it in the sidebar. Setting {PERF_LOG_ENV} "
+             "to a file path also appends every rerun's profile to that JSON-lines log.",
+        key="perf_profiling"
+    )
+    perf_log_path = os.environ.get(PERF_LOG_ENV)
+    perf = start_perf(enabled=profiling or bool(perf_log_path), log_path=perf_log_path)
+    
+    st.sidebar.markdown("---")
+    
     # Initialize dashboard
-    dashboard = FinanceDashboard()
+    merchant_store = get_merchant_store(MERCHANT_STORE_PATH) if remember_merchants else None
+    dashboard = FinanceDashboard(merchant_store=merchant_store)
     
     # File upload interface
-    upload_type, file1, file2, file3, file4 = show_upload_interface()
+    upload_type, file1, file2, file3, file4, file5 = show_upload_interface()
     
     # Show file requirements help
     show_file_requirements()
@@ -1462,16 +1828,41 @@ def main():
     # Process uploaded files
     data_loaded = False
     
+    # Reuse previously parsed data for identical uploads
+    ingest_cache = get_ingest_cache()
+    cache_key = None
+    # Dashboards built with and without remembered merchants categorize differently
+    load_options = f"{amount_dtype}:{'merchants' if remember_merchants else 'keywords'}"
     if upload_type == 'zip' and file1 is not None:
-        with st.spinner("🔄 Processing ZIP file..."):
-            if dashboard.load_from_zip(file1):
+        cache_key = IngestCache.make_key(f"zip:{load_options}", get_upload_digest(file1))
+    elif upload_type == 'individual' and file1 is not None:
+        cache_key = IngestCache.make_key(f"individual:{load_options}", *[get_upload_digest(f) for f in (file1, file2, file3, file4, file5)])
+    
+    cached_dashboard = ingest_cache.get(cache_key) if cache_key is not None else None
+    
+    if cached_dashboard is not None:
+        dashboard = cached_dashboard
+        data_loaded = True
+        st.markdown("""
+        <div class="success-message">
+            ✅ Financial data loaded from cache! Your financial data is ready for analysis.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    elif upload_type == 'zip' and file1 is not None:
+        with st.spinner("🔄 Processing ZIP file..."), perf.stage("ingest"):
+            result = dashboard.load_from_zip(file1, streaming=streaming_ingest, spill=streaming_ingest,
+                                             amount_dtype=amount_dtype)
+            if result:
                 data_loaded = True
+                ingest_cache.put(cache_key, dashboard)
                 st.markdown("""
                 <div class="success-message">
                     ✅ ZIP file loaded successfully! Your financial data is ready for analysis.
                 </div>
                 """, unsafe_allow_html=True)
             else:
+                st.error(f"❌ {result.error}")
                 st.markdown("""
                 <div class="error-message">
                     ❌ Failed to load ZIP file. Please check the file format and try again.
@@ -1479,36 +1870,25 @@ def main():
                 """, unsafe_allow_html=True)
     
     elif upload_type == 'individual' and file1 is not None:
-        with st.spinner("🔄 Processing CSV files..."):
-            try:
-                # Load transactions (required)
-                dashboard.transactions_df = pd.read_csv(file1)
-                dashboard.transactions_df['Date'] = pd.to_datetime(dashboard.transactions_df['Date'])
-                dashboard.transactions_df['Month'] = dashboard.transactions_df['Date'].dt.to_period('M')
-                
-                # Load optional files
-                if file2 is not None:
-                    dashboard.net_worth_df = pd.read_csv(file2)
-                    dashboard.net_worth_df['Date'] = pd.to_datetime(dashboard.net_worth_df['Date'])
-                
-                if file3 is not None:
-                    dashboard.investments_df = pd.read_csv(file3)
-                
-                if file4 is not None:
-                    dashboard.goals_df = pd.read_csv(file4)
-                    dashboard.goals_df['Target_Date'] = pd.to_datetime(dashboard.goals_df['Target_Date'])
-                
+        with st.spinner("🔄 Processing CSV files..."), perf.stage("ingest"):
+            result = dashboard.load_files(
+                {'transactions': file1, 'net_worth': file2, 'investments': file3, 'goals': file4, 'trades': file5},
+                streaming=streaming_ingest,
+                spill=streaming_ingest,
+                amount_dtype=amount_dtype
+            )
+            if result:
                 data_loaded = True
+                ingest_cache.put(cache_key, dashboard)
                 st.markdown("""
                 <div class="success-message">
                     ✅ CSV files loaded successfully! Your financial data is ready for analysis.
                 </div>
                 """, unsafe_allow_html=True)
-                
-            except Exception as e:
+            else:
                 st.markdown(f"""
                 <div class="error-message">
-                    ❌ Error loading CSV files: {str(e)}
+                    ❌ {result.error}
                 </div>
                 """, unsafe_allow_html=True)
     
@@ -1516,11 +1896,21 @@ def main():
     if data_loaded:
         st.markdown("---")
         
+        # Merge newer statements into the loaded history
+        with perf.stage("append"):
+            dashboard = show_append_interface(dashboard, ingest_cache, cache_key, amount_dtype)
+        
         # Add data summary
         st.sidebar.markdown("### 📊 Data Summary")
         
         if dashboard.transactions_df is not None:
             st.sidebar.success(f"✅ Transactions: {len(dashboard.transactions_df):,} records")
+            if dashboard.ingest_stats:
+                stats = dashboard.ingest_stats
+                growth = f", memory +{stats['peak_growth_mb']:,.0f} MB at peak" if stats['peak_growth_mb'] is not None else ""
+                st.sidebar.caption(
+                    f"Streamed {stats['rows']:,} rows in {stats['chunks']} chunks ({stats['seconds']:.1f}s{growth})"
+                )
         
         if dashboard.net_worth_df is not None:
             st.sidebar.success(f"✅ Net Worth: {len(dashboard.net_worth_df)} months")
@@ -1531,8 +1921,30 @@ def main():
         if dashboard.goals_df is not None:
             st.sidebar.success(f"✅ Goals: {len(dashboard.goals_df)} objectives")
         
+        if dashboard.load_timings:
+            with st.sidebar.expander("⏱️ Load Timings", expanded=False):
+                for name, seconds in dashboard.load_timings.items():
+                    st.caption(f"{name.replace('_', ' ').title()}: {seconds * 1000:,.0f} ms")
+        
+        with st.sidebar.expander("🧠 Memory Usage", expanded=False):
+            for name, usage in dashboard.memory_report().items():
+                ratio = usage['before'] / usage['after'] if usage['after'] else 1
+                st.caption(
+                    f"{name.replace('_', ' ').title()}: {usage['before'] / 1e6:,.1f} MB → "
+                    f"{usage['after'] / 1e6:,.1f} MB ({ratio:.1f}x smaller)"
+                )
+            
+            cache_stats = ingest_cache.stats()
+            st.caption(
+                f"Upload cache: {cache_stats['entries']} datasets, "
+                f"{cache_stats['bytes'] / 1e6:,.1f} MB of {ingest_cache.max_bytes / 1e6:,.0f} MB"
+            )
+        
         st.sidebar.markdown("---")
         
+        # Processed snapshot export
+        show_snapshot_export(dashboard)
+        
         # Navigation
         st.sidebar.markdown("### 🧭 Quick Navigation")
         nav_option = st.sidebar.radio(
@@ -1542,18 +1954,19 @@ def main():
         )
         
         # Show the selected content
-        if nav_option == "📊 Overview":
-            show_dashboard_content(dashboard)
-        elif nav_option == "💳 Transactions":
-            show_transactions_tab(dashboard)
-        elif nav_option == "💰 Cash Flow":
-            show_cash_flow_tab(dashboard)
-        elif nav_option == "📈 Investments":
-            show_investments_tab(dashboard)
-        elif nav_option == "💎 Net Worth":
-            show_net_worth_tab(dashboard)
-        elif nav_option == "🎯 Goals":
-            show_goals_tab(dashboard)
+        with perf.stage(f"render:{nav_option.split(' ', 1)[1].lower().replace(' ', '_')}"):
+            if nav_option == "📊 Overview":
+                show_dashboard_content(dashboard, lazy_tabs=lazy_tabs)
+            elif nav_option == "💳 Transactions":
+                show_transactions_tab(dashboard)
+            elif nav_option == "💰 Cash Flow":
+                show_cash_flow_tab(dashboard)
+            elif nav_option == "📈 Investments":
+                show_investments_tab(dashboard)
+            elif nav_option == "💎 Net Worth":
+                show_net_worth_tab(dashboard)
+            elif nav_option == "🎯 Goals":
+                show_goals_tab(dashboard)
     
     else:
         # Welcome screen
@@ -1657,6 +2070,16 @@ def main():
         <p>💰 Personal Finance Dashboard • Built with Streamlit & Plotly • Your data stays private on your device</p>
     </div>
     """, unsafe_allow_html=True)
+    
+    # Profile of this rerun
+    if data_loaded and perf.enabled:
+        perf.record_frames({
+            name: (len(getattr(dashboard, f"{name}_df")), usage['after'])
+            for name, usage in dashboard.memory_report().items()
+        })
+    report = perf.write_log()
+    if report is not None and profiling:
+        show_perf_panel(report)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
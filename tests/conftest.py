@@ -0,0 +1,45 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finance_engine import FinanceDashboard, MerchantCategoryStore
+
+TRANSACTIONS_CSV = """Date,Description,Amount,Type
+2024-01-01,Salary Payment,5000.00,income
+2024-01-02,Whole Foods Market,-156.89,expense
+2024-01-03,Shell Gas Station,-65.42,expense
+2024-01-04,Netflix Subscription,-15.99,expense
+2024-01-05,Chipotle Mexican Grill,-12.85,expense
+2024-01-06,Electric Company Bill,-134.67,expense
+2024-01-07,Amazon Purchase,-289.99,expense
+2024-01-08,Starbucks Coffee,-6.75,expense
+2024-01-09,Uber Ride,-45.30,expense
+2024-01-10,CVS Pharmacy,-25.99,expense
+"""
+
+NET_WORTH_CSV = """Date,Assets,Liabilities
+2024-01-31,85420.50,32150.75
+2024-02-29,87890.25,31980.50
+"""
+
+INVESTMENTS_CSV = """Symbol,Name,Shares,Purchase_Price,Purchase_Date
+AAPL,Apple Inc.,50,145.30,2024-01-15
+SPY,SPDR S&P 500 ETF,100,398.45,2024-01-08
+"""
+
+
+@pytest.fixture
+def dashboard():
+    """Dashboard loaded from the small sample files, learning merchants in memory only"""
+    dashboard = FinanceDashboard(merchant_store=MerchantCategoryStore(path=None))
+    result = dashboard.load_files({
+        'transactions': io.StringIO(TRANSACTIONS_CSV),
+        'net_worth': io.StringIO(NET_WORTH_CSV),
+        'investments': io.StringIO(INVESTMENTS_CSV),
+    })
+    assert result, result.error
+    return dashboard
@@ -0,0 +1,50 @@
+import io
+
+from conftest import TRANSACTIONS_CSV
+
+
+def test_reappending_loaded_rows_adds_nothing(dashboard):
+    categorized = dashboard.categorize_transactions()
+    cube = dashboard.build_aggregate_cube()
+
+    result = dashboard.append_files({'transactions': io.StringIO(TRANSACTIONS_CSV)})
+
+    assert result, result.error
+    assert result.stats['received'] == 10
+    assert result.stats['added'] == 0
+    assert result.stats['duplicates'] == 10
+    assert len(dashboard.transactions_df) == 10
+    assert dashboard.categorize_transactions() is categorized
+    assert dashboard.build_aggregate_cube() is cube
+
+
+def test_append_adds_only_new_rows(dashboard):
+    statement = "\n".join(TRANSACTIONS_CSV.splitlines()[-2:] + ["2024-01-11,Target Store,-54.20,expense"])
+    header = TRANSACTIONS_CSV.splitlines()[0]
+
+    result = dashboard.append_files({'transactions': io.StringIO(f"{header}\n{statement}\n")})
+
+    assert result, result.error
+    assert result.stats['added'] == 1
+    assert result.stats['duplicates'] == 2
+    assert len(dashboard.categorize_transactions()) == 11
+    assert dashboard.categorize_transactions()['Description'].iloc[-1] == 'Target Store'
+    assert dashboard.build_aggregate_cube()['Amount'].sum() == dashboard.transactions_df['Amount'].sum()
+
+
+def test_net_worth_only_append_keeps_transaction_results(dashboard):
+    categorized = dashboard.categorize_transactions()
+
+    result = dashboard.append_files({'net_worth': io.StringIO("Date,Assets,Liabilities\n2024-03-31,91250.80,31750.25\n")})
+
+    assert result, result.error
+    assert len(dashboard.net_worth_df) == 3
+    assert dashboard.categorize_transactions() is categorized
+
+
+def test_append_reports_unreadable_statement(dashboard):
+    result = dashboard.append_files({'transactions': io.StringIO("Date,Amount\nnot a date,x\n")})
+
+    assert not result
+    assert result.error.startswith("Error appending statements")
+    assert len(dashboard.transactions_df) == 10
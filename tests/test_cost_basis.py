@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from finance_engine import COST_BASIS_METHODS, FinanceDashboard, cost_basis
+
+
+def lot_by_lot(trades: pd.DataFrame, method: str):
+    """Open lots and per-symbol totals from matching every sell against lots one at a time"""
+    trades = trades.assign(order=np.arange(len(trades))).sort_values(['Symbol', 'Date', 'order'])
+    lots, summary = [], {}
+    for symbol, symbol_trades in trades.groupby('Symbol', sort=True):
+        open_lots = []
+        proceeds = realized = 0.0
+        for date, shares, price in zip(symbol_trades['Date'], symbol_trades['Shares'], symbol_trades['Price']):
+            if shares > 0:
+                open_lots.append([shares, price, date])
+                if method == 'average':
+                    # One pooled lot at the average price, dated by the oldest share still held
+                    held = sum(lot[0] for lot in open_lots)
+                    average = sum(lot[0] * lot[1] for lot in open_lots) / held
+                    for lot in open_lots:
+                        lot[1] = average
+                continue
+            to_sell = min(-shares, sum(lot[0] for lot in open_lots))
+            proceeds += to_sell * price
+            while to_sell > 1e-12:
+                lot = open_lots[-1] if method == 'lifo' else open_lots[0]
+                used = min(lot[0], to_sell)
+                realized += used * (price - lot[1])
+                lot[0] -= used
+                to_sell -= used
+                if lot[0] <= 1e-12:
+                    open_lots.remove(lot)
+        held = sum(lot[0] for lot in open_lots)
+        basis = sum(lot[0] * lot[1] for lot in open_lots)
+        summary[symbol] = (held, basis, proceeds, realized)
+        lots.extend((symbol, shares, price, date) for shares, price, date in open_lots)
+    lots = pd.DataFrame(lots, columns=['Symbol', 'Shares', 'Purchase_Price', 'Purchase_Date'])
+    summary = pd.DataFrame.from_dict(summary, orient='index', columns=['Shares', 'Cost_Basis', 'Proceeds', 'Realized_Gain'])
+    return lots, summary
+
+
+def random_trades(n_trades: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Date': pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 200, n_trades), unit='D'),
+        'Symbol': rng.choice(['AAA', 'BBB', 'CCC', 'DDD'], n_trades),
+        'Shares': np.where(rng.random(n_trades) < 0.4, -1, 1) * rng.integers(1, 50, n_trades).astype(float),
+        'Price': np.round(rng.uniform(10, 200, n_trades), 2),
+    })
+
+
+def assert_matches_reference(trades: pd.DataFrame, method: str):
+    basis = cost_basis(trades, method)
+    lots, summary = lot_by_lot(trades, method)
+
+    engine_summary = basis.summary.set_index('Symbol').loc[summary.index]
+    for column in summary.columns:
+        np.testing.assert_allclose(engine_summary[column], summary[column], rtol=1e-9, atol=1e-6, err_msg=column)
+    engine_lots = basis.lots.sort_values(['Symbol', 'Purchase_Date', 'Shares'], ignore_index=True)
+    lots = lots.sort_values(['Symbol', 'Purchase_Date', 'Shares'], ignore_index=True)
+    if method == 'average':
+        # Average cost keeps the FIFO lots, each priced at the average
+        engine_lots = engine_lots.groupby('Symbol')[['Shares']].sum()
+        lots = lots.groupby('Symbol')[['Shares']].sum()
+    else:
+        assert list(engine_lots['Symbol']) == list(lots['Symbol'])
+        np.testing.assert_array_equal(engine_lots['Purchase_Date'], lots['Purchase_Date'])
+        np.testing.assert_allclose(engine_lots['Purchase_Price'], lots['Purchase_Price'])
+    np.testing.assert_allclose(engine_lots['Shares'], lots['Shares'], atol=1e-9)
+
+
+@pytest.mark.parametrize('method', COST_BASIS_METHODS)
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_lot_by_lot_reference(method, seed):
+    assert_matches_reference(random_trades(300, seed), method)
+
+
+@pytest.mark.parametrize('method', COST_BASIS_METHODS)
+def test_sells_beyond_the_position_are_cut_back(method):
+    trades = pd.DataFrame({
+        'Date': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']),
+        'Symbol': 'AAA',
+        'Shares': [-5.0, 10.0, -15.0, 4.0],
+        'Price': [90.0, 100.0, 110.0, 120.0],
+    })
+    assert_matches_reference(trades, method)
+    summary = cost_basis(trades, method).summary.iloc[0]
+    assert summary['Shares'] == 4
+    assert summary['Proceeds'] == 1100
+
+
+def test_average_cost_survives_many_holding_cycles():
+    # One buy, then selling half and buying it back again, 1500 times
+    n_cycles = 1500
+    shares = [100.0] + [-50.0, 50.0] * n_cycles
+    prices = [100.0] + list(np.repeat(np.linspace(90, 130, n_cycles), 2))
+    trades = pd.DataFrame({
+        'Date': pd.Timestamp('2020-01-01') + pd.to_timedelta(np.arange(len(shares)), unit='D'),
+        'Symbol': 'AAA',
+        'Shares': shares,
+        'Price': prices,
+    })
+
+    summary = cost_basis(trades, 'average').summary.iloc[0]
+
+    assert np.isfinite(summary['Cost_Basis']) and np.isfinite(summary['Realized_Gain'])
+    assert_matches_reference(trades, 'average')
+
+
+@pytest.mark.parametrize('method', COST_BASIS_METHODS)
+def test_empty_trade_log(method):
+    trades = pd.DataFrame({'Date': pd.to_datetime([None]), 'Symbol': ['AAA'], 'Shares': [np.nan], 'Price': [10.0]})
+
+    basis = cost_basis(trades, method)
+
+    assert basis.lots.empty and basis.summary.empty and basis.cash_flows.empty
+    assert list(basis.summary.columns) == ['Symbol', 'Shares', 'Cost_Basis', 'Average_Cost', 'Proceeds',
+                                           'Realized_Gain', 'Trades']
+
+    dashboard = FinanceDashboard()
+    dashboard.trades_df = trades.iloc[:0]
+    valuation = dashboard.portfolio_valuation(method=method)
+    assert valuation['portfolio'].empty
@@ -0,0 +1,72 @@
+import io
+import json
+import threading
+
+import pandas as pd
+
+import finance_engine
+from conftest import TRANSACTIONS_CSV
+from finance_engine import FinanceDashboard, MerchantCategoryStore
+
+
+def count_writes(monkeypatch):
+    writes = []
+    write_json_atomic = finance_engine.write_json_atomic
+
+    def counting(path, data):
+        writes.append(path)
+        write_json_atomic(path, data)
+
+    monkeypatch.setattr(finance_engine, 'write_json_atomic', counting)
+    return writes
+
+
+def test_streaming_load_saves_once(tmp_path, monkeypatch):
+    writes = count_writes(monkeypatch)
+    path = str(tmp_path / 'merchants.json')
+    dashboard = FinanceDashboard(merchant_store=MerchantCategoryStore(path=path))
+
+    dashboard._stream_transactions(io.StringIO(TRANSACTIONS_CSV), chunksize=3)
+
+    assert writes == [path]
+    with open(path, encoding='utf-8') as f:
+        assert 'starbucks coffee' in json.load(f)['merchants']
+
+
+def test_unchanged_store_is_not_rewritten(tmp_path, monkeypatch):
+    path = str(tmp_path / 'merchants.json')
+    first = FinanceDashboard(merchant_store=MerchantCategoryStore(path=path))
+    assert first.load_files({'transactions': io.StringIO(TRANSACTIONS_CSV)})
+
+    writes = count_writes(monkeypatch)
+    second = FinanceDashboard(merchant_store=MerchantCategoryStore(path=path))
+    assert second.load_files({'transactions': io.StringIO(TRANSACTIONS_CSV)})
+
+    assert writes == []
+    assert len(second.merchant_store) == 10
+    assert list(tmp_path.iterdir()) == [tmp_path / 'merchants.json']
+
+
+def test_categorize_while_other_sessions_learn():
+    store = MerchantCategoryStore(path=None)
+    known = pd.Series([f"Known Merchant {i}" for i in range(2000)])
+    store.categorize(known)
+    errors = []
+
+    def learn(offset):
+        try:
+            for start in range(0, 10_000, 500):
+                store.categorize(pd.Series([f"Shop {offset} {i}" for i in range(start, start + 500)]))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=learn, args=(n,)) for n in range(3)]
+    for thread in threads:
+        thread.start()
+    for _ in range(50):
+        assert len(store.categorize(known)) == len(known)
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(store) == 2000 + 3 * 10_000
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from finance_engine import PriceHistoryStore, portfolio_value_series
+
+
+def flat_store(directory, priced_from):
+    """Closes of 10 from each symbol's first priced day to day 19"""
+    days = pd.date_range('2024-01-01', periods=20, freq='D')
+    rows = [(day, symbol, 10.0) for symbol, first in priced_from.items() for day in days[first:]]
+    prices = pd.DataFrame(rows, columns=['Date', 'Symbol', 'Close'])
+    return PriceHistoryStore.build(prices, str(directory)), days
+
+
+def test_buy_before_first_close_waits_for_it(tmp_path):
+    store, days = flat_store(tmp_path, {'A': 0, 'B': 10})
+    positions = pd.DataFrame({
+        'Symbol': ['A', 'B'],
+        'Date': [days[0], days[4]],
+        'Shares': [10.0, 10.0],
+        'Invested': [100.0, 100.0],
+    })
+    series = portfolio_value_series(positions, store, np.datetime64(days[0], 'D'), np.datetime64(days[-1], 'D'))
+
+    # Flat prices earn nothing, and B's cost only counts once it can be valued
+    assert np.allclose(series['Growth'], 1.0)
+    assert series['Cost'].tolist() == [100.0] * 10 + [200.0] * 10
+    assert series['Value'].tolist() == series['Cost'].tolist()
+
+
+def test_symbol_never_priced_in_range_is_left_out(tmp_path):
+    store, days = flat_store(tmp_path, {'A': 0, 'B': 15})
+    positions = pd.DataFrame({
+        'Symbol': ['A', 'B'],
+        'Date': [days[0], days[2]],
+        'Shares': [10.0, 10.0],
+        'Invested': [100.0, 100.0],
+    })
+    series = portfolio_value_series(positions, store, np.datetime64(days[0], 'D'), np.datetime64(days[9], 'D'))
+
+    assert np.allclose(series['Growth'], 1.0)
+    assert (series['Cost'] == 100.0).all()
+
+
+def test_valuation_is_recomputed_on_a_new_day(dashboard, monkeypatch):
+    import finance_engine
+
+    class Day(finance_engine.datetime):
+        current = finance_engine.datetime(2025, 1, 2)
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.current
+
+    monkeypatch.setattr(finance_engine, 'datetime', Day)
+    quotes = {'AAPL': 200.0, 'SPY': 500.0}
+    monkeypatch.setattr(dashboard, 'get_investment_prices', lambda provider=None, method='fifo': quotes)
+
+    first = dashboard.portfolio_valuation()
+    assert dashboard.portfolio_valuation() is first
+    Day.current = finance_engine.datetime(2026, 1, 2)
+    later = dashboard.portfolio_valuation()
+    assert later is not first
+    assert later['xirr'] != first['xirr']
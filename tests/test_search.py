@@ -0,0 +1,68 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import finance_engine
+from conftest import TRANSACTIONS_CSV
+from finance_engine import SEARCH_TOKEN_PATTERN, DescriptionSearchIndex
+
+QUERIES = ['a', 'ab', 'abc', 'abcd', 'a*', 'ab*', 'abcd*', 'j', '0', '01 a', 'a.b', 'ab.c', '.', 'é', 'café',
+           'uber*', 'amazon.com', 'ref1', '7-el', '7-el*', 'eleven', 'cab bad', 'abab', 'xyz', 'de fl', '', '*',
+           '3 2 1', 'hij', '#a', 'aaaa*']
+
+
+def scan(texts: pd.Series, query: str):
+    """Row mask of the search semantics, computed by scanning every description"""
+    matched = None
+    for term in query.lower().split():
+        if term.endswith('*') or len(term) < 3:
+            hits = [texts.str.contains(f"(?:^|[^a-z0-9]){word}").to_numpy(dtype=bool)
+                    for word in SEARCH_TOKEN_PATTERN.findall(term)]
+        else:
+            hits = [texts.str.contains(term, regex=False).to_numpy(dtype=bool)]
+        for term_hits in hits:
+            matched = term_hits if matched is None else matched & term_hits
+    return matched
+
+
+@pytest.fixture(scope='module')
+def descriptions():
+    rng = np.random.default_rng(1)
+    alphabet = list('abcdefghij0123 .-*#é')
+    generated = [''.join(rng.choice(alphabet, rng.integers(0, 14))) for _ in range(5000)]
+    named = ['', 'Amazon.com REF12', 'UBER *TRIP', 'Café de Flore', '7-ELEVEN', None]
+    return pd.Series(generated + named * 3, dtype='str')
+
+
+@pytest.mark.parametrize('arrow', [True, False])
+def test_index_matches_a_full_scan(descriptions, arrow, monkeypatch):
+    if not arrow:
+        monkeypatch.setattr(finance_engine, 'pa', None)
+    index = DescriptionSearchIndex(descriptions)
+    texts = descriptions.str.lower().fillna('')
+
+    for query in QUERIES:
+        expected = scan(texts, query)
+        mask = index.search(query)
+        if expected is None:
+            assert mask is None, query
+        else:
+            np.testing.assert_array_equal(mask, expected & descriptions.notna().to_numpy(), err_msg=query)
+
+
+def test_words_do_not_run_across_descriptions():
+    index = DescriptionSearchIndex(pd.Series(['shop ab', 'cd shop', 'abcd']))
+
+    np.testing.assert_array_equal(index.search('abcd'), [False, False, True])
+    np.testing.assert_array_equal(index.search('cd*'), [False, True, False])
+
+
+def test_index_is_built_with_the_load(dashboard):
+    assert 'search_index' in dashboard.load_timings
+    assert dashboard._derived.get('search_index') is dashboard.search_index()
+    np.testing.assert_array_equal(
+        np.flatnonzero(dashboard.search_index().search('uber*')),
+        np.flatnonzero(pd.read_csv(io.StringIO(TRANSACTIONS_CSV))['Description'].str.startswith('Uber'))
+    )
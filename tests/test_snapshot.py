@@ -0,0 +1,55 @@
+import io
+import json
+import zipfile
+
+import pandas as pd
+import pytest
+
+from finance_engine import SNAPSHOT_MANIFEST, SNAPSHOT_VERSION, FinanceDashboard, MerchantCategoryStore
+
+pytest.importorskip('pyarrow')
+
+
+def test_snapshot_round_trip(dashboard):
+    snapshot = dashboard.export_snapshot()
+
+    restored = FinanceDashboard(merchant_store=MerchantCategoryStore(path=None))
+    result = restored.load_from_zip(io.BytesIO(snapshot))
+
+    assert result, result.error
+    assert result.snapshot
+    assert result.rows == {'transactions': 10, 'net_worth': 2, 'investments': 2}
+    pd.testing.assert_frame_equal(
+        restored.categorize_transactions(), dashboard.categorize_transactions(), check_categorical=False
+    )
+    pd.testing.assert_frame_equal(restored.calculate_monthly_summary(), dashboard.calculate_monthly_summary())
+    pd.testing.assert_series_equal(restored.calculate_category_totals(), dashboard.calculate_category_totals())
+    pd.testing.assert_frame_equal(restored.investments_df, dashboard.investments_df)
+
+
+def rewrite_manifest(snapshot: bytes, **changes) -> bytes:
+    """Copy of a snapshot with manifest fields replaced"""
+    source = zipfile.ZipFile(io.BytesIO(snapshot))
+    manifest = json.loads(source.read(SNAPSHOT_MANIFEST))
+    manifest.update(changes)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as target:
+        for name in source.namelist():
+            data = json.dumps(manifest) if name == SNAPSHOT_MANIFEST else source.read(name)
+            target.writestr(name, data)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('changes, message', [
+    ({'format': 'other-tool'}, "does not describe a fpti-snapshot file"),
+    ({'version': SNAPSHOT_VERSION + 1}, f"Snapshot version {SNAPSHOT_VERSION + 1} is not supported"),
+    ({'tables': ['transactions', 'budgets']}, "Snapshot is missing tables: budgets"),
+])
+def test_snapshot_manifest_mismatch_is_reported(dashboard, changes, message):
+    restored = FinanceDashboard(merchant_store=MerchantCategoryStore(path=None))
+
+    result = restored.load_from_zip(io.BytesIO(rewrite_manifest(dashboard.export_snapshot(), **changes)))
+
+    assert not result
+    assert message in result.error
+    assert restored.transactions_df is None
@@ -0,0 +1,51 @@
+import numpy as np
+
+from finance_engine import xirr
+
+
+def brute_force_rate(amounts, dates, low=-0.99, high=1e6):
+    """Root of the net present value found by plain bisection"""
+    years = (np.asarray(dates, dtype='datetime64[D]') - np.datetime64(min(dates), 'D')).astype(float) / 365.0
+
+    def npv(rate):
+        return np.sum(np.asarray(amounts) * (1 + rate) ** -years)
+
+    for _ in range(200):
+        middle = (low + high) / 2
+        if np.sign(npv(middle)) == np.sign(npv(low)):
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def test_one_year_gain():
+    rate = xirr(np.array([-100.0, 110.0]), np.array(['2023-01-01', '2024-01-01'], dtype='datetime64[D]'),
+                np.array([0, 0]), 1)
+    assert abs(rate[0] - 0.10) < 1e-6
+
+
+def test_groups_match_brute_force():
+    rng = np.random.default_rng(7)
+    amounts, dates, groups, expected = [], [], [], []
+    for group in range(40):
+        n = rng.integers(2, 8)
+        flow_dates = np.datetime64('2020-01-01') + np.sort(rng.integers(0, 1500, n))
+        flows = -rng.uniform(100, 1000, n)
+        flows[-1] = rng.uniform(0.3, 3.0) * -flows[:-1].sum()
+        amounts.extend(flows)
+        dates.extend(flow_dates)
+        groups.extend([group] * n)
+        expected.append(brute_force_rate(flows, flow_dates))
+
+    rates = xirr(np.array(amounts), np.array(dates, dtype='datetime64[D]'), np.array(groups), 40)
+
+    np.testing.assert_allclose(rates, expected, rtol=1e-6, atol=1e-6)
+
+
+def test_groups_without_money_back_have_no_rate():
+    rates = xirr(np.array([-100.0, -50.0, -100.0, 120.0]),
+                 np.array(['2023-01-01', '2023-06-01', '2023-01-01', '2024-01-01'], dtype='datetime64[D]'),
+                 np.array([0, 0, 1, 1]), 2)
+    assert np.isnan(rates[0])
+    assert abs(rates[1] - 0.20) < 1e-6